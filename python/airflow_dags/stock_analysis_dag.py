@@ -6,6 +6,7 @@ from airflow.sensors.filesystem import FileSensor
 from airflow.models import Variable
 import sys
 import os
+import zlib
 
 dag_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(dag_dir)
@@ -83,7 +84,7 @@ def analyze_technical_indicators(**context):
         import numpy as np
         
         dates = pd.date_range(start=datetime.now() - timedelta(days=30), end=datetime.now(), freq='D')
-        np.random.seed(hash(symbol) % 2**32)
+        np.random.seed(zlib.crc32(symbol.encode('utf-8')))
         
         historical_data = pd.DataFrame({
             'date': dates,
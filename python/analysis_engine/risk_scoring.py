@@ -0,0 +1,41 @@
+import numpy as np
+from typing import Tuple
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+HIGH_VOLUME_THRESHOLD = 1000000.0
+LONG_HISTORY_ROWS = 100
+
+@njit(cache=True)
+def risk_and_confidence(close: np.ndarray, volume: np.ndarray, n_rows: int,
+                        n_anomalies: int, regime_confidence: float) -> Tuple[float, float]:
+    risk = 0.1 + min(0.4, 0.1 * n_anomalies)
+    if close.shape[0] > 2:
+        returns = np.diff(close) / close[:-1]
+        returns = returns[~np.isnan(returns)]
+        count = returns.shape[0]
+        if count > 1:
+            volatility = np.std(returns) * np.sqrt(count / (count - 1.0))
+            if np.isfinite(volatility):
+                risk += min(0.3, volatility * 10.0)
+
+    confidence = 0.5
+    if regime_confidence > 0.7:
+        confidence += 0.2
+    if n_rows > LONG_HISTORY_ROWS:
+        confidence += 0.2
+    if volume.shape[0] > 0:
+        valid_volume = volume[~np.isnan(volume)]
+        if valid_volume.shape[0] > 0 and valid_volume.mean() > HIGH_VOLUME_THRESHOLD:
+            confidence += 0.1
+
+    return min(1.0, risk), min(1.0, confidence)
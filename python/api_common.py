@@ -1,11 +1,27 @@
+import asyncio
+import json
+import math
+import os
+import time
 from fastapi import WebSocket
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from datetime import datetime
 from config.logging_config import get_logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+WEBSOCKET_SEND_QUEUE_SIZE = 100
+CONNECTION_STATS_CACHE_TTL = 1.0
+DEFAULT_CORS_ORIGINS = 'http://localhost:8080'
+
 class StockDataResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
     
@@ -45,6 +61,8 @@ class TechnicalAnalysisResponse(BaseModel):
     timestamp: datetime = Field(..., description="분석 시간")
 
 class AdvancedAnalysisResponse(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    
     symbol: str = Field(..., description="주식 심볼")
     currentPrice: float = Field(..., description="현재 가격", alias="current_price")
     volume: int = Field(..., description="거래량")
@@ -109,82 +127,127 @@ class PerformanceMetrics(BaseModel):
     queue_size: int
     memory_usage: float
     cpu_usage: float
+    analysis_cache_hit_rate: float = 0.0
+    news_cache_hit_rate: float = 0.0
+
+class ConnectionState:
+    __slots__ = ('queue', 'task', 'client_ip', 'connected_at', 'last_activity', 'message_count')
+
+    def __init__(self, queue: asyncio.Queue, client_ip: str, connected_at: float):
+        self.queue = queue
+        self.task: Optional[asyncio.Task] = None
+        self.client_ip = client_ip
+        self.connected_at = connected_at
+        self.last_activity = connected_at
+        self.message_count = 0
 
 class ConnectionManager:
+    __slots__ = ('connections', 'enable_metadata', 'total_messages', 'connected_at_sum', 'stats_json', 'stats_json_expires')
+
     def __init__(self, enable_metadata: bool = False):
-        self.active_connections: List[WebSocket] = []
+        self.connections: Dict[WebSocket, ConnectionState] = {}
         self.enable_metadata = enable_metadata
-        if enable_metadata:
-            self.connection_metadata: Dict[WebSocket, Dict] = {}
-            self.rate_limits: Dict[str, float] = {}
+        self.total_messages = 0
+        self.connected_at_sum = 0.0
+        self.stats_json = ""
+        self.stats_json_expires = 0.0
         
     async def connect(self, websocket: WebSocket, client_ip: str = "unknown") -> None:
         await websocket.accept()
-        self.active_connections.append(websocket)
+        connected_at = time.monotonic() if self.enable_metadata else 0.0
+        state = ConnectionState(asyncio.Queue(maxsize=WEBSOCKET_SEND_QUEUE_SIZE), client_ip, connected_at)
+        self.connections[websocket] = state
+        state.task = asyncio.create_task(self._drain_send_queue(websocket, state.queue))
         
         if self.enable_metadata:
-            self.connection_metadata[websocket] = {
-                'client_ip': client_ip,
-                'connected_at': datetime.utcnow(),
-                'last_activity': datetime.utcnow(),
-                'message_count': 0
-            }
+            self.connected_at_sum += connected_at
             logger.info("WebSocket 연결 수립됨", client_ip=client_ip, component="ConnectionManager")
         
     def disconnect(self, websocket: WebSocket) -> None:
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        state = self.connections.pop(websocket, None)
+        if state is None:
+            return
+        if state.task is not None:
+            state.task.cancel()
         
-        if self.enable_metadata and websocket in self.connection_metadata:
-            metadata = self.connection_metadata.pop(websocket)
-            logger.info("WebSocket 연결 종료됨", client_ip=metadata.get('client_ip'), component="ConnectionManager")
+        if self.enable_metadata:
+            self.total_messages -= state.message_count
+            self.connected_at_sum = self.connected_at_sum - state.connected_at if self.connections else 0.0
+            logger.info("WebSocket 연결 종료됨", client_ip=state.client_ip, component="ConnectionManager")
     
     async def send_personal_message(self, message: str, websocket: WebSocket) -> None:
         try:
             await websocket.send_text(message)
-            if self.enable_metadata and websocket in self.connection_metadata:
-                self.connection_metadata[websocket]['last_activity'] = datetime.utcnow()
-                self.connection_metadata[websocket]['message_count'] += 1
+            if self.enable_metadata:
+                state = self.connections.get(websocket)
+                if state is not None:
+                    state.last_activity = time.monotonic()
+                    state.message_count += 1
+                    self.total_messages += 1
         except Exception as e:
             logger.error("WebSocket 메시지 전송 오류", exception=e, component="ConnectionManager")
             self.disconnect(websocket)
     
+    async def _drain_send_queue(self, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        try:
+            while True:
+                message = await queue.get()
+                if isinstance(message, bytes):
+                    await websocket.send_bytes(message)
+                else:
+                    await websocket.send_text(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("WebSocket 브로드캐스트 전송 오류", exception=e, component="ConnectionManager")
+            state = self.connections.get(websocket)
+            if state is not None:
+                state.task = None
+            self.disconnect(websocket)
+    
+    def _enqueue_all(self, message: Union[str, bytes]) -> None:
+        for state in self.connections.values():
+            queue = state.queue
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(message)
+    
     async def broadcast(self, message: str) -> None:
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception:
-                disconnected.append(connection)
-        
-        for connection in disconnected:
-            self.disconnect(connection)
+        self._enqueue_all(message)
+    
+    async def broadcast_bytes(self, payload: bytes) -> None:
+        self._enqueue_all(payload)
     
     def get_connection_stats(self) -> Dict:
-        if not self.enable_metadata or not self.connection_metadata:
+        connection_count = len(self.connections)
+        if not self.enable_metadata or not connection_count:
             return {
-                'active_connections': len(self.active_connections),
+                'active_connections': connection_count,
                 'total_messages': 0,
                 'avg_connection_duration': 0.0
             }
         
-        total_duration = sum(
-            (datetime.utcnow() - meta['connected_at']).total_seconds()
-            for meta in self.connection_metadata.values()
-        )
-        
         return {
-            'active_connections': len(self.active_connections),
-            'total_messages': sum(meta['message_count'] for meta in self.connection_metadata.values()),
-            'avg_connection_duration': total_duration / len(self.connection_metadata) if self.connection_metadata else 0.0
+            'active_connections': connection_count,
+            'total_messages': self.total_messages,
+            'avg_connection_duration': time.monotonic() - self.connected_at_sum / connection_count
         }
+    
+    def get_connection_stats_json(self) -> str:
+        now = time.monotonic()
+        if now >= self.stats_json_expires:
+            self.stats_json = dumps_json(self.get_connection_stats())
+            self.stats_json_expires = now + CONNECTION_STATS_CACHE_TTL
+        return self.stats_json
 
 def create_cors_middleware_config() -> Dict:
+    origins = [origin.strip() for origin in os.getenv('CORS_ORIGINS', DEFAULT_CORS_ORIGINS).split(',') if origin.strip()]
     return {
-        'allow_origins': ["*"],
-        'allow_credentials': True,
-        'allow_methods': ["*"],
+        'allow_origins': origins,
+        'allow_credentials': '*' not in origins,
+        'allow_methods': ["GET", "POST", "OPTIONS"],
         'allow_headers': ["*"],
+        'max_age': 86400,
     }
 
 def format_timestamp(timestamp) -> datetime:
@@ -208,4 +271,44 @@ def safe_float(value, default=None):
     except (ValueError, TypeError):
         return default
 
+def json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    tolist = getattr(value, 'tolist', None)
+    if callable(tolist):
+        return tolist()
+    return str(value)
+
+def json_key(key):
+    if key is None or isinstance(key, (str, int, float, bool)):
+        return key
+    return json_default(key)
+
+def json_compatible(value):
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {json_key(key): json_compatible(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_compatible(item) for item in value]
+    return value
+
+def encode_json(payload) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            payload,
+            default=json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(
+        json_compatible(payload),
+        default=lambda value: json_compatible(json_default(value)),
+        allow_nan=False
+    ).encode('utf-8')
+
+def dumps_json(payload) -> str:
+    return encode_json(payload).decode('utf-8')
 
+class StockJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        return encode_json(content)
@@ -2,22 +2,34 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Quer
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request as StarletteRequest
-from typing import Protocol, TypedDict, List, Dict, Optional, Union, Any
+from typing import Protocol, TypedDict, List, Dict, Optional, Union, Any, Tuple
 import asyncio
-import json
+import builtins
+import aiohttp
+import anyio.to_thread
+import hashlib
 import os
+import pickle
 import sys
 import smtplib
+import threading
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import uvicorn
 import time
+import zlib
+from collections import OrderedDict
+from itertools import islice
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from functools import lru_cache, wraps
+from urllib.parse import unquote
 
 from api_common import (
     StockDataResponse,
@@ -34,11 +46,19 @@ from api_common import (
     SmsNotificationRequest,
     SmsNotificationResponse,
     format_timestamp,
-    safe_float
+    safe_float,
+    dumps_json,
+    encode_json,
+    StockJSONResponse
 )
 from utils.data_formatter import DataFormatter
 from utils.retry_handler import RetryHandler
 from utils.notification_logger import NotificationLogger
+from utils.response_cache import ResponseCache, cached_endpoint
+from utils.single_flight import SingleFlight
+from utils.compression_stats import CompressionStatsMiddleware, UncompressedSizeMiddleware, compression_stats
+from utils.redis_cache import RedisResponseCache, make_cache_key
+from utils.rate_limiter import FixedWindowRateLimiter
 from exceptions import (
     StockAnalysisBaseException,
     StockDataCollectionError,
@@ -56,22 +76,29 @@ from exceptions import (
     EmailNotificationError,
     SMSNotificationError,
     ConfigurationError,
-    WebSocketError,
     WebSocketConnectionError
 )
 
 from data_collectors.performance_optimized_collector import PerformanceOptimizedCollector
 from data_collectors.stock_data_collector import StockDataCollector
-from data_collectors.news_collector import NewsCollector
+from data_collectors.news_collector import NewsCollector, NewsLanguage
 from analysis_engine.advanced_analyzer import AdvancedTechnicalAnalyzer
 from analysis_engine.technical_analyzer import TechnicalAnalyzer
+from analysis_engine.risk_scoring import risk_and_confidence
 from notification.notification_service import NotificationService
+from notification.email_queue import EmailQueue
 from security.security_manager import SecurityManager, SecurityConfig
-from error_handling.error_manager import ErrorManager, ErrorSeverity, ErrorCategory, error_handler, ErrorContext
+from error_handling.error_manager import ErrorManager, ErrorSeverity, ErrorCategory, error_handler, ErrorContext, new_error_id
 from config.settings import get_settings
 from config.logging_config import get_logger, setup_logging
 import re
 
+try:
+    from brotli_asgi import BrotliMiddleware
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 try:
     import pymysql
     PYMYSQL_AVAILABLE = True
@@ -177,6 +204,10 @@ async def lifespan(app: FastAPI):
             pass
     
     logger.info("애플리케이션 시작: 서비스 초기화 중", service="api_server")
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=BLOCKING_IO_THREADS, thread_name_prefix="blocking-io")
+    )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = BLOCKING_IO_THREADS
     try:
         app.state.data_collector = PerformanceOptimizedCollector(
             symbols=settings.ANALYSIS_SYMBOLS,
@@ -193,6 +224,7 @@ async def lifespan(app: FastAPI):
         
         app.state.analyzer = AdvancedTechnicalAnalyzer()
         app.state.basic_analyzer = TechnicalAnalyzer()
+        app.state.news_collector = NewsCollector()
         
         email_config = {
             'smtp_server': settings.EMAIL_SMTP_SERVER,
@@ -219,6 +251,47 @@ async def lifespan(app: FastAPI):
         app.state.security_manager = SecurityManager(security_config)
         
         app.state.error_manager = ErrorManager()
+        app.state.cpu_pool = (
+            ProcessPoolExecutor(max_workers=ANALYSIS_PROCESS_WORKERS)
+            if ANALYSIS_PROCESS_WORKERS > 0 else None
+        )
+        
+        app.state.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+        
+        app.state.redis_cache = await RedisResponseCache.connect(
+            settings.REDIS_HOST,
+            settings.REDIS_PORT,
+            settings.REDIS_DB
+        )
+        
+        NotificationLogger.init_pool()
+        NotificationLogger.start_background_writer()
+        
+        app.state.email_queue = EmailQueue(app.state.notification_service)
+        app.state.email_queue.start()
+        
+        await refresh_historical_cache(app.state.basic_analyzer)
+        app.state.historical_cache_task = asyncio.create_task(
+            refresh_historical_cache_loop(app.state.basic_analyzer)
+        )
+        
+        app.state.stock_api = StockAnalysisAPI(
+            data_collector=app.state.data_collector,
+            analyzer=app.state.analyzer,
+            security_manager=app.state.security_manager,
+            error_manager=app.state.error_manager,
+            news_collector=app.state.news_collector,
+            cpu_pool=app.state.cpu_pool
+        )
+        
+        app.state.realtime_wakeup = asyncio.Event()
+        app.state.realtime_pump_task = asyncio.create_task(realtime_pump_loop(
+            app.state.stock_api,
+            app.state.realtime_wakeup
+        ))
         
         async with app.state.data_collector:
             yield
@@ -234,8 +307,28 @@ async def lifespan(app: FastAPI):
         ) from e
     finally:
         logger.info("애플리케이션 종료: 정리 중")
+        if hasattr(app.state, 'historical_cache_task'):
+            app.state.historical_cache_task.cancel()
+        if hasattr(app.state, 'realtime_pump_task'):
+            app.state.realtime_pump_task.cancel()
         if hasattr(app.state, 'data_collector'):
             await app.state.data_collector.__aexit__(None, None, None)
+        if hasattr(app.state, 'http_session'):
+            await app.state.http_session.close()
+        if hasattr(app.state, 'redis_cache'):
+            await app.state.redis_cache.close()
+        if hasattr(app.state, 'news_collector'):
+            app.state.news_collector.session.close()
+        if hasattr(app.state, 'email_queue'):
+            await app.state.email_queue.stop()
+        if getattr(app.state, 'cpu_pool', None) is not None:
+            app.state.cpu_pool.shutdown(wait=False, cancel_futures=True)
+        await NotificationLogger.stop_background_writer()
+        NotificationLogger.close_pool()
+
+DefaultJSONResponse = StockJSONResponse
+COMPRESSION_MINIMUM_SIZE = 2048
+API_DOCS_ENABLED = os.getenv('API_DOCS_ENABLED', 'true').lower() == 'true'
 
 app = FastAPI(
     title="Enhanced Stock Analysis API",
@@ -249,6 +342,10 @@ app = FastAPI(
         "name": "Apache 2.0",
         "url": "https://www.apache.org/licenses/LICENSE-2.0"
     },
+    default_response_class=DefaultJSONResponse,
+    openapi_url="/openapi.json" if API_DOCS_ENABLED else None,
+    docs_url="/docs" if API_DOCS_ENABLED else None,
+    redoc_url="/redoc" if API_DOCS_ENABLED else None,
     lifespan=lifespan
 )
 
@@ -263,7 +360,12 @@ app.add_middleware(
     allowed_hosts=["localhost", "127.0.0.1", "*.stockanalysis.com"]
 )
 
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+app.add_middleware(UncompressedSizeMiddleware)
+if BROTLI_AVAILABLE:
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=COMPRESSION_MINIMUM_SIZE, gzip_fallback=True)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=COMPRESSION_MINIMUM_SIZE, compresslevel=4)
+app.add_middleware(CompressionStatsMiddleware)
 
 PUBLIC_PATHS = [
     "/api/auth/login",
@@ -282,6 +384,9 @@ PUBLIC_PATHS = [
 
 class AuthenticationMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: StarletteRequest, call_next):
+        if request.method == "OPTIONS":
+            return await call_next(request)
+        
         if request.url.path in PUBLIC_PATHS or any(request.url.path.startswith(path) for path in PUBLIC_PATHS):
             return await call_next(request)
         
@@ -301,7 +406,7 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
         if not token:
             login_url = "http://localhost:8080/admin-login.html"
             if is_9090_port:
-                return JSONResponse(
+                return DefaultJSONResponse(
                     status_code=401,
                     content={
                         "error": "인증이 필요합니다",
@@ -317,7 +422,7 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             if not payload:
                 login_url = "http://localhost:8080/admin-login.html"
                 if is_9090_port:
-                    return JSONResponse(
+                    return DefaultJSONResponse(
                         status_code=401,
                         content={
                             "error": "인증 토큰이 유효하지 않습니다",
@@ -332,6 +437,243 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
 app.add_middleware(AuthenticationMiddleware)
 
 manager = ConnectionManager(enable_metadata=True)
+realtime_manager = ConnectionManager(enable_metadata=True)
+
+HISTORICAL_CACHE_TTL = 3600
+HISTORICAL_PERIODS = 61
+HISTORICAL_CACHE_REFRESH_INTERVAL = 300
+ANALYZED_CACHE_MAX_SIZE = 256
+BASIC_ANALYSIS_CACHE_TTL = 60
+BASIC_ANALYSIS_CACHE_MAX_SIZE = 256
+ADVANCED_ANALYSIS_CACHE_TTL = 5
+ADVANCED_COMPONENTS_CACHE_TTL = 120
+ADVANCED_ANALYSIS_CACHE_MAX_SIZE = 256
+ALL_SYMBOLS_ANALYSIS_CONCURRENCY = 5
+BATCH_ANALYSIS_CONCURRENCY = 4
+CHART_NUMERIC_COLUMNS = ['close', 'rsi', 'macd', 'bb_upper', 'bb_lower', 'sma_20']
+CHART_COLUMNS = ['date', 'close', 'volume', 'rsi', 'macd', 'bb_upper', 'bb_lower', 'sma_20']
+CHART_DATE_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+RAW_MARKET_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+LATEST_INDICATOR_COLUMNS = {'rsi': 'rsi_14', 'macd': 'macd', 'macdSignal': 'macd_signal'}
+NEWS_CACHE_TTL = int(os.getenv('NEWS_CACHE_TTL', '300'))
+NEWS_CACHE_MAX_SIZE = 512
+NEWS_SEARCH_CACHE_TTL = int(os.getenv('NEWS_SEARCH_CACHE_TTL', '120'))
+NEWS_DETAIL_CACHE_TTL = int(os.getenv('NEWS_DETAIL_CACHE_TTL', '21600'))
+NEWS_DETAIL_LOCAL_CACHE_TTL = 3600
+NEWS_DETAIL_LOCAL_CACHE_MAX_SIZE = int(os.getenv('NEWS_DETAIL_LOCAL_CACHE_MAX_SIZE', '2000'))
+CACHE_STATUS_HEADER = 'X-Cache'
+NEWS_SEARCH_RATE_LIMIT = int(os.getenv('NEWS_SEARCH_RATE_LIMIT', '120'))
+NEWS_MULTIPLE_RATE_LIMIT = int(os.getenv('NEWS_MULTIPLE_RATE_LIMIT', '30'))
+RATE_LIMIT_WINDOW = 60
+NEWS_DETAIL_TIMEOUT_DETAIL = "뉴스 상세 조회 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
+RATE_LIMITED_RESPONSE = {"description": "요청 한도를 초과했습니다.", "model": ErrorResponse}
+SERVER_ERROR_RESPONSE = {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse}
+BAD_REQUEST_RESPONSE = {"description": "잘못된 요청입니다.", "model": ErrorResponse}
+STOCK_NOT_FOUND_RESPONSE = {"description": "해당 종목의 데이터를 찾을 수 없습니다.", "model": ErrorResponse}
+TECHNICAL_ANALYSIS_LIST_ADAPTER = TypeAdapter(List[TechnicalAnalysisResponse])
+NEWS_RESPONSE_FIELDS = tuple(NewsResponse.model_fields)
+STOCK_DATA_RESPONSE_ALIASES = {name: field.alias or name for name, field in StockDataResponse.model_fields.items()}
+ADVANCED_ANALYSIS_RESPONSE_ALIASES = {name: field.alias or name for name, field in AdvancedAnalysisResponse.model_fields.items()}
+NEWS_FETCH_CONCURRENCY = 4
+MAX_SYMBOLS_PER_REQUEST = 10
+PARSED_SYMBOLS_CACHE_SIZE = 4096
+MAX_SYMBOLS_QUERY_LENGTH = MAX_SYMBOLS_PER_REQUEST * 16
+REALTIME_PUSH_INTERVAL = 5
+CONFIDENCE_DECAY_NS = 5_000_000_000
+REALTIME_NOT_READY_MESSAGE = dumps_json({"error": "서비스 초기화 중입니다"})
+PHONE_NUMBER_RE = re.compile(r'^010\d{8}$')
+SYMBOL_RE = re.compile(r'[^,]*[^,\s][^,]*')
+PHONE_NUMBER_STRIP_TABLE = str.maketrans('', '', '- ')
+BLOCKING_IO_THREADS = int(os.getenv('BLOCKING_IO_THREADS', '64'))
+ANALYSIS_PROCESS_WORKERS = int(os.getenv('ANALYSIS_PROCESS_WORKERS', '0'))
+
+@lru_cache(maxsize=128)
+def _build_historical_data(symbol: str, time_bucket: int) -> pd.DataFrame:
+    dates = pd.date_range(end=datetime.now(), periods=HISTORICAL_PERIODS, freq='D')
+    seed = zlib.crc32(symbol.encode('utf-8'))
+    rng = np.random.default_rng(seed)
+    
+    base_price = 100 + seed % 200
+    prices = base_price + np.cumsum(rng.standard_normal(HISTORICAL_PERIODS) * 2)
+    
+    return pd.DataFrame({
+        'date': dates,
+        'close': prices,
+        'volume': rng.integers(1000000, 5000000, HISTORICAL_PERIODS, dtype=np.int64)
+    })
+
+_analyzed_data_cache: 'OrderedDict[tuple, pd.DataFrame]' = OrderedDict()
+_analyzed_data_lock = threading.Lock()
+analysis_flights = SingleFlight()
+news_cache = ResponseCache(maxsize=NEWS_CACHE_MAX_SIZE)
+news_detail_cache = ResponseCache(maxsize=NEWS_DETAIL_LOCAL_CACHE_MAX_SIZE)
+basic_analysis_cache = ResponseCache(maxsize=BASIC_ANALYSIS_CACHE_MAX_SIZE)
+advanced_analysis_cache = ResponseCache(maxsize=ADVANCED_ANALYSIS_CACHE_MAX_SIZE)
+advanced_components_cache = ResponseCache(maxsize=ADVANCED_ANALYSIS_CACHE_MAX_SIZE)
+news_search_limiter = FixedWindowRateLimiter("news_search", NEWS_SEARCH_RATE_LIMIT, RATE_LIMIT_WINDOW)
+news_multiple_limiter = FixedWindowRateLimiter("news_multiple", NEWS_MULTIPLE_RATE_LIMIT, RATE_LIMIT_WINDOW)
+
+@lru_cache(maxsize=PARSED_SYMBOLS_CACHE_SIZE)
+def _parse_symbols(symbols: str) -> Tuple[str, ...]:
+    parts = [match.group().strip().upper() for match in islice(SYMBOL_RE.finditer(symbols), MAX_SYMBOLS_PER_REQUEST + 1)]
+    if len(parts) > MAX_SYMBOLS_PER_REQUEST:
+        raise ValueError(len(parts))
+    return tuple(dict.fromkeys(parts))
+
+def parse_symbol_list(symbols: str, detail: str) -> List[str]:
+    parse = _parse_symbols if len(symbols) <= MAX_SYMBOLS_QUERY_LENGTH else _parse_symbols.__wrapped__
+    try:
+        return list(parse(symbols))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=detail) from None
+
+def response_payload(data: Dict[str, Any], aliases: Dict[str, str]) -> Dict[str, Any]:
+    return {alias: data.get(name) for name, alias in aliases.items()}
+
+def news_payload(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: item.get(field) for field in NEWS_RESPONSE_FIELDS}
+
+def analysis_etag(analysis: Dict[str, Any]) -> str:
+    fingerprint = (
+        analysis['symbol'],
+        analysis['currentPrice'],
+        analysis['volume'],
+        analysis['changePercent'],
+        str(analysis['timestamp']),
+        analysis['trend'],
+        analysis['trendStrength'],
+        tuple(sorted(analysis['signals'].items())),
+        tuple((anomaly['type'], anomaly['severity'], anomaly['message']) for anomaly in analysis['anomalies'])
+    )
+    return f'"{hashlib.blake2b(repr(fingerprint).encode("utf-8"), digest_size=16).hexdigest()}"'
+
+def body_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    return any(
+        candidate.strip().removeprefix('W/') in (etag, '*')
+        for candidate in if_none_match.split(',')
+    )
+
+def clear_historical_cache() -> None:
+    _build_historical_data.cache_clear()
+    with _analyzed_data_lock:
+        _analyzed_data_cache.clear()
+    basic_analysis_cache.clear()
+    advanced_analysis_cache.clear()
+    advanced_components_cache.clear()
+
+def _store_analyzed_data(key: tuple, analyzed_data: pd.DataFrame) -> None:
+    with _analyzed_data_lock:
+        _analyzed_data_cache[key] = analyzed_data
+        _analyzed_data_cache.move_to_end(key)
+        while len(_analyzed_data_cache) > ANALYZED_CACHE_MAX_SIZE:
+            _analyzed_data_cache.popitem(last=False)
+
+def _get_analyzed_data(key: tuple) -> Optional[pd.DataFrame]:
+    with _analyzed_data_lock:
+        analyzed_data = _analyzed_data_cache.get(key)
+        if analyzed_data is not None:
+            _analyzed_data_cache.move_to_end(key)
+        return analyzed_data
+
+def warm_analyzed_cache(symbols: List[str], basic_analyzer: TechnicalAnalyzer) -> int:
+    time_bucket = int(time.time() // HISTORICAL_CACHE_TTL)
+    with _analyzed_data_lock:
+        for key in [key for key in _analyzed_data_cache if key[1] != time_bucket]:
+            del _analyzed_data_cache[key]
+        cached_keys = set(_analyzed_data_cache)
+    
+    warmed = 0
+    for symbol in symbols:
+        key = (symbol, time_bucket, basic_analyzer)
+        if key in cached_keys:
+            continue
+        analyzed_data = basic_analyzer.calculate_all_indicators(_build_historical_data(symbol, time_bucket).copy())
+        if not analyzed_data.empty:
+            _store_analyzed_data(key, analyzed_data)
+            warmed += 1
+    return warmed
+
+async def refresh_historical_cache(basic_analyzer: TechnicalAnalyzer) -> None:
+    try:
+        warmed = await asyncio.to_thread(warm_analyzed_cache, list(settings.ANALYSIS_SYMBOLS), basic_analyzer)
+        if warmed:
+            logger.info("과거 데이터 지표 캐시 갱신 완료", warmed=warmed)
+    except Exception as e:
+        logger.warning("과거 데이터 지표 캐시 갱신 실패", exception=e)
+
+async def refresh_historical_cache_loop(basic_analyzer: TechnicalAnalyzer) -> None:
+    while True:
+        await asyncio.sleep(HISTORICAL_CACHE_REFRESH_INTERVAL)
+        await refresh_historical_cache(basic_analyzer)
+
+async def realtime_pump_loop(api: 'StockAnalysisAPI', wakeup: asyncio.Event) -> None:
+    while True:
+        if realtime_manager.connections:
+            try:
+                analysis_data = await api.get_all_symbols_analysis()
+                await realtime_manager.broadcast(dumps_json(analysis_data))
+            except (StockAnalysisError, StockDataCollectionError) as e:
+                logger.error(f"WebSocket 스트리밍 분석 오류: {str(e)}")
+            except Exception as e:
+                logger.error(f"WebSocket 스트리밍 예상치 못한 오류: {str(e)}")
+        
+        wakeup.clear()
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=REALTIME_PUSH_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+def downcast_indicator_columns(analyzed_data: pd.DataFrame) -> pd.DataFrame:
+    indicator_columns = [
+        column for column in analyzed_data.select_dtypes(include='float64').columns
+        if column not in RAW_MARKET_COLUMNS
+    ]
+    if not indicator_columns:
+        return analyzed_data
+    return analyzed_data.astype({column: np.float32 for column in indicator_columns})
+
+ErrorRecord = Tuple[ErrorSeverity, ErrorCategory, str, Optional[Exception]]
+
+class DeferredErrorLog:
+    def __init__(self):
+        self.records: List[ErrorRecord] = []
+    
+    def log_error(self, severity: ErrorSeverity, category: ErrorCategory, message: str,
+                  exception: Optional[Exception] = None, context: Optional[ErrorContext] = None) -> str:
+        if exception is not None:
+            try:
+                pickle.dumps(exception)
+            except Exception:
+                exception = RuntimeError(f"{type(exception).__name__}: {exception}")
+        self.records.append((severity, category, message, exception))
+        return ""
+    
+    def drain(self) -> List[ErrorRecord]:
+        records, self.records = self.records, []
+        return records
+
+_process_analysis_api: Optional['StockAnalysisAPI'] = None
+
+def run_advanced_analyzers_in_process(historical_data: pd.DataFrame,
+                                      symbol: str) -> Tuple[Tuple[Dict[str, Any], float, float], List[ErrorRecord]]:
+    global _process_analysis_api
+    if _process_analysis_api is None:
+        _process_analysis_api = StockAnalysisAPI(
+            data_collector=None,
+            analyzer=AdvancedTechnicalAnalyzer(),
+            security_manager=None,
+            error_manager=DeferredErrorLog(),
+            news_collector=None
+        )
+    error_log = _process_analysis_api.error_manager
+    error_log.drain()
+    result = _process_analysis_api._run_advanced_analyzers(historical_data, symbol, None)
+    return result, error_log.drain()
 
 class StockAnalysisAPI:
     def __init__(
@@ -340,13 +682,15 @@ class StockAnalysisAPI:
         analyzer: AnalyzerProtocol,
         security_manager: SecurityManager,
         error_manager: ErrorManager,
-        news_collector: NewsCollectorProtocol
+        news_collector: NewsCollectorProtocol,
+        cpu_pool: Optional[Executor] = None
     ) -> None:
         self.data_collector = data_collector
         self.analyzer = analyzer
         self.security_manager = security_manager
         self.error_manager = error_manager
         self.news_collector = news_collector
+        self.cpu_pool = cpu_pool
         
     async def _handle_realtime_data_error(self, e: Exception, symbol: str, context: ErrorContext, 
                                      max_retries: int, attempt: int) -> Optional[Dict[str, Any]]:
@@ -423,6 +767,9 @@ class StockAnalysisAPI:
             ) from e
     
     async def get_realtime_data_enhanced(self, symbol: str) -> Dict[str, Any]:
+        return await analysis_flights.do(('realtime', symbol), self._fetch_realtime_data_enhanced, symbol)
+    
+    async def _fetch_realtime_data_enhanced(self, symbol: str) -> Dict[str, Any]:
         context = ErrorContext(
             endpoint=f"/api/realtime/{symbol}",
             parameters={'symbol': symbol}
@@ -433,7 +780,7 @@ class StockAnalysisAPI:
         
         for attempt in range(max_retries):
             try:
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 context.retry_count = attempt
                 
                 data = await self.data_collector.get_realtime_data_async(symbol)
@@ -455,9 +802,9 @@ class StockAnalysisAPI:
                         detail=f"종목 데이터를 찾을 수 없습니다: {symbol}. 오류 ID: {error_id}"
                     )
                 
-                response_time = time.time() - start_time
+                elapsed_ns = time.perf_counter_ns() - start_ns
                 confidence_score = data.get('confidence_score', 0.95)
-                confidence_score = min(1.0, max(0.0, confidence_score - (response_time / 5.0)))
+                confidence_score = min(1.0, max(0.0, confidence_score - elapsed_ns / CONFIDENCE_DECAY_NS))
                 
                 if context.retry_count > 0:
                     context.recovery_attempted = True
@@ -483,7 +830,7 @@ class StockAnalysisAPI:
         try:
             from data_collectors.stock_data_collector import StockDataCollector
             fallback_collector = StockDataCollector([symbol], use_mock_data=True, fallback_to_mock=True)
-            fallback_data = fallback_collector.get_realtime_data(symbol)
+            fallback_data = await asyncio.to_thread(fallback_collector.get_realtime_data, symbol)
             
             if fallback_data and fallback_data.get('price', 0) > 0:
                 return DataFormatter.format_fallback_data(fallback_data)
@@ -578,6 +925,15 @@ class StockAnalysisAPI:
             )
             return data
     
+    def _run_advanced_analyzers(self, historical_data: pd.DataFrame, symbol: str,
+                                context: ErrorContext) -> Tuple[Dict[str, Any], float, float]:
+        analyzed_data = downcast_indicator_columns(self._calculate_indicators_safe(historical_data, symbol, context))
+        components = self._calculate_analysis_components_safe(analyzed_data, symbol)
+        risk_score, confidence = self._calculate_risk_and_confidence(
+            analyzed_data, components['anomalies'], components['market_regime']
+        )
+        return components, risk_score, confidence
+    
     def _calculate_analysis_components_safe(self, analyzed_data: pd.DataFrame, symbol: str) -> Dict[str, Any]:
         components = {
             'market_regime': {'regime': 'unknown', 'confidence': 0.0},
@@ -620,21 +976,56 @@ class StockAnalysisAPI:
         
         return components
     
-    async def get_advanced_analysis(self, symbol: str) -> Dict[str, Any]:
+    async def get_advanced_analysis(self, symbol: str,
+                                    realtime_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if realtime_data is not None:
+            return await self._compute_advanced_analysis(symbol, realtime_data)
+        
+        key = (symbol, self.data_collector, self.analyzer)
+        cached = advanced_analysis_cache.get_fresh(key)
+        if cached is not None:
+            return cached
+        
+        analysis = await analysis_flights.do(('advanced', symbol), self._compute_advanced_analysis, symbol)
+        advanced_analysis_cache.set(key, analysis, ADVANCED_ANALYSIS_CACHE_TTL)
+        return analysis
+    
+    async def _get_advanced_components(self, symbol: str, context: ErrorContext) -> Tuple[Dict[str, Any], float, float]:
+        key = (symbol, self.data_collector, self.analyzer)
+        cached = advanced_components_cache.get_fresh(key)
+        if cached is not None:
+            return cached
+        
+        historical_data = await self._fetch_historical_data_with_retry(symbol, context)
+        if self.cpu_pool is not None:
+            loop = asyncio.get_running_loop()
+            result, error_records = await loop.run_in_executor(
+                self.cpu_pool, run_advanced_analyzers_in_process, historical_data, symbol
+            )
+            for severity, category, message, exception in error_records:
+                self.error_manager.log_error(severity, category, message, exception, context)
+        else:
+            result = await asyncio.to_thread(self._run_advanced_analyzers, historical_data, symbol, context)
+        advanced_components_cache.set(key, result, ADVANCED_COMPONENTS_CACHE_TTL)
+        return result
+    
+    async def _compute_advanced_analysis(self, symbol: str,
+                                         realtime_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         context = ErrorContext(
             endpoint=f"/api/analysis/{symbol}",
             parameters={'symbol': symbol}
         )
         
         try:
-            realtime_data = await self.get_realtime_data_enhanced(symbol)
-            historical_data = await self._fetch_historical_data_with_retry(symbol, context)
-            analyzed_data = self._calculate_indicators_safe(historical_data, symbol, context)
-            components = self._calculate_analysis_components_safe(analyzed_data, symbol)
-            
-            risk_score = self._calculate_risk_score(analyzed_data, components['anomalies'])
-            confidence = self._calculate_analysis_confidence(analyzed_data, components['market_regime'])
+            if realtime_data is None:
+                realtime_data, (components, risk_score, confidence) = await asyncio.gather(
+                    self.get_realtime_data_enhanced(symbol),
+                    self._get_advanced_components(symbol, context)
+                )
+            else:
+                components, risk_score, confidence = await self._get_advanced_components(symbol, context)
             
+            now = datetime.now()
             return {
                 'symbol': symbol,
                 'currentPrice': realtime_data['currentPrice'],
@@ -652,12 +1043,12 @@ class StockAnalysisAPI:
                         'type': anomaly.get('type', 'unknown'),
                         'severity': anomaly.get('severity', 'low'),
                         'message': anomaly.get('message', f"이상 패턴 감지: {anomaly.get('type', 'unknown')}"),
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': now
                     } for anomaly in components['anomalies']
                 ],
                 'riskScore': risk_score,
                 'confidence': confidence,
-                'timestamp': datetime.now()
+                'timestamp': now
             }
             
         except HTTPException:
@@ -694,7 +1085,7 @@ class StockAnalysisAPI:
         try:
             from data_collectors.stock_data_collector import StockDataCollector
             fallback_collector = StockDataCollector([symbol], use_mock_data=True, fallback_to_mock=True)
-            return fallback_collector.get_historical_data(symbol, "3mo")
+            return await asyncio.to_thread(fallback_collector.get_historical_data, symbol, "3mo")
         except StockDataCollectionError as e:
             logger.error("대체 과거 데이터 조회 실패", symbol=symbol, exception=e)
             return pd.DataFrame()
@@ -702,38 +1093,25 @@ class StockAnalysisAPI:
             logger.error("대체 과거 데이터 조회 실패", symbol=symbol, exception=e)
             return pd.DataFrame()
     
-    def _calculate_risk_score(self, data: pd.DataFrame, anomalies: List[Dict[str, Any]]) -> float:
-        base_risk = 0.1
-        
-        if len(anomalies) > 0:
-            base_risk += min(0.4, len(anomalies) * 0.1)
-        
-        if 'close' in data.columns and len(data) > 1:
-            volatility = data['close'].pct_change().std()
-            if pd.notna(volatility):
-                base_risk += min(0.3, float(volatility) * 10)
-        
-        return min(1.0, base_risk)
+    def _calculate_risk_and_confidence(self, data: pd.DataFrame, anomalies: List[Dict[str, Any]],
+                                       market_regime: Dict[str, Any]) -> Tuple[float, float]:
+        empty = np.empty(0, dtype=np.float64)
+        close = data['close'].to_numpy(dtype=np.float64) if 'close' in data.columns else empty
+        volume = data['volume'].to_numpy(dtype=np.float64) if 'volume' in data.columns else empty
+        with np.errstate(divide='ignore', invalid='ignore'):
+            risk_score, confidence = risk_and_confidence(
+                close, volume, len(data), len(anomalies), float(market_regime.get('confidence', 0) or 0)
+            )
+        return float(risk_score), float(confidence)
     
-    def _calculate_analysis_confidence(self, data: pd.DataFrame, market_regime: Dict[str, Any]) -> float:
-        base_confidence = 0.5
-        
-        if market_regime.get('confidence', 0) > 0.7:
-            base_confidence += 0.2
-        
-        if len(data) > 100:
-            base_confidence += 0.2
-        
-        if 'volume' in data.columns and len(data) > 0:
-            avg_volume = data['volume'].mean()
-            if pd.notna(avg_volume) and avg_volume > 1000000:
-                base_confidence += 0.1
-        
-        return min(1.0, base_confidence)
+    async def _bounded_advanced_analysis(self, symbol: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        async with semaphore:
+            return await self.get_advanced_analysis(symbol)
     
     async def get_batch_analysis(self, symbols: List[str]) -> List[Dict[str, Any]]:
         try:
-            tasks = [self.get_advanced_analysis(symbol) for symbol in symbols]
+            semaphore = asyncio.Semaphore(BATCH_ANALYSIS_CONCURRENCY)
+            tasks = [self._bounded_advanced_analysis(symbol, semaphore) for symbol in symbols]
             results = await asyncio.gather(*tasks, return_exceptions=True)
             
             valid_results = []
@@ -773,39 +1151,54 @@ class StockAnalysisAPI:
             ) from e
     
     def _load_historical_data(self, symbol: str):
-        import numpy as np
-        dates = pd.date_range(start=datetime.now() - pd.Timedelta(days=60), end=datetime.now(), freq='D')
-        np.random.seed(hash(symbol) % 2**32)
-        
-        base_price = 100 + hash(symbol) % 200
-        price_changes = np.random.randn(len(dates)) * 2
-        prices = base_price + np.cumsum(price_changes)
-        
-        return pd.DataFrame({
-            'date': dates,
-            'close': prices,
-            'volume': np.random.randint(1000000, 5000000, len(dates))
-        })
+        return _build_historical_data(symbol, int(time.time() // HISTORICAL_CACHE_TTL)).copy()
+    
+    def _load_analyzed_data(self, symbol: str, basic_analyzer: TechnicalAnalyzer) -> pd.DataFrame:
+        key = (symbol, int(time.time() // HISTORICAL_CACHE_TTL), basic_analyzer)
+        analyzed_data = _get_analyzed_data(key)
+        if analyzed_data is None:
+            analyzed_data = basic_analyzer.calculate_all_indicators(self._load_historical_data(symbol))
+            if analyzed_data.empty:
+                return analyzed_data
+            _store_analyzed_data(key, analyzed_data)
+        return analyzed_data.copy()
     
     async def get_basic_analysis(self, symbol: str, basic_analyzer: TechnicalAnalyzer, 
-                                 enhanced_collector: StockDataCollector) -> Dict[str, Any]:
+                                 enhanced_collector: StockDataCollector,
+                                 realtime_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if realtime_data is not None:
+            return await self._compute_basic_analysis(symbol, basic_analyzer, enhanced_collector, realtime_data)
+        
+        key = (symbol, basic_analyzer, enhanced_collector)
+        cached = basic_analysis_cache.get_fresh(key)
+        if cached is not None:
+            return cached
+        
+        analysis = await analysis_flights.do(
+            ('basic', symbol),
+            self._compute_basic_analysis, symbol, basic_analyzer, enhanced_collector
+        )
+        basic_analysis_cache.set(key, analysis, BASIC_ANALYSIS_CACHE_TTL)
+        return analysis
+    
+    async def _compute_basic_analysis(self, symbol: str, basic_analyzer: TechnicalAnalyzer,
+                                      enhanced_collector: StockDataCollector,
+                                      realtime_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         try:
-            
-            realtime_data = enhanced_collector.get_realtime_data(symbol)
+            if realtime_data is None:
+                realtime_data = await asyncio.to_thread(enhanced_collector.get_realtime_data, symbol)
             if not realtime_data:
                 raise HTTPException(status_code=404, detail=f"종목 데이터를 찾을 수 없습니다: {symbol}")
             
-            historical_data = self._load_historical_data(symbol)
+            latest, trend_analysis, anomalies, signals = await asyncio.to_thread(
+                self._compute_analysis, basic_analyzer, symbol
+            )
             
-            if historical_data.empty:
+            if latest is None:
                 raise HTTPException(status_code=404, detail=f"과거 데이터를 찾을 수 없습니다: {symbol}")
             
-            analyzed_data = basic_analyzer.calculate_all_indicators(historical_data)
-            trend_analysis = basic_analyzer.analyze_trend(analyzed_data)
-            anomalies = basic_analyzer.detect_anomalies(analyzed_data, symbol)
-            signals = basic_analyzer.generate_signals(analyzed_data, symbol)
-            
             timestamp = format_timestamp(realtime_data.get('timestamp'))
+            detected_at = datetime.now()
             
             return {
                 'symbol': symbol,
@@ -817,16 +1210,14 @@ class StockAnalysisAPI:
                 'signals': {
                     'signal': signals['signal'],
                     'confidence': signals['confidence'],
-                    'rsi': analyzed_data['rsi_14'].iloc[-1] if 'rsi_14' in analyzed_data.columns and not analyzed_data['rsi_14'].isna().iloc[-1] else None,
-                    'macd': analyzed_data['macd'].iloc[-1] if 'macd' in analyzed_data.columns and not analyzed_data['macd'].isna().iloc[-1] else None,
-                    'macdSignal': analyzed_data['macd_signal'].iloc[-1] if 'macd_signal' in analyzed_data.columns and not analyzed_data['macd_signal'].isna().iloc[-1] else None
+                    **latest
                 },
                 'anomalies': [
                     {
                         'type': anomaly['type'],
                         'severity': anomaly['severity'],
                         'message': anomaly['message'],
-                        'timestamp': datetime.now()
+                        'timestamp': detected_at
                     } for anomaly in anomalies
                 ],
                 'timestamp': timestamp
@@ -844,11 +1235,46 @@ class StockAnalysisAPI:
                 cause=e
             ) from e
     
+    async def _safe_get_analysis(self, symbol: str, semaphore: asyncio.Semaphore,
+                                 basic_analyzer: Optional[TechnicalAnalyzer] = None,
+                                 enhanced_collector: Optional[StockDataCollector] = None) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            try:
+                logger.info(f"종목 분석 중: {symbol}")
+                if basic_analyzer and enhanced_collector:
+                    analysis = await self.get_basic_analysis(symbol, basic_analyzer, enhanced_collector)
+                else:
+                    analysis = await self.get_advanced_analysis(symbol)
+                
+                if not analysis:
+                    logger.warning(f"종목 분석 결과가 None: {symbol}")
+                    return None
+                
+                logger.info(f"종목 분석 성공: {symbol}")
+                return analysis
+            except (StockAnalysisError, StockDataCollectionError) as e:
+                logger.error(f"종목 분석 오류: {symbol}", exception=e)
+                return None
+            except Exception as e:
+                logger.error(f"종목 분석 예상치 못한 오류: {symbol}", exception=e, exc_info=True)
+                return None
+    
+    def _compute_analysis(self, basic_analyzer: TechnicalAnalyzer, symbol: str) -> Tuple[Optional[Dict[str, Any]], Any, Any, Any]:
+        analyzed_data = self._load_analyzed_data(symbol, basic_analyzer)
+        if analyzed_data.empty:
+            return None, None, None, None
+        
+        latest_row = analyzed_data.iloc[-1]
+        return (
+            {key: safe_float(latest_row.get(column)) for key, column in LATEST_INDICATOR_COLUMNS.items()},
+            basic_analyzer.analyze_trend(analyzed_data),
+            basic_analyzer.detect_anomalies(analyzed_data, symbol),
+            basic_analyzer.generate_signals(analyzed_data, symbol)
+        )
+    
     async def get_all_symbols_analysis(self, basic_analyzer: Optional[TechnicalAnalyzer] = None,
                                        enhanced_collector: Optional[StockDataCollector] = None) -> List[Dict[str, Any]]:
         try:
-            import asyncio
-            results = []
             symbols_count = len(settings.ANALYSIS_SYMBOLS)
             logger.info(f"전체 종목 분석 시작: {symbols_count}개 종목")
             
@@ -856,40 +1282,20 @@ class StockAnalysisAPI:
                 logger.warning("분석할 종목이 설정되어 있지 않습니다. ANALYSIS_SYMBOLS를 확인하세요.")
                 return []
             
-            success_count = 0
-            failure_count = 0
+            semaphore = asyncio.Semaphore(ALL_SYMBOLS_ANALYSIS_CONCURRENCY)
+            analyses = await asyncio.gather(*(
+                self._safe_get_analysis(symbol, semaphore, basic_analyzer, enhanced_collector)
+                for symbol in settings.ANALYSIS_SYMBOLS
+            ), return_exceptions=True)
             
-            for idx, symbol in enumerate(settings.ANALYSIS_SYMBOLS):
-                try:
-                    logger.info(f"종목 분석 중 ({idx+1}/{symbols_count}): {symbol}")
-                    if basic_analyzer and enhanced_collector:
-                        analysis = await self.get_basic_analysis(symbol, basic_analyzer, enhanced_collector)
-                    else:
-                        analysis = await self.get_advanced_analysis(symbol)
-                    
-                    if analysis:
-                        results.append(analysis)
-                        success_count += 1
-                        logger.info(f"종목 분석 성공: {symbol}")
-                    else:
-                        failure_count += 1
-                        logger.warning(f"종목 분석 결과가 None: {symbol}")
-                    
-                    if idx < len(settings.ANALYSIS_SYMBOLS) - 1:
-                        await asyncio.sleep(0.5)
-                        
-                except (StockAnalysisError, StockDataCollectionError) as e:
-                    failure_count += 1
-                    logger.error(f"종목 분석 오류: {symbol}", exception=e)
-                    if idx < len(settings.ANALYSIS_SYMBOLS) - 1:
-                        await asyncio.sleep(0.3)
-                    continue
-                except Exception as e:
-                    failure_count += 1
-                    logger.error(f"종목 분석 예상치 못한 오류: {symbol}", exception=e, exc_info=True)
-                    if idx < len(settings.ANALYSIS_SYMBOLS) - 1:
-                        await asyncio.sleep(0.3)
-                    continue
+            results = []
+            for symbol, analysis in zip(settings.ANALYSIS_SYMBOLS, analyses):
+                if isinstance(analysis, BaseException):
+                    logger.error(f"종목 분석 예상치 못한 오류: {symbol}", exception=analysis)
+                elif analysis:
+                    results.append(analysis)
+            success_count = len(results)
+            failure_count = symbols_count - success_count
             
             logger.info(f"전체 종목 분석 완료: {success_count}개 성공, {failure_count}개 실패 (총 {symbols_count}개)")
             if len(results) == 0:
@@ -906,29 +1312,20 @@ class StockAnalysisAPI:
                 cause=e
             ) from e
     
-    async def get_historical_data(self, symbol: str, days: int, basic_analyzer: TechnicalAnalyzer) -> Dict[str, Any]:
+    def _build_chart_frame(self, symbol: str, basic_analyzer: TechnicalAnalyzer) -> pd.DataFrame:
+        analyzed_data = self._load_analyzed_data(symbol, basic_analyzer)
+        if analyzed_data.empty:
+            return pd.DataFrame(columns=CHART_COLUMNS)
+        
+        chart_frame = analyzed_data.reindex(columns=CHART_NUMERIC_COLUMNS).astype('float64')
+        chart_frame['close'] = chart_frame['close'].fillna(0.0)
+        chart_frame.insert(0, 'date', analyzed_data['date'].dt.strftime(CHART_DATE_FORMAT))
+        chart_frame.insert(2, 'volume', analyzed_data['volume'].fillna(0).astype('int64'))
+        return chart_frame
+    
+    async def _run_chart_task(self, symbol: str, func, *args):
         try:
-            historical_data = self._load_historical_data(symbol)
-            analyzed_data = basic_analyzer.calculate_all_indicators(historical_data)
-            
-            chart_data = []
-            for i, row in analyzed_data.iterrows():
-                chart_data.append({
-                    'date': row['date'].isoformat(),
-                    'close': safe_float(row['close'], 0.0),
-                    'volume': int(row['volume']) if not pd.isna(row['volume']) else 0,
-                    'rsi': safe_float(row.get('rsi')) if 'rsi' in row else None,
-                    'macd': safe_float(row.get('macd')) if 'macd' in row else None,
-                    'bb_upper': safe_float(row.get('bb_upper')) if 'bb_upper' in row else None,
-                    'bb_lower': safe_float(row.get('bb_lower')) if 'bb_lower' in row else None,
-                    'sma_20': safe_float(row.get('sma_20')) if 'sma_20' in row else None
-                })
-            
-            return {
-                'symbol': symbol,
-                'data': chart_data,
-                'period': days
-            }
+            return await asyncio.to_thread(func, *args)
         except (ValueError, TypeError, StockAnalysisError) as e:
             logger.error("과거 데이터 조회 오류", symbol=symbol, exception=e)
             raise HTTPException(status_code=500, detail=f"과거 데이터 조회 오류: {str(e)}") from e
@@ -939,23 +1336,76 @@ class StockAnalysisAPI:
                 error_code="HISTORICAL_DATA_FETCH_FAILED",
                 cause=e
             ) from e
+    
+    def _chart_records(self, symbol: str, basic_analyzer: TechnicalAnalyzer) -> List[Dict[str, Any]]:
+        chart_frame = self._build_chart_frame(symbol, basic_analyzer)
+        return chart_frame.astype(object).where(chart_frame.notna(), None).to_dict('records')
+    
+    def _chart_records_json(self, symbol: str, basic_analyzer: TechnicalAnalyzer) -> bytes:
+        return encode_json(self._chart_records(symbol, basic_analyzer))
+    
+    async def get_historical_data(self, symbol: str, days: int, basic_analyzer: TechnicalAnalyzer) -> Dict[str, Any]:
+        chart_data = await self._run_chart_task(symbol, self._chart_records, symbol, basic_analyzer)
+        return {
+            'symbol': symbol,
+            'data': chart_data,
+            'period': days
+        }
+    
+    async def get_historical_json(self, symbol: str, days: int, basic_analyzer: TechnicalAnalyzer) -> bytes:
+        records = await self._run_chart_task(symbol, self._chart_records_json, symbol, basic_analyzer)
+        return b''.join((
+            b'{"symbol":', encode_json(symbol),
+            b',"data":', records,
+            b',"period":', str(days).encode('ascii'), b'}'
+        ))
+
+def get_optional_stock_api(request: Request) -> Optional[StockAnalysisAPI]:
+    return getattr(request.app.state, 'stock_api', None)
 
 def get_stock_api(request: Request) -> StockAnalysisAPI:
-    if not hasattr(request.app.state, 'data_collector'):
+    stock_api = getattr(request.app.state, 'stock_api', None)
+    if stock_api is None:
         raise HTTPException(status_code=503, detail="서비스 초기화 중입니다")
-    return StockAnalysisAPI(
-        data_collector=request.app.state.data_collector,
-        analyzer=request.app.state.analyzer,
-        security_manager=request.app.state.security_manager,
-        error_manager=request.app.state.error_manager,
-        news_collector=NewsCollector()
-    )
+    return stock_api
+
+async def get_redis_cache(request: Request) -> RedisResponseCache:
+    cache = getattr(request.app.state, 'redis_cache', None)
+    return cache if cache is not None else RedisResponseCache()
+
+def rate_limited(limiter: FixedWindowRateLimiter):
+    async def check_rate_limit(request: Request, cache: RedisResponseCache = Depends(get_redis_cache)) -> None:
+        client_ip = request.client.host if request.client else "unknown"
+        if not await limiter.allow(cache, client_ip):
+            logger.warning("요청 한도 초과", client_ip=client_ip, limiter=limiter.namespace)
+            raise HTTPException(
+                status_code=429,
+                detail="요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": str(limiter.window)}
+            )
+    return check_rate_limit
+
+def cached_json_response(body: bytes, cache_status: str) -> Response:
+    return Response(content=body, media_type="application/json", headers={CACHE_STATUS_HEADER: cache_status})
+
+def conditional_json_response(request: Request, body: bytes, cache_status: str) -> Response:
+    etag = body_etag(body)
+    if etag_matches(request.headers.get('if-none-match'), etag):
+        return Response(status_code=304, headers={'ETag': etag, CACHE_STATUS_HEADER: cache_status})
+    response = cached_json_response(body, cache_status)
+    response.headers['ETag'] = etag
+    return response
 
 def get_enhanced_collector(request: Request) -> StockDataCollector:
     if not hasattr(request.app.state, 'enhanced_collector'):
         raise HTTPException(status_code=503, detail="서비스 초기화 중입니다")
     return request.app.state.enhanced_collector
 
+def get_http_session(request: Request) -> aiohttp.ClientSession:
+    if not hasattr(request.app.state, 'http_session'):
+        raise HTTPException(status_code=503, detail="서비스 초기화 중입니다")
+    return request.app.state.http_session
+
 def get_basic_analyzer(request: Request) -> TechnicalAnalyzer:
     if not hasattr(request.app.state, 'basic_analyzer'):
         raise HTTPException(status_code=503, detail="서비스 초기화 중입니다")
@@ -966,6 +1416,11 @@ def get_notification_service(request: Request) -> NotificationService:
         raise HTTPException(status_code=503, detail="서비스 초기화 중입니다")
     return request.app.state.notification_service
 
+def get_email_queue(request: Request) -> EmailQueue:
+    if not hasattr(request.app.state, 'email_queue'):
+        raise HTTPException(status_code=503, detail="서비스 초기화 중입니다")
+    return request.app.state.email_queue
+
 @app.get("/", 
          summary="API 서버 정보",
          description="Enhanced Stock Analysis API 서버의 기본 정보를 반환합니다.")
@@ -1043,7 +1498,7 @@ async def login(
         
         logger.info("로그인 성공", username=login_data.username, ip=client_ip)
         
-        response = JSONResponse(content={
+        response = DefaultJSONResponse(content={
             "success": True,
             "message": "로그인 성공",
             "token": token,
@@ -1087,7 +1542,7 @@ async def logout(request: Request) -> Dict[str, Any]:
                 if session_id:
                     security_manager.invalidate_session(session_id)
         
-        response = JSONResponse(content={
+        response = DefaultJSONResponse(content={
             "success": True,
             "message": "로그아웃되었습니다."
         })
@@ -1106,23 +1561,25 @@ async def logout(request: Request) -> Dict[str, Any]:
 @app.get("/api/health",
          summary="헬스 체크",
          description="API 서버의 상태를 확인합니다.")
-async def health_check(request: Request) -> Dict[str, Any]:
+@cached_endpoint(ttl=2, swr=10)
+async def health_check(api: Optional[StockAnalysisAPI] = Depends(get_optional_stock_api)) -> Dict[str, Any]:
     try:
-        if not hasattr(request.app.state, 'data_collector'):
+        if api is None:
             return {
                 "status": "initializing",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now()
             }
         
-        api = get_stock_api(request)
         health_data = await api.data_collector.health_check()
         performance_metrics = api.data_collector.get_performance_metrics()
         
         return {
             "status": health_data.get('status', 'healthy'),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "performance": performance_metrics,
             "connections": manager.get_connection_stats(),
+            "realtime_connections": realtime_manager.get_connection_stats(),
+            "compression": compression_stats.snapshot(),
             "errors": api.error_manager.get_error_statistics(hours=1)
         }
     except (NetworkError, DatabaseConnectionError) as e:
@@ -1130,30 +1587,35 @@ async def health_check(request: Request) -> Dict[str, Any]:
         return {
             "status": "degraded",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
     except Exception as e:
         logger.error("헬스 체크 예상치 못한 오류", exception=e)
         return {
             "status": "degraded",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now()
         }
 
 @app.get("/api/performance",
          summary="성능 메트릭",
          description="API 서버의 성능 지표를 조회합니다.",
          response_model=PerformanceMetrics)
+@cached_endpoint(ttl=2)
 async def get_performance_metrics(api: StockAnalysisAPI = Depends(get_stock_api)) -> PerformanceMetrics:
     metrics = api.data_collector.get_performance_metrics()
-    return PerformanceMetrics(**metrics)
+    return PerformanceMetrics(
+        **metrics,
+        analysis_cache_hit_rate=advanced_components_cache.hit_rate,
+        news_cache_hit_rate=news_cache.hit_rate
+    )
 
 @app.get("/api/realtime/{symbol}",
          summary="실시간 주가 데이터 (향상된)",
          description="특정 종목의 실시간 주가 정보를 조회합니다.",
-         response_model=StockDataResponse,
+         response_model=None,
          responses={
-             200: {"description": "성공적으로 데이터를 조회했습니다."},
+             200: {"description": "성공적으로 데이터를 조회했습니다.", "model": StockDataResponse},
              404: {"description": "해당 종목의 데이터를 찾을 수 없습니다.", "model": EnhancedErrorResponse},
              500: {"description": "서버 내부 오류가 발생했습니다.", "model": EnhancedErrorResponse}
          })
@@ -1163,14 +1625,17 @@ async def get_realtime_data(
     api: StockAnalysisAPI = Depends(get_stock_api)
 ) -> StockDataResponse:
     result = await api.get_realtime_data_enhanced(symbol)
-    return StockDataResponse(**result)
+    return DefaultJSONResponse(response_payload(
+        {**result, 'timestamp': format_timestamp(result.get('timestamp'))},
+        STOCK_DATA_RESPONSE_ALIASES
+    ))
 
 @app.get("/api/analysis/advanced/{symbol}",
          summary="고급 기술적 분석 결과",
          description="특정 종목의 고급 기술적 분석 결과를 조회합니다.",
-         response_model=AdvancedAnalysisResponse,
+         response_model=None,
          responses={
-             200: {"description": "성공적으로 분석 결과를 조회했습니다."},
+             200: {"description": "성공적으로 분석 결과를 조회했습니다.", "model": AdvancedAnalysisResponse},
              404: {"description": "해당 종목의 분석 데이터를 찾을 수 없습니다.", "model": EnhancedErrorResponse},
              500: {"description": "서버 내부 오류가 발생했습니다.", "model": EnhancedErrorResponse}
          })
@@ -1180,30 +1645,28 @@ async def get_advanced_analysis(
     api: StockAnalysisAPI = Depends(get_stock_api)
 ) -> AdvancedAnalysisResponse:
     result = await api.get_advanced_analysis(symbol)
-    return AdvancedAnalysisResponse(**result)
+    return DefaultJSONResponse(response_payload(result, ADVANCED_ANALYSIS_RESPONSE_ALIASES))
 
 @app.get("/api/analysis/batch",
          summary="배치 분석",
          description="여러 종목의 분석을 동시에 수행합니다.",
-         response_model=List[AdvancedAnalysisResponse])
+         response_model=None,
+         responses={
+             200: {"description": "성공적으로 배치 분석을 수행했습니다.", "model": List[AdvancedAnalysisResponse]}
+         })
 @error_handler(ErrorSeverity.MEDIUM, ErrorCategory.ANALYSIS)
 async def get_batch_analysis(
     symbols: str = Query(..., description="분석할 종목들 (쉼표로 구분)", example="AAPL,GOOGL,MSFT"),
     api: StockAnalysisAPI = Depends(get_stock_api)
 ) -> List[AdvancedAnalysisResponse]:
-    symbol_list = [s.strip().upper() for s in symbols.split(',')]
-    if len(symbol_list) > 10:
-        raise HTTPException(
-            status_code=400,
-            detail="배치 요청당 최대 10개 종목까지 허용됩니다"
-        )
-    
+    symbol_list = parse_symbol_list(symbols, "배치 요청당 최대 10개 종목까지 허용됩니다")
     results = await api.get_batch_analysis(symbol_list)
-    return [AdvancedAnalysisResponse(**result) for result in results]
+    return DefaultJSONResponse([response_payload(result, ADVANCED_ANALYSIS_RESPONSE_ALIASES) for result in results])
 
 @app.get("/api/errors",
          summary="오류 통계",
          description="시스템 오류 통계를 조회합니다.")
+@cached_endpoint(ttl=30, key_params=('hours',))
 async def get_error_statistics(
     hours: int = Query(24, description="조회할 시간 범위 (시간)", ge=1, le=168),
     api: StockAnalysisAPI = Depends(get_stock_api)
@@ -1214,23 +1677,24 @@ async def get_error_statistics(
          summary="분석 가능한 종목 목록",
          description="현재 분석 중인 주식 종목들의 목록을 반환합니다.",
          response_model=Dict[str, List[str]])
+@cached_endpoint(ttl=3600)
 async def get_symbols():
     return {"symbols": settings.ANALYSIS_SYMBOLS}
 
 @app.get("/api/analysis/all",
          summary="전체 종목 분석 결과",
          description="모든 분석 중인 종목의 기술적 분석 결과를 조회합니다.",
-         response_model=List[TechnicalAnalysisResponse],
+         response_model=None,
          responses={
-             200: {"description": "성공적으로 모든 분석 결과를 조회했습니다."},
-             500: {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse}
+             200: {"description": "성공적으로 모든 분석 결과를 조회했습니다.", "model": List[TechnicalAnalysisResponse]},
+             500: SERVER_ERROR_RESPONSE
          })
+@cached_endpoint(ttl=5, swr=10)
 async def get_all_analysis(
     api: StockAnalysisAPI = Depends(get_stock_api),
     basic_analyzer: TechnicalAnalyzer = Depends(get_basic_analyzer),
     enhanced_collector: StockDataCollector = Depends(get_enhanced_collector)
 ):
-    from pydantic import ValidationError
     from datetime import datetime as dt
     
     logger.info("전체 종목 분석 요청 시작")
@@ -1243,7 +1707,7 @@ async def get_all_analysis(
     
     if not results:
         logger.warning("전체 종목 분석 결과가 비어있습니다. 종목 설정이나 데이터 수집 상태를 확인하세요.")
-        return []
+        return Response(content=b"[]", media_type="application/json")
     
     valid_results = []
     for result in results:
@@ -1323,24 +1787,34 @@ async def get_all_analysis(
     if len(valid_results) == 0:
         logger.warning("유효한 분석 결과가 없습니다. 모든 결과가 검증에 실패했을 수 있습니다.")
     
-    return valid_results
+    return Response(
+        content=TECHNICAL_ANALYSIS_LIST_ADAPTER.dump_json(valid_results, by_alias=True),
+        media_type="application/json"
+    )
 
 @app.get("/api/analysis/{symbol}",
          summary="기술적 분석 결과",
          description="특정 종목의 기술적 분석 결과를 조회합니다.",
-         response_model=TechnicalAnalysisResponse,
+         response_model=None,
          responses={
-             200: {"description": "성공적으로 분석 결과를 조회했습니다."},
+             200: {"description": "성공적으로 분석 결과를 조회했습니다.", "model": TechnicalAnalysisResponse},
+             304: {"description": "분석 결과가 변경되지 않았습니다."},
              404: {"description": "해당 종목의 분석 데이터를 찾을 수 없습니다.", "model": ErrorResponse},
-             500: {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse}
+             500: SERVER_ERROR_RESPONSE
          })
 async def get_basic_analysis_endpoint(
+    request: Request,
+    response: Response,
     symbol: str = Path(..., description="주식 심볼", example="AAPL"),
     api: StockAnalysisAPI = Depends(get_stock_api),
     basic_analyzer: TechnicalAnalyzer = Depends(get_basic_analyzer),
     enhanced_collector: StockDataCollector = Depends(get_enhanced_collector)
 ):
     result = await api.get_basic_analysis(symbol, basic_analyzer, enhanced_collector)
+    etag = analysis_etag(result)
+    if etag_matches(request.headers.get('if-none-match'), etag):
+        return Response(status_code=304, headers={'ETag': etag})
+    response.headers['ETag'] = etag
     return TechnicalAnalysisResponse(**result)
 
 @app.get("/api/historical/{symbol}",
@@ -1349,52 +1823,62 @@ async def get_basic_analysis_endpoint(
          responses={
              200: {"description": "성공적으로 과거 데이터를 조회했습니다."},
              404: {"description": "해당 종목의 과거 데이터를 찾을 수 없습니다.", "model": ErrorResponse},
-             500: {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse}
+             500: SERVER_ERROR_RESPONSE
          })
+@cached_endpoint(ttl=30, swr=60, key_params=('symbol', 'days'))
 async def get_historical_data(
     symbol: str = Path(..., description="주식 심볼", example="AAPL"),
     days: int = Query(30, description="조회할 일수", ge=1, le=365),
     api: StockAnalysisAPI = Depends(get_stock_api),
     basic_analyzer: TechnicalAnalyzer = Depends(get_basic_analyzer)
 ):
-    return await api.get_historical_data(symbol, days, basic_analyzer)
+    payload = await api.get_historical_json(symbol, days, basic_analyzer)
+    return Response(content=payload, media_type="application/json")
 
 @app.get("/api/alpha-vantage/search/{keywords}",
          summary="Alpha Vantage 종목 검색",
          description="Alpha Vantage API를 사용하여 종목을 검색합니다.",
          responses={
              200: {"description": "성공적으로 종목을 검색했습니다."},
-             500: {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse}
+             500: SERVER_ERROR_RESPONSE
          })
 async def search_symbols(
     keywords: str = Path(..., description="검색 키워드", example="Apple"),
-    enhanced_collector: StockDataCollector = Depends(get_enhanced_collector)
+    enhanced_collector: StockDataCollector = Depends(get_enhanced_collector),
+    http_session: aiohttp.ClientSession = Depends(get_http_session)
 ):
     try:
-        return enhanced_collector.search_alpha_vantage_symbols(keywords)
+        return await enhanced_collector.search_alpha_vantage_symbols_async(keywords, http_session)
     except Exception as e:
         logger.error("종목 검색 오류", keywords=keywords, exception=e)
         raise HTTPException(status_code=500, detail=f"종목 검색 오류: {str(e)}")
 
+def _records_response(data: pd.DataFrame) -> Response:
+    return Response(
+        content=data.to_json(orient='records', date_format='iso'),
+        media_type="application/json"
+    )
+
 @app.get("/api/alpha-vantage/intraday/{symbol}",
          summary="Alpha Vantage 분별 데이터",
          description="Alpha Vantage API를 사용하여 분별 주가 데이터를 조회합니다.",
          responses={
              200: {"description": "성공적으로 분별 데이터를 조회했습니다."},
-             404: {"description": "해당 종목의 데이터를 찾을 수 없습니다.", "model": ErrorResponse},
-             500: {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse}
+             404: STOCK_NOT_FOUND_RESPONSE,
+             500: SERVER_ERROR_RESPONSE
          })
 async def get_alpha_vantage_intraday(
     symbol: str = Path(..., description="주식 심볼", example="AAPL"),
     interval: str = Query("5min", description="시간 간격", example="5min"),
     outputsize: str = Query("compact", description="출력 크기", example="compact"),
-    enhanced_collector: StockDataCollector = Depends(get_enhanced_collector)
+    enhanced_collector: StockDataCollector = Depends(get_enhanced_collector),
+    http_session: aiohttp.ClientSession = Depends(get_http_session)
 ):
     try:
-        data = enhanced_collector.get_alpha_vantage_intraday_data(symbol, interval, outputsize)
+        data = await enhanced_collector.get_alpha_vantage_intraday_data_async(symbol, http_session, interval, outputsize)
         if data.empty:
             raise HTTPException(status_code=404, detail=f"분별 데이터를 찾을 수 없습니다: {symbol}")
-        return data.to_dict('records')
+        return _records_response(data)
     except HTTPException:
         raise
     except (TimeoutError, ConnectionError, NetworkError) as e:
@@ -1412,18 +1896,19 @@ async def get_alpha_vantage_intraday(
          description="Alpha Vantage API를 사용하여 주별 주가 데이터를 조회합니다.",
          responses={
              200: {"description": "성공적으로 주별 데이터를 조회했습니다."},
-             404: {"description": "해당 종목의 데이터를 찾을 수 없습니다.", "model": ErrorResponse},
-             500: {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse}
+             404: STOCK_NOT_FOUND_RESPONSE,
+             500: SERVER_ERROR_RESPONSE
          })
 async def get_alpha_vantage_weekly(
     symbol: str = Path(..., description="주식 심볼", example="AAPL"),
-    enhanced_collector: StockDataCollector = Depends(get_enhanced_collector)
+    enhanced_collector: StockDataCollector = Depends(get_enhanced_collector),
+    http_session: aiohttp.ClientSession = Depends(get_http_session)
 ):
     try:
-        data = enhanced_collector.get_alpha_vantage_weekly_data(symbol)
+        data = await enhanced_collector.get_alpha_vantage_weekly_data_async(symbol, http_session)
         if data.empty:
             raise HTTPException(status_code=404, detail=f"주별 데이터를 찾을 수 없습니다: {symbol}")
-        return data.to_dict('records')
+        return _records_response(data)
     except HTTPException:
         raise
     except (TimeoutError, ConnectionError, NetworkError) as e:
@@ -1441,18 +1926,19 @@ async def get_alpha_vantage_weekly(
          description="Alpha Vantage API를 사용하여 월별 주가 데이터를 조회합니다.",
          responses={
              200: {"description": "성공적으로 월별 데이터를 조회했습니다."},
-             404: {"description": "해당 종목의 데이터를 찾을 수 없습니다.", "model": ErrorResponse},
-             500: {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse}
+             404: STOCK_NOT_FOUND_RESPONSE,
+             500: SERVER_ERROR_RESPONSE
          })
 async def get_alpha_vantage_monthly(
     symbol: str = Path(..., description="주식 심볼", example="AAPL"),
-    enhanced_collector: StockDataCollector = Depends(get_enhanced_collector)
+    enhanced_collector: StockDataCollector = Depends(get_enhanced_collector),
+    http_session: aiohttp.ClientSession = Depends(get_http_session)
 ):
     try:
-        data = enhanced_collector.get_alpha_vantage_monthly_data(symbol)
+        data = await enhanced_collector.get_alpha_vantage_monthly_data_async(symbol, http_session)
         if data.empty:
             raise HTTPException(status_code=404, detail=f"월별 데이터를 찾을 수 없습니다: {symbol}")
-        return data.to_dict('records')
+        return _records_response(data)
     except HTTPException:
         raise
     except (TimeoutError, ConnectionError, NetworkError) as e:
@@ -1471,15 +1957,17 @@ async def get_alpha_vantage_monthly(
          response_model=EmailNotificationResponse,
          responses={
              200: {"description": "이메일이 성공적으로 발송되었습니다."},
-             400: {"description": "잘못된 요청입니다.", "model": ErrorResponse},
-             500: {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse}
+             400: BAD_REQUEST_RESPONSE,
+             500: SERVER_ERROR_RESPONSE
          })
 async def send_email_notification(
     to_email: Optional[str] = Query(None, description="수신자 이메일"),
     subject: Optional[str] = Query(None, description="이메일 제목"),
     body: Optional[str] = Query(None, description="이메일 내용"),
     request_body: Optional[EmailNotificationRequest] = Body(None, description="요청 본문"),
-    notification_service: NotificationService = Depends(get_notification_service)
+    background: bool = Query(False, description="대기열에 등록 후 즉시 응답"),
+    notification_service: NotificationService = Depends(get_notification_service),
+    email_queue: EmailQueue = Depends(get_email_queue)
 ):
     try:
         if request_body:
@@ -1497,7 +1985,7 @@ async def send_email_notification(
         if not email_config:
             error_msg = "이메일 설정이 없습니다. 환경 변수 EMAIL_SMTP_SERVER, EMAIL_USER, EMAIL_PASSWORD를 확인하세요."
             logger.error(error_msg, to_email=to_email)
-            NotificationLogger.log_notification(
+            NotificationLogger.log_notification_background(
                 user_email=to_email,
                 notification_type='email',
                 message=f"[API발송] {subject}\n{body}",
@@ -1520,7 +2008,7 @@ async def send_email_notification(
                 missing.append("EMAIL_PASSWORD")
             error_msg = f"이메일 설정이 완전하지 않습니다. 다음 환경 변수를 확인하세요: {', '.join(missing)}"
             logger.error(error_msg, to_email=to_email)
-            NotificationLogger.log_notification(
+            NotificationLogger.log_notification_background(
                 user_email=to_email,
                 notification_type='email',
                 message=f"[API발송] {subject}\n{body}",
@@ -1529,8 +2017,15 @@ async def send_email_notification(
             )
             raise HTTPException(status_code=500, detail=error_msg)
         
+        if background:
+            if not email_queue.enqueue(to_email, subject, body):
+                raise HTTPException(status_code=503, detail="이메일 발송 대기열이 가득 찼습니다.")
+            return EmailNotificationResponse(
+                success=True,
+                message="이메일 발송이 대기열에 등록되었습니다."
+            )
+        
         try:
-            import asyncio
             try:
                 success = await asyncio.to_thread(
                     notification_service.send_email,
@@ -1540,7 +2035,7 @@ async def send_email_notification(
                 )
                 
                 if success:
-                    NotificationLogger.log_notification(
+                    NotificationLogger.log_notification_background(
                         user_email=to_email,
                         notification_type='email',
                         message=f"[API발송] {subject}\n{body}",
@@ -1555,7 +2050,7 @@ async def send_email_notification(
                 else:
                     error_msg = "이메일 발송에 실패했습니다."
                     logger.error("이메일 발송 실패: success=False", to_email=to_email, subject=subject)
-                    NotificationLogger.log_notification(
+                    NotificationLogger.log_notification_background(
                         user_email=to_email,
                         notification_type='email',
                         message=f"[API발송] {subject}\n{body}",
@@ -1575,7 +2070,7 @@ async def send_email_notification(
         except EmailNotificationError as e:
             error_msg = f"이메일 발송 실패: {str(e)}"
             logger.error("이메일 발송 오류", exception=e, to_email=to_email, smtp_server=smtp_server, error_code=getattr(e, 'error_code', None))
-            NotificationLogger.log_notification(
+            NotificationLogger.log_notification_background(
                 user_email=to_email,
                 notification_type='email',
                 message=f"[API발송] {subject}\n{body}",
@@ -1588,7 +2083,7 @@ async def send_email_notification(
     except EmailNotificationError as e:
         error_msg = f"이메일 발송 오류: {str(e)}"
         logger.error("이메일 발송 오류 (외부 예외)", exception=e, to_email=to_email, error_code=getattr(e, 'error_code', None))
-        NotificationLogger.log_notification(
+        NotificationLogger.log_notification_background(
             user_email=to_email,
             notification_type='email',
             message=f"[API발송] {subject}\n{body}",
@@ -1599,7 +2094,7 @@ async def send_email_notification(
     except (smtplib.SMTPException, ConnectionError, TimeoutError) as e:
         error_msg = f"이메일 발송 네트워크 오류: {str(e)}"
         logger.error("이메일 발송 네트워크 오류", exception=e, to_email=to_email, smtp_server=smtp_server)
-        NotificationLogger.log_notification(
+        NotificationLogger.log_notification_background(
             user_email=to_email,
             notification_type='email',
             message=f"[API발송] {subject}\n{body}",
@@ -1610,7 +2105,7 @@ async def send_email_notification(
     except Exception as e:
         error_msg = f"이메일 발송 예상치 못한 오류: {str(e)}"
         logger.error("이메일 발송 예상치 못한 오류", exception=e, to_email=to_email, exc_info=True)
-        NotificationLogger.log_notification(
+        NotificationLogger.log_notification_background(
             user_email=to_email,
             notification_type='email',
             message=f"[API발송] {subject}\n{body}",
@@ -1625,8 +2120,8 @@ async def send_email_notification(
          response_model=SmsNotificationResponse,
          responses={
              200: {"description": "문자가 성공적으로 발송되었습니다."},
-             400: {"description": "잘못된 요청입니다.", "model": ErrorResponse},
-             500: {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse}
+             400: BAD_REQUEST_RESPONSE,
+             500: SERVER_ERROR_RESPONSE
          })
 async def send_sms_notification(
     from_phone: Optional[str] = Query(None, description="발신번호 (01012345678 형식)"),
@@ -1656,27 +2151,27 @@ async def send_sms_notification(
                 detail="발신번호가 설정되지 않았습니다. 환경 변수 SOLAPI_FROM_PHONE을 설정해주세요."
             )
         
-        from_phone = from_phone.replace("-", "").replace(" ", "")
-        to_phone = to_phone.replace("-", "").replace(" ", "")
+        from_phone = from_phone.translate(PHONE_NUMBER_STRIP_TABLE)
+        to_phone = to_phone.translate(PHONE_NUMBER_STRIP_TABLE)
         
-        phone_regex = r'^010\d{8}$'
-        if not re.match(phone_regex, from_phone):
+        if not PHONE_NUMBER_RE.match(from_phone):
             raise HTTPException(
                 status_code=400,
                 detail="발신번호 형식이 올바르지 않습니다. (01012345678 형식)"
             )
-        if not re.match(phone_regex, to_phone):
+        if not PHONE_NUMBER_RE.match(to_phone):
             raise HTTPException(
                 status_code=400,
                 detail="수신번호 형식이 올바르지 않습니다. (01012345678 형식)"
             )
-        success = notification_service.send_sms(
+        success = await asyncio.to_thread(
+            notification_service.send_sms,
             from_phone=from_phone,
             to_phone=to_phone,
             message=message
         )
         
-        NotificationLogger.log_notification(
+        NotificationLogger.log_notification_background(
             user_email=to_phone,
             notification_type='sms',
             message=f"[API발송] {message}",
@@ -1736,8 +2231,8 @@ async def get_sms_config():
          response_model=EmailNotificationResponse,
          responses={
              200: {"description": "이메일이 성공적으로 발송되었습니다."},
-             400: {"description": "잘못된 요청입니다.", "model": ErrorResponse},
-             500: {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse}
+             400: BAD_REQUEST_RESPONSE,
+             500: SERVER_ERROR_RESPONSE
          })
 async def send_realtime_email(
     to_email: str = Query(..., description="수신자 이메일"),
@@ -1748,13 +2243,14 @@ async def send_realtime_email(
     try:
         logger.info("실시간 이메일 발송 요청", to_email=to_email, subject=subject)
         
-        success = notification_service.send_email(
+        success = await asyncio.to_thread(
+            notification_service.send_email,
             to_email=to_email,
             subject=subject,
             body=body
         )
         
-        NotificationLogger.log_notification(
+        NotificationLogger.log_notification_background(
             user_email=to_email,
             notification_type='email',
             message=f"[실시간발송] {subject}\n{body}",
@@ -1795,8 +2291,8 @@ async def send_realtime_email(
          description="지정된 Airflow DAG를 즉시 실행합니다. 실시간 이벤트 발생 시 DAG를 트리거할 때 사용합니다.",
          responses={
              200: {"description": "DAG가 성공적으로 트리거되었습니다."},
-             400: {"description": "잘못된 요청입니다.", "model": ErrorResponse},
-             500: {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse}
+             400: BAD_REQUEST_RESPONSE,
+             500: SERVER_ERROR_RESPONSE
          })
 async def trigger_airflow_dag(
     dag_id: str = Query(..., description="트리거할 DAG ID (예: email_notification_dag)"),
@@ -1884,61 +2380,80 @@ async def websocket_endpoint(websocket: WebSocket, client_ip: str = "unknown") -
     await manager.connect(websocket, client_ip)
     try:
         while True:
-            data = await websocket.receive_text()
-            if data == "ping":
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            if message.get("bytes") == b"ping":
+                await websocket.send_bytes(b"pong")
+            elif message.get("text") == "ping":
                 await manager.send_personal_message("pong", websocket)
+            elif message.get("text") == "stats":
+                await manager.send_personal_message(manager.get_connection_stats_json(), websocket)
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket)
 
 @app.websocket("/ws/realtime")
 async def websocket_realtime(websocket: WebSocket, client_ip: str = "unknown") -> None:
-    await manager.connect(websocket, client_ip)
+    await realtime_manager.connect(websocket, client_ip)
     try:
-        if not hasattr(websocket.app.state, 'data_collector'):
-            await manager.send_personal_message(json.dumps({"error": "서비스 초기화 중입니다"}), websocket)
+        if not hasattr(websocket.app.state, 'realtime_wakeup'):
+            await realtime_manager.send_personal_message(REALTIME_NOT_READY_MESSAGE, websocket)
             return
         
-        api = StockAnalysisAPI(
-            data_collector=websocket.app.state.data_collector,
-            analyzer=websocket.app.state.analyzer,
-            security_manager=websocket.app.state.security_manager,
-            error_manager=websocket.app.state.error_manager,
-            news_collector=NewsCollector()
-        )
+        websocket.app.state.realtime_wakeup.set()
         while True:
-            try:
-                analysis_data = await api.get_all_symbols_analysis()
-                await manager.send_personal_message(json.dumps(analysis_data, default=str), websocket)
-                await asyncio.sleep(5)
-            except (StockAnalysisError, StockDataCollectionError) as e:
-                logger.error(f"WebSocket 스트리밍 분석 오류: {str(e)}")
-                await asyncio.sleep(1)
-            except WebSocketError as e:
-                logger.error(f"WebSocket 스트리밍 연결 오류: {str(e)}")
-                await asyncio.sleep(1)
-            except Exception as e:
-                logger.error(f"WebSocket 스트리밍 예상치 못한 오류: {str(e)}")
-                await asyncio.sleep(1)
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
+        pass
     except WebSocketConnectionError as e:
         logger.error(f"WebSocket 연결 오류: {str(e)}")
-        manager.disconnect(websocket)
+    finally:
+        realtime_manager.disconnect(websocket)
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "path": str(request.url)
-        }
+        },
+        headers=exc.headers
     )
 
+UPSTREAM_TIMEOUT_ERRORS = (asyncio.TimeoutError, builtins.TimeoutError, TimeoutError)
+UPSTREAM_ERRORS = UPSTREAM_TIMEOUT_ERRORS + (ConnectionError, NetworkError)
+
+def news_route_errors(label: str, timeout_detail: Optional[str] = None):
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except UPSTREAM_ERRORS as e:
+                logger.error(f"{label} 네트워크 오류: {str(e)}")
+                if timeout_detail is not None and isinstance(e, UPSTREAM_TIMEOUT_ERRORS):
+                    raise HTTPException(status_code=503, detail=timeout_detail) from e
+                raise HTTPException(status_code=503, detail=f"{label} 네트워크 오류: {str(e)}") from e
+            except Exception as e:
+                logger.error(f"{label} 예상치 못한 오류: {str(e)}")
+                message = str(e).lower()
+                if timeout_detail is not None and ("timeout" in message or "timed out" in message):
+                    raise HTTPException(status_code=503, detail=timeout_detail) from e
+                raise HTTPException(status_code=500, detail=f"{label} 오류: {str(e)}") from e
+        return wrapper
+    return decorator
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    error_id = f"ERR_{int(time.time())}_{hash(str(exc)) % 10000}"
+    error_id = new_error_id()
     
     if isinstance(exc, StockAnalysisBaseException):
         logger.error(
@@ -1947,26 +2462,26 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
             f"경로: {str(request.url)}, "
             f"원인: {type(exc.cause).__name__ if exc.cause else 'None'}"
         )
-        return JSONResponse(
+        return DefaultJSONResponse(
             status_code=500,
             content={
                 "error": str(exc),
                 "error_type": type(exc).__name__,
                 "error_code": exc.error_code,
                 "error_id": error_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(),
                 "path": str(request.url)
             }
         )
     
     logger.error(f"처리되지 않은 예외: {str(exc)}, 오류 ID: {error_id}, 경로: {str(request.url)}")
     
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=500,
         content={
             "error": "서버 내부 오류",
             "error_id": error_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "path": str(request.url)
         }
     )
@@ -1993,100 +2508,95 @@ async def _fetch_news_with_fallback(api: StockAnalysisAPI, symbol: str, include_
         logger.warning(f"뉴스 조회 오류: {symbol} - {str(e)}")
         return []
 
-@app.get("/api/news/{symbol}",
-         summary="종목별 뉴스 조회",
-         description="특정 종목에 관련된 뉴스를 조회합니다.",
-         response_model=List[NewsResponse],
-         responses={
-             200: {"description": "성공적으로 뉴스를 조회했습니다."},
-             500: {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse},
-             503: {"description": "서비스가 일시적으로 사용 불가능합니다.", "model": ErrorResponse}
-         })
-async def get_stock_news(
-    symbol: str = Path(..., description="주식 심볼", example="AAPL"),
-    include_korean: bool = Query(False, description="한국어 뉴스 포함 여부"),
-    auto_translate: bool = Query(False, description="한국어 뉴스 번역 여부"),
-    api: StockAnalysisAPI = Depends(get_stock_api)
-) -> List[NewsResponse]:
-    logger.info(f"뉴스 조회 요청: {symbol}, include_korean={include_korean}, auto_translate={auto_translate}")
-    
-    timeout_seconds = 20.0
-    news = await _fetch_news_with_fallback(api, symbol, include_korean, False, timeout_seconds)
-    
-    if not news:
-        logger.info(f"뉴스 조회 결과 없음: {symbol}")
-        return []
+async def _fetch_news_uncached(api: StockAnalysisAPI, symbol: str, include_korean: bool, timeout: float,
+                               semaphore: Optional[asyncio.Semaphore]) -> List[Dict[str, Any]]:
+    if semaphore is None:
+        return await _fetch_news_with_fallback(api, symbol, include_korean, False, timeout)
+    async with semaphore:
+        return await _fetch_news_with_fallback(api, symbol, include_korean, False, timeout)
+
+async def _fetch_news_cached(api: StockAnalysisAPI, symbol: str, include_korean: bool,
+                             timeout: float, semaphore: Optional[asyncio.Semaphore] = None) -> List[Dict[str, Any]]:
+    key = (symbol.upper(), include_korean)
+    cached = news_cache.get_fresh(key)
+    if cached is not None:
+        return cached
     
-    logger.info(f"뉴스 수집 완료: {symbol} - {len(news)}개")
-    try:
-        return [NewsResponse(**item) for item in news]
-    except Exception as e:
-        logger.error(f"뉴스 응답 변환 오류: {symbol} - {str(e)}", exc_info=True)
-        return []
+    news = await analysis_flights.do(('news',) + key, _fetch_news_uncached, api, key[0], include_korean, timeout, semaphore)
+    if news:
+        news_cache.set(key, news, NEWS_CACHE_TTL)
+    return news
+
+async def _search_news_body(api: StockAnalysisAPI, cache: RedisResponseCache, cache_key: str,
+                            query: str, language: str, max_results: int) -> bytes:
+    news = await asyncio.to_thread(api.news_collector.search_news, query, language=language, max_results=max_results)
+    body = encode_json([news_payload(item) for item in news])
+    if news:
+        await cache.set(cache_key, body, NEWS_SEARCH_CACHE_TTL)
+    return body
 
 @app.get("/api/news",
          summary="뉴스 검색",
          description="키워드로 뉴스를 검색합니다.",
          response_model=List[NewsResponse],
+         dependencies=[Depends(rate_limited(news_search_limiter))],
          responses={
              200: {"description": "성공적으로 뉴스를 검색했습니다."},
-             500: {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse}
+             429: RATE_LIMITED_RESPONSE,
+             500: SERVER_ERROR_RESPONSE,
+             503: {"description": "외부 뉴스 서비스가 응답하지 않습니다.", "model": ErrorResponse}
          })
+@news_route_errors("뉴스 검색")
 async def search_news(
     query: str = Query(..., description="검색 키워드", example="Apple"),
-    language: str = Query("en", description="언어 (en/ko)", example="en"),
+    language: NewsLanguage = Query(NewsLanguage.EN, description="언어 (en/ko)", example="en"),
     max_results: int = Query(20, description="최대 결과 수", ge=1, le=100),
-    api: StockAnalysisAPI = Depends(get_stock_api)
+    api: StockAnalysisAPI = Depends(get_stock_api),
+    cache: RedisResponseCache = Depends(get_redis_cache)
 ) -> List[NewsResponse]:
-    try:
-        news = api.news_collector.search_news(query, language=language, max_results=max_results)
-        return [NewsResponse(**item) for item in news]
-    except (TimeoutError, ConnectionError, NetworkError) as e:
-        logger.error(f"뉴스 검색 네트워크 오류: {str(e)}")
-        raise HTTPException(status_code=503, detail=f"뉴스 검색 네트워크 오류: {str(e)}") from e
-    except Exception as e:
-        logger.error(f"뉴스 검색 예상치 못한 오류: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"뉴스 검색 오류: {str(e)}") from e
+    cache_key = make_cache_key("news_search", query, language.value, max_results)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return cached_json_response(cached, "HIT")
+    
+    body = await analysis_flights.do(
+        cache_key, _search_news_body, api, cache, cache_key, query, language.value, max_results
+    )
+    return cached_json_response(body, "MISS")
 
 @app.get("/api/news/multiple",
          summary="다중 종목 뉴스 조회",
          description="여러 종목의 뉴스를 한번에 조회합니다.",
+         dependencies=[Depends(rate_limited(news_multiple_limiter))],
          responses={
              200: {"description": "성공적으로 뉴스를 조회했습니다."},
-             500: {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse}
+             429: RATE_LIMITED_RESPONSE,
+             500: SERVER_ERROR_RESPONSE,
+             503: {"description": "외부 뉴스 서비스가 응답하지 않습니다.", "model": ErrorResponse}
          })
+@news_route_errors("다중 종목 뉴스 조회")
 async def get_multiple_stock_news(
     symbols: str = Query(..., description="종목 심볼들 (쉼표로 구분)", example="AAPL,GOOGL,MSFT"),
     include_korean: bool = Query(False, description="한국어 뉴스 포함 여부"),
     api: StockAnalysisAPI = Depends(get_stock_api)
 ) -> Dict[str, List[NewsResponse]]:
-    try:
-        symbol_list = [s.strip().upper() for s in symbols.split(',')]
-        if len(symbol_list) > 10:
-            raise HTTPException(
-                status_code=400,
-                detail="Maximum 10 symbols allowed per request"
-            )
-        news_dict = api.news_collector.get_multiple_stock_news(symbol_list, include_korean=include_korean)
-        return {
-            symbol: [NewsResponse(**item) for item in news_list]
-            for symbol, news_list in news_dict.items()
-        }
-    except HTTPException:
-        raise
-    except (TimeoutError, ConnectionError, NetworkError) as e:
-        logger.error(f"다중 종목 뉴스 조회 네트워크 오류: {str(e)}")
-        raise HTTPException(status_code=503, detail=f"다중 종목 뉴스 조회 네트워크 오류: {str(e)}") from e
-    except Exception as e:
-        logger.error(f"다중 종목 뉴스 조회 예상치 못한 오류: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"다중 종목 뉴스 조회 오류: {str(e)}") from e
+    symbol_list = parse_symbol_list(symbols, "Maximum 10 symbols allowed per request")
+    semaphore = asyncio.Semaphore(NEWS_FETCH_CONCURRENCY)
+    news_lists = await asyncio.gather(*(
+        _fetch_news_cached(api, symbol, include_korean, 20.0, semaphore)
+        for symbol in symbol_list
+    ))
+    return DefaultJSONResponse({
+        symbol: [news_payload(item) for item in news_list]
+        for symbol, news_list in zip(symbol_list, news_lists)
+    })
 
 @app.get("/api/sectors",
          summary="섹터별 분석",
          description="섹터별로 그룹화된 종목 분석 결과를 조회합니다.",
          responses={
              200: {"description": "성공적으로 섹터별 분석 결과를 조회했습니다."},
-             500: {"description": "서버 내부 오류가 발생했습니다.", "model": ErrorResponse}
+             500: SERVER_ERROR_RESPONSE
          })
 async def get_sectors_analysis(
     api: StockAnalysisAPI = Depends(get_stock_api),
@@ -2225,64 +2735,106 @@ async def get_sectors_analysis(
             }
         ]
 
+def _decode_news_url(url: str) -> str:
+    decoded_url = url
+    for _ in range(3):
+        if '%' not in decoded_url:
+            break
+        decoded_url = unquote(decoded_url, encoding='utf-8')
+    return decoded_url.replace('&amp;', '&')
+
+async def _news_detail_body(api: StockAnalysisAPI, cache: RedisResponseCache, cache_key: str,
+                            decoded_url: str) -> Optional[bytes]:
+    news = await asyncio.wait_for(
+        asyncio.to_thread(
+            api.news_collector.get_news_by_url,
+            decoded_url
+        ),
+        timeout=25.0
+    )
+    if not news:
+        return None
+    
+    body = encode_json(news_payload(news))
+    news_detail_cache.set((decoded_url,), body, NEWS_DETAIL_LOCAL_CACHE_TTL)
+    await cache.set(cache_key, body, NEWS_DETAIL_CACHE_TTL)
+    return body
+
 @app.get("/api/news/detail",
          summary="뉴스 상세보기",
          description="뉴스 URL로 상세 정보를 조회합니다.")
+@news_route_errors("뉴스 상세 조회", timeout_detail=NEWS_DETAIL_TIMEOUT_DETAIL)
 async def get_news_detail(
+    request: Request,
     url: str = Query(..., description="뉴스 URL"),
-    api: StockAnalysisAPI = Depends(get_stock_api)
+    api: StockAnalysisAPI = Depends(get_stock_api),
+    cache: RedisResponseCache = Depends(get_redis_cache)
 ) -> NewsResponse:
-    try:
-        import urllib.parse
-        decoded_url = url
-        for _ in range(3):
-            try:
-                decoded_url = urllib.parse.unquote(decoded_url, encoding='utf-8')
-            except Exception:
-                break
-        
-        decoded_url = decoded_url.replace('&amp;', '&')
-        
-        logger.info(f"뉴스 상세 조회 요청: url={url[:100]}..., decoded_url={decoded_url[:100]}...")
-        
-        news = await asyncio.wait_for(
-            asyncio.to_thread(
-                api.news_collector.get_news_by_url,
-                decoded_url
-            ),
-            timeout=25.0
-        )
-        if not news:
-            logger.warning(f"뉴스를 찾을 수 없습니다: {decoded_url[:100]}...")
-            raise HTTPException(status_code=404, detail="뉴스를 찾을 수 없습니다.")
-        
-        return NewsResponse(**news)
-    except HTTPException:
-        raise
-    except asyncio.TimeoutError:
-        logger.warning(f"뉴스 상세 조회 타임아웃: url={url[:100]}...")
-        raise HTTPException(status_code=503, detail="뉴스 상세 조회 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.")
-    except TimeoutError as e:
-        logger.warning(f"뉴스 상세 조회 타임아웃: url={url[:100]}...")
-        raise HTTPException(status_code=503, detail="뉴스 상세 조회 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.") from e
-    except (ConnectionError, NetworkError) as e:
-        logger.error(f"뉴스 상세 조회 네트워크 오류: url={url[:100]}..., error={str(e)}", exc_info=True)
-        raise HTTPException(status_code=503, detail=f"뉴스 상세 조회 네트워크 오류: {str(e)}") from e
-    except Exception as e:
-        logger.error(f"뉴스 상세 조회 예상치 못한 오류: url={url[:100]}..., error={str(e)}", exc_info=True)
-        if "timeout" in str(e).lower() or "timed out" in str(e).lower():
-            raise HTTPException(status_code=503, detail="뉴스 상세 조회 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.") from e
-        raise HTTPException(status_code=500, detail=f"뉴스 상세 조회 오류: {str(e)}") from e
+    decoded_url = _decode_news_url(url)
+    
+    logger.info(f"뉴스 상세 조회 요청: url={url[:100]}..., decoded_url={decoded_url[:100]}...")
+    
+    local_key = (decoded_url,)
+    cached = news_detail_cache.get_fresh(local_key)
+    if cached is not None:
+        return conditional_json_response(request, cached, "HIT")
+    
+    cache_key = make_cache_key("news_detail", decoded_url)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        news_detail_cache.set(local_key, cached, NEWS_DETAIL_LOCAL_CACHE_TTL)
+        return conditional_json_response(request, cached, "HIT")
+    
+    body = await analysis_flights.do(cache_key, _news_detail_body, api, cache, cache_key, decoded_url)
+    if body is None:
+        logger.warning(f"뉴스를 찾을 수 없습니다: {decoded_url[:100]}...")
+        raise HTTPException(status_code=404, detail="뉴스를 찾을 수 없습니다.")
+    return conditional_json_response(request, body, "MISS")
+
+@app.get("/api/news/{symbol}",
+         summary="종목별 뉴스 조회",
+         description="특정 종목에 관련된 뉴스를 조회합니다.",
+         response_model=List[NewsResponse],
+         responses={
+             200: {"description": "성공적으로 뉴스를 조회했습니다."},
+             500: SERVER_ERROR_RESPONSE,
+             503: {"description": "서비스가 일시적으로 사용 불가능합니다.", "model": ErrorResponse}
+         })
+async def get_stock_news(
+    symbol: str = Path(..., description="주식 심볼", example="AAPL"),
+    include_korean: bool = Query(False, description="한국어 뉴스 포함 여부"),
+    auto_translate: bool = Query(False, description="한국어 뉴스 번역 여부"),
+    api: StockAnalysisAPI = Depends(get_stock_api)
+) -> List[NewsResponse]:
+    logger.info(f"뉴스 조회 요청: {symbol}, include_korean={include_korean}, auto_translate={auto_translate}")
+    
+    timeout_seconds = 20.0
+    news = await _fetch_news_cached(api, symbol, include_korean, timeout_seconds)
+    
+    if not news:
+        logger.info(f"뉴스 조회 결과 없음: {symbol}")
+        return []
+    
+    logger.info(f"뉴스 수집 완료: {symbol} - {len(news)}개")
+    return DefaultJSONResponse([news_payload(item) for item in news])
 
 
 if __name__ == "__main__":
     import platform
-    reload_enabled = platform.system() != 'Windows'
+    workers = int(os.getenv('WEB_CONCURRENCY', '1'))
+    reload_enabled = platform.system() != 'Windows' and workers == 1
     uvicorn.run(
-        app, 
+        "api_server_enhanced:app",
         host="0.0.0.0", 
         port=9000,
         reload=reload_enabled,
+        workers=workers,
+        loop="auto",
+        http="auto",
         timeout_keep_alive=75,
-        timeout_graceful_shutdown=10
+        timeout_graceful_shutdown=10,
+        ws_ping_interval=20,
+        ws_ping_timeout=20,
+        ws_per_message_deflate=False,
+        access_log=False
     )
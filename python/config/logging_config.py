@@ -2,12 +2,18 @@ import logging
 import json
 import sys
 import os
+import queue
+import atexit
+import threading
 import traceback
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 from enum import Enum
 
+LOG_QUEUE_ENABLED = os.getenv("LOG_QUEUE_ENABLED", "true").lower() == "true"
+
 class LogLevel(Enum):
     DEBUG = "DEBUG"
     INFO = "INFO"
@@ -41,7 +47,7 @@ class StructuredLogger:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(self.log_level)
         console_handler.setFormatter(StructuredFormatter())
-        self.logger.addHandler(console_handler)
+        handlers = [console_handler]
         
         if log_file:
             log_path = Path(log_file)
@@ -49,7 +55,9 @@ class StructuredLogger:
             file_handler = logging.FileHandler(log_file, encoding='utf-8')
             file_handler.setLevel(self.log_level)
             file_handler.setFormatter(StructuredFormatter())
-            self.logger.addHandler(file_handler)
+            handlers.append(file_handler)
+        
+        _attach_handlers(self.logger, self.name, handlers)
     
     def _create_log_entry(self, level: str, message: str, **context: Any) -> Dict[str, Any]:
         entry = {
@@ -159,6 +167,75 @@ class StructuredFormatter(logging.Formatter):
         except Exception:
             return super().format(record)
 
+class ChannelQueueHandler(QueueHandler):
+    def __init__(self, log_queue: queue.SimpleQueue, channel: str):
+        super().__init__(log_queue)
+        self.channel = channel
+        self.setFormatter(StructuredFormatter())
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.log_channel = self.channel
+        return record
+
+class ChannelDispatchHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.channels: Dict[str, List[logging.Handler]] = {}
+    
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in self.channels.get(getattr(record, 'log_channel', None), ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_dispatcher = ChannelDispatchHandler()
+_log_listener: Optional[QueueListener] = None
+_log_listener_lock = threading.Lock()
+
+def _ensure_log_listener() -> None:
+    global _log_listener
+    with _log_listener_lock:
+        if _log_listener is None:
+            _log_listener = QueueListener(_log_queue, _log_dispatcher)
+            _log_listener.start()
+            atexit.register(stop_log_listener)
+
+def stop_log_listener() -> None:
+    global _log_listener
+    with _log_listener_lock:
+        listener = _log_listener
+        _log_listener = None
+    if listener is not None:
+        listener.stop()
+
+def _reset_log_listener_after_fork() -> None:
+    global _log_listener, _log_listener_lock
+    inherited_listener = _log_listener is not None
+    _log_listener = None
+    _log_listener_lock = threading.Lock()
+    while True:
+        try:
+            _log_queue.get_nowait()
+        except queue.Empty:
+            break
+    if inherited_listener:
+        _ensure_log_listener()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_log_listener_after_fork)
+
+def _attach_handlers(logger: logging.Logger, channel: str, handlers: List[logging.Handler]) -> None:
+    if not LOG_QUEUE_ENABLED:
+        for handler in handlers:
+            logger.addHandler(handler)
+        return
+    
+    _log_dispatcher.channels[channel] = handlers
+    logger.addHandler(ChannelQueueHandler(_log_queue, channel))
+    _ensure_log_listener()
+
 def get_logger(name: str, log_file: Optional[str] = None, level: Optional[int] = None) -> StructuredLogger:
     return StructuredLogger(name, log_file, level)
 
@@ -177,10 +254,12 @@ def setup_logging(log_file: Optional[str] = None, level: Optional[int] = None) -
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(StructuredFormatter())
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     if log_file:
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(log_level)
         file_handler.setFormatter(StructuredFormatter())
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    _attach_handlers(root_logger, root_logger.name, handlers)
@@ -1,9 +1,11 @@
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 import time
 import warnings
 import os
 from datetime import datetime, timedelta
+from enum import Enum
 from typing import Dict, List, Optional
 import json
 import re
@@ -15,6 +17,18 @@ from functools import wraps
 
 warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 
+NEWS_HTTP_POOL_CONNECTIONS = 20
+NEWS_HTTP_POOL_MAXSIZE = 50
+
+class NewsLanguage(str, Enum):
+    EN = 'en'
+    KO = 'ko'
+
+GOOGLE_NEWS_REGIONS = {
+    NewsLanguage.EN.value: {'gl': 'US', 'ceid': 'US:en'},
+    NewsLanguage.KO.value: {'gl': 'KR', 'ceid': 'KR:ko'}
+}
+
 GOOGLETRANS_AVAILABLE = False
 HUGGINGFACE_AVAILABLE = False
 
@@ -43,6 +57,9 @@ class NewsCollector:
     
     def __init__(self):
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=NEWS_HTTP_POOL_CONNECTIONS, pool_maxsize=NEWS_HTTP_POOL_MAXSIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
@@ -249,8 +266,7 @@ class NewsCollector:
             params = {
                 'q': symbol,
                 'hl': language,
-                'gl': 'US' if language == 'en' else 'KR',
-                'ceid': 'US:en' if language == 'en' else 'KR:ko'
+                **GOOGLE_NEWS_REGIONS.get(language, GOOGLE_NEWS_REGIONS[NewsLanguage.KO.value])
             }
             
             response = self.session.get(url, params=params, timeout=8)
@@ -500,7 +516,7 @@ class NewsCollector:
         except:
             pass
         
-        if language == 'ko':
+        if language == NewsLanguage.KO.value:
             try:
                 naver_news = self.get_naver_news(query, max_results=max_results)
                 all_news.extend(naver_news)
@@ -5,6 +5,7 @@ import numpy as np
 import redis
 import json
 import time
+import zlib
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union, Tuple
@@ -19,6 +20,8 @@ import statistics
 from config.settings import settings
 from error_handling.error_manager import ErrorManager, ErrorSeverity, ErrorCategory, CircuitBreaker, RetryStrategy
 
+PRICE_COLUMNS = ('open', 'high', 'low', 'close')
+
 @dataclass
 class DataRequest:
     symbol: str
@@ -537,20 +540,14 @@ class PerformanceOptimizedCollector:
                 return pd.DataFrame()
             
             quote = indicators['quote'][0]
-            df_data = []
-            
-            for i, timestamp in enumerate(timestamps):
-                df_data.append({
-                    'date': pd.to_datetime(timestamp, unit='s'),
-                    'open': float(quote.get('open', [0])[i] or 0),
-                    'high': float(quote.get('high', [0])[i] or 0),
-                    'low': float(quote.get('low', [0])[i] or 0),
-                    'close': float(quote.get('close', [0])[i] or 0),
-                    'volume': int(quote.get('volume', [0])[i] or 0),
-                    'symbol': symbol
-                })
-            
-            df = pd.DataFrame(df_data)
+            size = len(timestamps)
+            columns = {'date': pd.to_datetime(np.asarray(timestamps, dtype=np.int64), unit='s')}
+            for column in PRICE_COLUMNS:
+                columns[column] = self._quote_column(quote, column, size)
+            columns['volume'] = self._quote_column(quote, 'volume', size).astype(np.int64)
+            columns['symbol'] = symbol
+            
+            df = pd.DataFrame(columns)
             df = df.sort_values('date').reset_index(drop=True)
             return df
         
@@ -558,16 +555,25 @@ class PerformanceOptimizedCollector:
             logging.error(f"{symbol}에 대한 Yahoo 과거 데이터 응답 파싱 오류: {e}")
             return pd.DataFrame()
     
+    @staticmethod
+    def _quote_column(quote: Dict, column: str, size: int) -> np.ndarray:
+        raw = quote.get(column) or []
+        values = np.zeros(size, dtype=np.float64)
+        count = min(size, len(raw))
+        values[:count] = np.array(raw[:count], dtype=np.float64)
+        return np.nan_to_num(values, nan=0.0)
+    
     async def _generate_enhanced_mock_data(self, symbol: str) -> Dict:
-        np.random.seed(hash(symbol) % 2**32)
+        seed = zlib.crc32(symbol.encode('utf-8'))
+        rng = np.random.default_rng(seed)
         
-        symbol_hash = hash(symbol) % 1000
+        symbol_hash = seed % 1000
         base_price = 50 + (symbol_hash % 500)
         
         market_trend = np.sin(time.time() / 86400) * 0.1
         volatility = 0.02 + (symbol_hash % 10) / 1000
         
-        price_change = np.random.normal(market_trend, volatility)
+        price_change = rng.normal(market_trend, volatility)
         new_price = base_price * (1 + price_change)
         
         volume_base = 1000000 + (symbol_hash % 4000000)
@@ -583,9 +589,9 @@ class PerformanceOptimizedCollector:
             'volume': volume,
             'change': float(new_price * change_percent / 100),
             'change_percent': float(change_percent),
-            'high': float(new_price * (1 + abs(np.random.normal(0, 0.01)))),
-            'low': float(new_price * (1 - abs(np.random.normal(0, 0.01)))),
-            'open': float(new_price * (1 + np.random.normal(0, 0.005))),
+            'high': float(new_price * (1 + abs(rng.normal(0, 0.01)))),
+            'low': float(new_price * (1 - abs(rng.normal(0, 0.01)))),
+            'open': float(new_price * (1 + rng.normal(0, 0.005))),
             'market_cap': int(new_price * (1000000000 + symbol_hash * 1000000)),
             'pe_ratio': float(15 + (symbol_hash % 20))
         }
@@ -596,24 +602,25 @@ class PerformanceOptimizedCollector:
         start_date = end_date - timedelta(days=days)
         dates = pd.date_range(start=start_date, end=end_date, freq='D')
         
-        np.random.seed(hash(symbol) % 2**32)
+        seed = zlib.crc32(symbol.encode('utf-8'))
+        rng = np.random.default_rng(seed)
         
-        symbol_hash = hash(symbol) % 1000
+        symbol_hash = seed % 1000
         base_price = 50 + (symbol_hash % 500)
         
         trend = np.sin(np.linspace(0, 2 * np.pi, len(dates))) * 0.05
         volatility = 0.02 + (symbol_hash % 10) / 1000
         
-        price_changes = np.random.normal(trend, volatility, len(dates))
+        price_changes = rng.normal(trend, volatility, len(dates))
         prices = base_price * np.exp(np.cumsum(price_changes))
         
-        opens = prices * (1 + np.random.normal(0, 0.01, len(dates)))
-        highs = np.maximum(opens, prices) * (1 + np.random.uniform(0, 0.02, len(dates)))
-        lows = np.minimum(opens, prices) * (1 - np.random.uniform(0, 0.02, len(dates)))
+        opens = prices * (1 + rng.normal(0, 0.01, len(dates)))
+        highs = np.maximum(opens, prices) * (1 + rng.uniform(0, 0.02, len(dates)))
+        lows = np.minimum(opens, prices) * (1 - rng.uniform(0, 0.02, len(dates)))
         closes = prices
         
         volume_base = 1000000 + (symbol_hash % 4000000)
-        volumes = (volume_base * (1 + np.random.normal(0, 0.2, len(dates)))).astype(int)
+        volumes = (volume_base * (1 + rng.normal(0, 0.2, len(dates)))).astype(int)
         volumes = np.maximum(100000, volumes)
         
         return pd.DataFrame({
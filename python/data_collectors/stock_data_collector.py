@@ -1,7 +1,10 @@
 import yfinance as yf
 import pandas as pd
 import requests
+import asyncio
+import aiohttp
 import time
+import zlib
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union
@@ -43,6 +46,7 @@ class StockDataCollector:
         self.last_request_time = {}  
         self.rate_limit_backoff = {} 
         self.min_delay_between_requests = 2.0  
+        self.alpha_vantage_semaphore = asyncio.Semaphore(5)
         
     def get_historical_data(self, symbol: str, period: str = "1mo") -> pd.DataFrame:
         if self.use_mock_data:
@@ -437,26 +441,7 @@ class StockDataCollector:
             response.raise_for_status()
             data = response.json()
             
-            if 'Time Series (Daily)' in data:
-                time_series = data['Time Series (Daily)']
-                df_data = []
-                
-                for date, values in time_series.items():
-                    df_data.append({
-                        'date': pd.to_datetime(date),
-                        'open': float(values['1. open']),
-                        'high': float(values['2. high']),
-                        'low': float(values['3. low']),
-                        'close': float(values['4. close']),
-                        'volume': int(values['5. volume']),
-                        'symbol': symbol
-                    })
-                
-                df = pd.DataFrame(df_data)
-                df = df.sort_values('date').reset_index(drop=True)
-                return df
-            else:
-                return pd.DataFrame()
+            return self._parse_alpha_vantage_time_series(data, 'Time Series (Daily)', 'date', symbol)
                 
         except requests.exceptions.Timeout as e:
             logger.warning("Alpha Vantage 일별 데이터 타임아웃", symbol=symbol, exception=e, component="StockDataCollector")
@@ -486,26 +471,7 @@ class StockDataCollector:
             response.raise_for_status()
             data = response.json()
             
-            if f'Time Series ({interval})' in data:
-                time_series = data[f'Time Series ({interval})']
-                df_data = []
-                
-                for datetime_str, values in time_series.items():
-                    df_data.append({
-                        'datetime': pd.to_datetime(datetime_str),
-                        'open': float(values['1. open']),
-                        'high': float(values['2. high']),
-                        'low': float(values['3. low']),
-                        'close': float(values['4. close']),
-                        'volume': int(values['5. volume']),
-                        'symbol': symbol
-                    })
-                
-                df = pd.DataFrame(df_data)
-                df = df.sort_values('datetime').reset_index(drop=True)
-                return df
-            else:
-                return pd.DataFrame()
+            return self._parse_alpha_vantage_time_series(data, f'Time Series ({interval})', 'datetime', symbol)
                 
         except requests.exceptions.Timeout as e:
             logger.warning("Alpha Vantage 일별 데이터 타임아웃", symbol=symbol, exception=e, component="StockDataCollector")
@@ -533,26 +499,7 @@ class StockDataCollector:
             response.raise_for_status()
             data = response.json()
             
-            if 'Weekly Time Series' in data:
-                time_series = data['Weekly Time Series']
-                df_data = []
-                
-                for date, values in time_series.items():
-                    df_data.append({
-                        'date': pd.to_datetime(date),
-                        'open': float(values['1. open']),
-                        'high': float(values['2. high']),
-                        'low': float(values['3. low']),
-                        'close': float(values['4. close']),
-                        'volume': int(values['5. volume']),
-                        'symbol': symbol
-                    })
-                
-                df = pd.DataFrame(df_data)
-                df = df.sort_values('date').reset_index(drop=True)
-                return df
-            else:
-                return pd.DataFrame()
+            return self._parse_alpha_vantage_time_series(data, 'Weekly Time Series', 'date', symbol)
                 
         except requests.exceptions.Timeout as e:
             logger.warning("Alpha Vantage 일별 데이터 타임아웃", symbol=symbol, exception=e, component="StockDataCollector")
@@ -580,26 +527,7 @@ class StockDataCollector:
             response.raise_for_status()
             data = response.json()
             
-            if 'Monthly Time Series' in data:
-                time_series = data['Monthly Time Series']
-                df_data = []
-                
-                for date, values in time_series.items():
-                    df_data.append({
-                        'date': pd.to_datetime(date),
-                        'open': float(values['1. open']),
-                        'high': float(values['2. high']),
-                        'low': float(values['3. low']),
-                        'close': float(values['4. close']),
-                        'volume': int(values['5. volume']),
-                        'symbol': symbol
-                    })
-                
-                df = pd.DataFrame(df_data)
-                df = df.sort_values('date').reset_index(drop=True)
-                return df
-            else:
-                return pd.DataFrame()
+            return self._parse_alpha_vantage_time_series(data, 'Monthly Time Series', 'date', symbol)
                 
         except requests.exceptions.Timeout as e:
             logger.warning("Alpha Vantage 일별 데이터 타임아웃", symbol=symbol, exception=e, component="StockDataCollector")
@@ -614,6 +542,91 @@ class StockDataCollector:
             logger.warning("Alpha Vantage 일별 데이터 예상치 못한 오류", symbol=symbol, exception=e, component="StockDataCollector")
             return pd.DataFrame()
     
+    def _parse_alpha_vantage_time_series(self, data: Dict, series_key: str, time_column: str, symbol: str) -> pd.DataFrame:
+        if series_key not in data:
+            return pd.DataFrame()
+        
+        df_data = []
+        for time_str, values in data[series_key].items():
+            df_data.append({
+                time_column: pd.to_datetime(time_str),
+                'open': float(values['1. open']),
+                'high': float(values['2. high']),
+                'low': float(values['3. low']),
+                'close': float(values['4. close']),
+                'volume': int(values['5. volume']),
+                'symbol': symbol
+            })
+        
+        df = pd.DataFrame(df_data)
+        df = df.sort_values(time_column).reset_index(drop=True)
+        return df
+    
+    async def _fetch_alpha_vantage_time_series_async(self, session: aiohttp.ClientSession, params: Dict,
+                                                     series_key: str, time_column: str, symbol: str) -> pd.DataFrame:
+        url = "https://www.alphavantage.co/query"
+        params = {**params, 'symbol': symbol, 'apikey': self.alpha_vantage_api_key}
+        
+        try:
+            async with self.alpha_vantage_semaphore:
+                async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+            
+            return self._parse_alpha_vantage_time_series(data, series_key, time_column, symbol)
+            
+        except asyncio.TimeoutError as e:
+            logger.warning("Alpha Vantage 시계열 데이터 타임아웃", symbol=symbol, exception=e, component="StockDataCollector")
+            return pd.DataFrame()
+        except aiohttp.ClientError as e:
+            logger.warning("Alpha Vantage 시계열 데이터 요청 오류", symbol=symbol, exception=e, component="StockDataCollector")
+            return pd.DataFrame()
+        except (ValueError, KeyError) as e:
+            logger.warning("Alpha Vantage 시계열 데이터 파싱 오류", symbol=symbol, exception=e, component="StockDataCollector")
+            return pd.DataFrame()
+        except Exception as e:
+            logger.warning("Alpha Vantage 시계열 데이터 예상치 못한 오류", symbol=symbol, exception=e, component="StockDataCollector")
+            return pd.DataFrame()
+    
+    async def get_alpha_vantage_intraday_data_async(self, symbol: str, session: aiohttp.ClientSession,
+                                                    interval: str = "5min", outputsize: str = "compact") -> pd.DataFrame:
+        params = {
+            'function': 'TIME_SERIES_INTRADAY',
+            'interval': interval,
+            'outputsize': outputsize
+        }
+        return await self._fetch_alpha_vantage_time_series_async(
+            session, params, f'Time Series ({interval})', 'datetime', symbol
+        )
+    
+    async def get_alpha_vantage_weekly_data_async(self, symbol: str, session: aiohttp.ClientSession) -> pd.DataFrame:
+        params = {'function': 'TIME_SERIES_WEEKLY'}
+        return await self._fetch_alpha_vantage_time_series_async(
+            session, params, 'Weekly Time Series', 'date', symbol
+        )
+    
+    async def get_alpha_vantage_monthly_data_async(self, symbol: str, session: aiohttp.ClientSession) -> pd.DataFrame:
+        params = {'function': 'TIME_SERIES_MONTHLY'}
+        return await self._fetch_alpha_vantage_time_series_async(
+            session, params, 'Monthly Time Series', 'date', symbol
+        )
+    
+    def _parse_alpha_vantage_search(self, data: Dict) -> List[Dict]:
+        return [
+            {
+                'symbol': match['1. symbol'],
+                'name': match['2. name'],
+                'type': match['3. type'],
+                'region': match['4. region'],
+                'market_open': match['5. marketOpen'],
+                'market_close': match['6. marketClose'],
+                'timezone': match['7. timezone'],
+                'currency': match['8. currency'],
+                'match_score': float(match['9. matchScore'])
+            }
+            for match in data.get('bestMatches', [])
+        ]
+    
     def search_alpha_vantage_symbols(self, keywords: str) -> List[Dict]:
         try:
             url = "https://www.alphavantage.co/query"
@@ -625,29 +638,29 @@ class StockDataCollector:
             
             response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
-            data = response.json()
-            
-            if 'bestMatches' in data:
-                matches = []
-                for match in data['bestMatches']:
-                    matches.append({
-                        'symbol': match['1. symbol'],
-                        'name': match['2. name'],
-                        'type': match['3. type'],
-                        'region': match['4. region'],
-                        'market_open': match['5. marketOpen'],
-                        'market_close': match['6. marketClose'],
-                        'timezone': match['7. timezone'],
-                        'currency': match['8. currency'],
-                        'match_score': float(match['9. matchScore'])
-                    })
-                return matches
-            else:
-                return []
+            return self._parse_alpha_vantage_search(response.json())
                 
         except Exception as e:
             return []
     
+    async def search_alpha_vantage_symbols_async(self, keywords: str, session: aiohttp.ClientSession) -> List[Dict]:
+        url = "https://www.alphavantage.co/query"
+        params = {
+            'function': 'SYMBOL_SEARCH',
+            'keywords': keywords,
+            'apikey': self.alpha_vantage_api_key
+        }
+        
+        try:
+            async with self.alpha_vantage_semaphore:
+                async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+            return self._parse_alpha_vantage_search(data)
+        except Exception as e:
+            logger.warning("Alpha Vantage 종목 검색 오류", keywords=keywords, exception=e, component="StockDataCollector")
+            return []
+    
     def collect_batch_data(self) -> Dict[str, pd.DataFrame]:
         all_data = {}
         
@@ -662,9 +675,10 @@ class StockDataCollector:
         return all_data
     
     def _generate_mock_realtime_data(self, symbol: str) -> Dict:
-        np.random.seed(hash(symbol) % 2**32)
+        seed = zlib.crc32(symbol.encode('utf-8'))
+        rng = np.random.default_rng(seed)
         
-        symbol_hash = hash(symbol) % 1000
+        symbol_hash = seed % 1000
         base_price = 50 + (symbol_hash % 500)
         
         if symbol in self.mock_data_cache:
@@ -676,14 +690,14 @@ class StockDataCollector:
             volatility = 0.02 + (symbol_hash % 10) / 1000
             momentum = previous_change / 100 * 0.3
             
-            price_change = np.random.normal(market_trend + momentum, volatility)
+            price_change = rng.normal(market_trend + momentum, volatility)
             new_price = previous_price * (1 + price_change)
             new_change_percent = previous_change * 0.7 + price_change * 100 * 0.3
         else:
             market_trend = np.sin(time.time() / 86400) * 0.1
             volatility = 0.02 + (symbol_hash % 10) / 1000
             
-            price_change = np.random.normal(market_trend, volatility)
+            price_change = rng.normal(market_trend, volatility)
             new_price = base_price * (1 + price_change)
             new_change_percent = price_change * 100
         
@@ -694,7 +708,7 @@ class StockDataCollector:
         market_cap_base = 1000000000 + symbol_hash * 1000000
         market_cap = int(new_price * market_cap_base / base_price)
         
-        pe_ratio = 15 + (symbol_hash % 20) + np.random.normal(0, 2)
+        pe_ratio = 15 + (symbol_hash % 20) + rng.normal(0, 2)
         
         high_52w = new_price * (1.1 + (symbol_hash % 40) / 100)
         low_52w = new_price * (0.5 + (symbol_hash % 40) / 100)
@@ -723,25 +737,26 @@ class StockDataCollector:
         start_date = end_date - timedelta(days=days)
         dates = pd.date_range(start=start_date, end=end_date, freq='D')
         
-        np.random.seed(hash(symbol) % 2**32)
+        seed = zlib.crc32(symbol.encode('utf-8'))
+        rng = np.random.default_rng(seed)
         
-        symbol_hash = hash(symbol) % 1000
+        symbol_hash = seed % 1000
         base_price = 50 + (symbol_hash % 500)
         
         trend = np.sin(np.linspace(0, 2 * np.pi, len(dates))) * 0.05
         volatility = 0.02 + (symbol_hash % 10) / 1000
         
-        price_changes = np.random.normal(trend, volatility, len(dates))
+        price_changes = rng.normal(trend, volatility, len(dates))
         prices = base_price * np.exp(np.cumsum(price_changes))
         
-        opens = prices * (1 + np.random.normal(0, 0.01, len(dates)))
-        highs = np.maximum(opens, prices) * (1 + np.random.uniform(0, 0.02, len(dates)))
-        lows = np.minimum(opens, prices) * (1 - np.random.uniform(0, 0.02, len(dates)))
+        opens = prices * (1 + rng.normal(0, 0.01, len(dates)))
+        highs = np.maximum(opens, prices) * (1 + rng.uniform(0, 0.02, len(dates)))
+        lows = np.minimum(opens, prices) * (1 - rng.uniform(0, 0.02, len(dates)))
         closes = prices
         
         volume_base = 1000000 + (symbol_hash % 4000000)
         daily_volatility = np.abs(np.diff(prices, prepend=prices[0])) / prices
-        volumes = (volume_base * (1 + daily_volatility * 10 + np.random.normal(0, 0.2, len(dates)))).astype(int)
+        volumes = (volume_base * (1 + daily_volatility * 10 + rng.normal(0, 0.2, len(dates)))).astype(int)
         volumes = np.maximum(100000, volumes)
         
         mock_data = pd.DataFrame({
@@ -4,6 +4,7 @@ import sys
 import time
 import json
 import re
+import secrets
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union, Callable, Any, Tuple
 from dataclasses import dataclass, asdict, field
@@ -23,6 +24,9 @@ from config.settings import get_settings
 
 settings = get_settings()
 
+def new_error_id() -> str:
+    return f"ERR_{secrets.token_hex(6)}"
+
 class ErrorSeverity(Enum):
     LOW = "low"
     MEDIUM = "medium"
@@ -148,7 +152,7 @@ class ErrorManager:
                   context: Optional[ErrorContext] = None) -> str:
         
         with self.lock:
-            error_id = f"ERR_{int(time.time())}_{hash(message) % 10000}"
+            error_id = new_error_id()
             
             if context is None:
                 context = ErrorContext()
@@ -1,6 +1,7 @@
 import asyncio
 import sys
 import os
+import zlib
 from datetime import datetime
 from typing import List, Dict
 
@@ -138,16 +139,17 @@ class StockAnalysisSystem:
         import numpy as np
         
         dates = pd.date_range(start=datetime.now() - pd.Timedelta(days=30), end=datetime.now(), freq='D')
-        np.random.seed(hash(symbol) % 2**32)
+        seed = zlib.crc32(symbol.encode('utf-8'))
+        rng = np.random.default_rng(seed)
         
-        base_price = 100 + hash(symbol) % 200
-        price_changes = np.random.randn(len(dates)) * 2
+        base_price = 100 + seed % 200
+        price_changes = rng.standard_normal(len(dates)) * 2
         prices = base_price + np.cumsum(price_changes)
         
         return pd.DataFrame({
             'date': dates,
             'close': prices,
-            'volume': np.random.randint(1000000, 5000000, len(dates))
+            'volume': rng.integers(1000000, 5000000, len(dates))
         })
     
     def _process_notifications(self, analysis_results: List[Dict]) -> Dict:
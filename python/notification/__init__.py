@@ -1,6 +1,7 @@
 from .notification_service import NotificationService, AlertManager
+from .email_queue import EmailQueue
 
-__all__ = ['NotificationService', 'AlertManager']
+__all__ = ['NotificationService', 'AlertManager', 'EmailQueue']
 
 
 
@@ -0,0 +1,74 @@
+import asyncio
+from typing import Optional, Tuple
+
+from config.logging_config import get_logger
+from utils.notification_logger import NotificationLogger
+
+logger = get_logger(__name__)
+
+EMAIL_QUEUE_MAX_SIZE = 1000
+
+class EmailQueue:
+    def __init__(self, notification_service, maxsize: int = EMAIL_QUEUE_MAX_SIZE):
+        self.notification_service = notification_service
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._worker_task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._worker_task is None:
+            self._worker_task = asyncio.create_task(self._worker())
+
+    async def stop(self) -> None:
+        task = self._worker_task
+        self._worker_task = None
+        if task is None:
+            return
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+        if not self._queue.empty():
+            logger.warning("미발송 이메일이 대기열에 남아 있습니다", pending=self._queue.qsize(), component="EmailQueue")
+
+    def enqueue(self, to_email: str, subject: str, body: str) -> bool:
+        try:
+            self._queue.put_nowait((to_email, subject, body))
+            return True
+        except asyncio.QueueFull:
+            logger.warning("이메일 발송 대기열이 가득 찼습니다", to_email=to_email, component="EmailQueue")
+            return False
+
+    async def _send(self, job: Tuple[str, str, str]) -> None:
+        to_email, subject, body = job
+        error_message = None
+        try:
+            success = await asyncio.to_thread(
+                self.notification_service.send_email,
+                to_email=to_email,
+                subject=subject,
+                body=body
+            )
+            if not success:
+                error_message = "이메일 발송에 실패했습니다."
+        except Exception as e:
+            logger.error("대기열 이메일 발송 오류", exception=e, to_email=to_email, component="EmailQueue")
+            error_message = f"이메일 발송 실패: {str(e)}"
+
+        NotificationLogger.log_notification_background(
+            user_email=to_email,
+            notification_type='email',
+            message=f"[API발송] {subject}\n{body}",
+            status="failed" if error_message else "sent",
+            error_message=error_message
+        )
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._send(job)
+            finally:
+                self._queue.task_done()
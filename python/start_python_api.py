@@ -138,14 +138,18 @@ def start_python_api():
     try:
         import platform
         is_windows = platform.system() == 'Windows'
-        reload_flag = [] if is_windows else ["--reload"]
+        workers = int(os.getenv('WEB_CONCURRENCY', '1'))
+        reload_flag = [] if is_windows or workers > 1 else ["--reload"]
         
         creation_flags = subprocess.CREATE_NEW_PROCESS_GROUP if is_windows else 0
         
         api_process = subprocess.Popen(
             [sys.executable, "-m", "uvicorn", "api_server_enhanced:app",
              "--host", "0.0.0.0",
-             "--port", "9000"] + reload_flag,
+             "--port", "9000",
+             "--workers", str(workers),
+             "--ws-per-message-deflate", "false",
+             "--no-access-log"] + reload_flag,
             creationflags=creation_flags,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
@@ -1,20 +1,56 @@
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch, AsyncMock
+import asyncio
 import json
 import sys
 import os
 import pandas as pd
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from error_handling.error_manager import ErrorSeverity, ErrorCategory
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from api_server_enhanced import app, StockAnalysisAPI, manager
+from api_server_enhanced import (
+    app,
+    StockAnalysisAPI,
+    manager,
+    ConnectionManager,
+    clear_historical_cache,
+    warm_analyzed_cache,
+    news_cache,
+    dumps_json,
+    parse_symbol_list,
+    realtime_manager,
+    realtime_pump_loop,
+    downcast_indicator_columns,
+    analysis_etag,
+    etag_matches,
+    news_payload,
+    news_route_errors,
+    get_stock_api,
+    get_redis_cache,
+    get_error_statistics,
+    get_performance_metrics,
+    NEWS_DETAIL_TIMEOUT_DETAIL,
+    conditional_json_response,
+    response_payload,
+    STOCK_DATA_RESPONSE_ALIASES,
+    DefaultJSONResponse
+)
+from utils.response_cache import response_cache
+from utils.redis_cache import RedisResponseCache
+from api_common import StockDataResponse, AdvancedAnalysisResponse, NewsResponse, create_cors_middleware_config
 
 class TestEnhancedAPIEndpoints:
     
     @pytest.fixture
     def client(self):
+        response_cache.clear()
+        clear_historical_cache()
+        news_cache.clear()
         with patch('api_server_enhanced.lifespan'):
             return TestClient(app)
     
@@ -35,6 +71,15 @@ class TestEnhancedAPIEndpoints:
         assert "version" in data
         assert data["version"] == "2.0.0"
     
+    def test_preflight_skips_authentication(self, client):
+        response = client.options(
+            "http://localhost/api/performance",
+            headers={"Origin": "http://localhost:8080", "Access-Control-Request-Method": "GET"},
+            follow_redirects=False
+        )
+        assert response.status_code == 200
+        assert "access-control-allow-methods" in response.headers
+    
     @patch('api_server_enhanced.get_stock_api')
     def test_health_check(self, mock_get_api, client, mock_app_state):
         mock_api = Mock()
@@ -184,12 +229,71 @@ class TestEnhancedAPIEndpoints:
         data = response.json()
         assert data['total_errors'] == 10
     
+    @patch('api_server_enhanced.get_stock_api')
+    def test_get_error_statistics_cached_per_hours(self, mock_get_api, client):
+        mock_api = Mock()
+        mock_api.error_manager = Mock()
+        mock_api.error_manager.get_error_statistics = Mock(return_value={'total_errors': 3})
+        mock_get_api.return_value = mock_api
+        
+        for _ in range(3):
+            assert client.get("/api/errors?hours=24").json() == {'total_errors': 3}
+        client.get("/api/errors?hours=48")
+        
+        assert [call.kwargs['hours'] for call in mock_api.error_manager.get_error_statistics.call_args_list] == [24, 48]
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_stats_probes_share_one_computation(self, client):
+        api = Mock()
+        api.error_manager.get_error_statistics = Mock(return_value={'total_errors': 1})
+        api.data_collector.get_performance_metrics = Mock(return_value={
+            'cache_hit_rate': 0.5,
+            'avg_response_time': 0.1,
+            'error_rate': 0.0,
+            'active_connections': 1,
+            'queue_size': 0,
+            'memory_usage': 0.1,
+            'cpu_usage': 0.1
+        })
+        
+        errors = await asyncio.gather(*(get_error_statistics(hours=24, api=api) for _ in range(5)))
+        metrics = await asyncio.gather(*(get_performance_metrics(api=api) for _ in range(5)))
+        
+        assert [json.loads(response.body) for response in errors] == [{'total_errors': 1}] * 5
+        assert all(response.body == metrics[0].body for response in metrics)
+        api.error_manager.get_error_statistics.assert_called_once_with(hours=24)
+        api.data_collector.get_performance_metrics.assert_called_once_with()
+    
+    def test_literal_news_routes_are_not_captured_by_symbol_route(self, client):
+        api = Mock()
+        api.news_collector.get_news_by_url = Mock(return_value=None)
+        app.dependency_overrides[get_stock_api] = lambda: api
+        app.dependency_overrides[get_redis_cache] = lambda: RedisResponseCache()
+        try:
+            with patch('api_server_enhanced._fetch_news_cached', AsyncMock(return_value=[])) as mock_fetch:
+                multiple = client.get("http://localhost/api/news/multiple?symbols=AAPL,MSFT")
+                detail = client.get("http://localhost/api/news/detail?url=https://example.com/article")
+        finally:
+            app.dependency_overrides.clear()
+        
+        assert multiple.status_code == 200
+        assert multiple.json() == {'AAPL': [], 'MSFT': []}
+        assert [call.args[1] for call in mock_fetch.await_args_list] == ['AAPL', 'MSFT']
+        assert detail.status_code == 404
+        api.news_collector.get_news_by_url.assert_called_once_with('https://example.com/article')
+    
     def test_websocket_endpoint(self, client):
         with client.websocket_connect("/ws") as websocket:
             websocket.send_text("ping")
             data = websocket.receive_text()
             assert data == "pong"
     
+    def test_websocket_binary_ping(self, client):
+        with client.websocket_connect("/ws") as websocket:
+            websocket.send_bytes(b"ping")
+            data = websocket.receive_bytes()
+            assert data == b"pong"
+    
     def test_websocket_stats(self, client):
         with client.websocket_connect("/ws") as websocket:
             websocket.send_text("stats")
@@ -304,6 +408,46 @@ class TestRefactoredFunctions:
         
         assert len(result) == 1
         assert result[0]['title'] == 'Test News'
+    
+    @pytest.mark.asyncio
+    async def test_fetch_news_cached_shares_one_fetch(self):
+        from api_server_enhanced import _fetch_news_cached
+        
+        news_cache.clear()
+        mock_api = Mock()
+        mock_api.news_collector.get_stock_news = Mock(return_value=[
+            {'title': 'Test News', 'url': 'http://test.com', 'symbol': 'AAPL'}
+        ])
+        
+        results = await asyncio.gather(
+            _fetch_news_cached(mock_api, "aapl", False, 10.0),
+            _fetch_news_cached(mock_api, "AAPL", False, 10.0)
+        )
+        again = await _fetch_news_cached(mock_api, "AAPL", False, 10.0)
+        
+        assert results[0] == results[1] == again
+        mock_api.news_collector.get_stock_news.assert_called_once_with("AAPL", include_korean=False)
+        news_cache.clear()
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_news_searches_share_one_upstream_call(self):
+        from api_server_enhanced import search_news
+        from data_collectors.news_collector import NewsLanguage
+        from utils.redis_cache import RedisResponseCache
+        
+        mock_api = Mock()
+        mock_api.news_collector.search_news = Mock(return_value=[
+            {'title': 'Test News', 'url': 'http://test.com', 'symbol': 'AAPL', 'provider': 'google'}
+        ])
+        
+        responses = await asyncio.gather(*(
+            search_news(query='Apple', language=NewsLanguage.EN, max_results=5,
+                        api=mock_api, cache=RedisResponseCache())
+            for _ in range(3)
+        ))
+        
+        assert len({response.body for response in responses}) == 1
+        mock_api.news_collector.search_news.assert_called_once_with('Apple', language='en', max_results=5)
 
 class TestEnhancedStockAnalysisAPI:
     
@@ -374,6 +518,134 @@ class TestEnhancedStockAnalysisAPI:
         assert 'riskScore' in result
         assert 'confidence' in result
     
+    @pytest.mark.asyncio
+    async def test_get_advanced_analysis_reuses_realtime_data(self, stock_api):
+        stock_api.get_realtime_data_enhanced = AsyncMock()
+        stock_api.data_collector.get_historical_data_async = AsyncMock(return_value=pd.DataFrame({
+            'date': pd.date_range('2024-01-01', periods=30, freq='D'),
+            'close': [100] * 30,
+            'volume': [1000000] * 30
+        }))
+        stock_api.analyzer.calculate_all_advanced_indicators = Mock(return_value=pd.DataFrame())
+        stock_api.analyzer.calculate_market_regime = Mock(return_value={'regime': 'trending', 'confidence': 0.8})
+        stock_api.analyzer.detect_chart_patterns = Mock(return_value=[])
+        stock_api.analyzer.calculate_support_resistance = Mock(return_value={})
+        stock_api.analyzer.calculate_fibonacci_levels = Mock(return_value={})
+        stock_api.analyzer.detect_anomalies_ml = Mock(return_value=[])
+        stock_api.analyzer.calculate_advanced_signals = Mock(return_value={'signal': 'buy', 'confidence': 0.75})
+        
+        result = await stock_api.get_advanced_analysis('AAPL', realtime_data={
+            'symbol': 'AAPL',
+            'currentPrice': 151.0,
+            'volume': 500000,
+            'changePercent': 1.0
+        })
+        
+        stock_api.get_realtime_data_enhanced.assert_not_awaited()
+        assert result['currentPrice'] == 151.0
+    
+    @pytest.mark.asyncio
+    async def test_get_realtime_data_enhanced_coalesces_concurrent_calls(self, stock_api):
+        async def fetch(symbol):
+            await asyncio.sleep(0.01)
+            return {'symbol': symbol, 'price': 150.0}
+        
+        stock_api.data_collector.get_realtime_data_async = AsyncMock(side_effect=fetch)
+        
+        results = await asyncio.gather(*(stock_api.get_realtime_data_enhanced('AAPL') for _ in range(5)))
+        
+        assert stock_api.data_collector.get_realtime_data_async.await_count == 1
+        assert all(result == results[0] for result in results)
+    
+    @pytest.mark.asyncio
+    async def test_get_advanced_analysis_reuses_heavy_components(self, stock_api):
+        clear_historical_cache()
+        stock_api._fetch_historical_data_with_retry = AsyncMock(return_value=pd.DataFrame())
+        stock_api._run_advanced_analyzers = Mock(return_value=({
+            'signals': {'signal': 'buy', 'confidence': 0.75},
+            'market_regime': {'regime': 'trending'},
+            'patterns': [],
+            'support_resistance': {},
+            'fibonacci_levels': {},
+            'anomalies': []
+        }, 0.2, 0.8))
+        realtime_data = {'symbol': 'AAPL', 'currentPrice': 151.0, 'volume': 500000, 'changePercent': 1.0}
+        
+        await stock_api.get_advanced_analysis('AAPL', realtime_data=realtime_data)
+        result = await stock_api.get_advanced_analysis('AAPL', realtime_data={**realtime_data, 'currentPrice': 152.0})
+        
+        assert stock_api._run_advanced_analyzers.call_count == 1
+        assert result['currentPrice'] == 152.0
+    
+    @pytest.mark.asyncio
+    async def test_advanced_components_run_on_cpu_pool(self, stock_api):
+        clear_historical_cache()
+        historical_data = pd.DataFrame({'close': [1.0, 2.0]})
+        components = ({'signals': {}, 'market_regime': {}}, 0.1, 0.5)
+        stock_api._fetch_historical_data_with_retry = AsyncMock(return_value=historical_data)
+        stock_api._run_advanced_analyzers = Mock()
+        
+        with ThreadPoolExecutor(max_workers=1) as pool, \
+                patch('api_server_enhanced.run_advanced_analyzers_in_process', return_value=(components, [])) as mock_worker:
+            stock_api.cpu_pool = pool
+            result = await stock_api._get_advanced_components('AAPL', Mock())
+        
+        assert result == components
+        assert mock_worker.call_args.args == (historical_data, 'AAPL')
+        stock_api._run_advanced_analyzers.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_cpu_pool_errors_are_recorded_in_parent_error_manager(self, stock_api):
+        clear_historical_cache()
+        historical_data = pd.DataFrame({'close': [1.0, 2.0]})
+        stock_api._fetch_historical_data_with_retry = AsyncMock(return_value=historical_data)
+        stock_api.error_manager = Mock()
+        context = Mock()
+        failing_analyzer = Mock()
+        failing_analyzer.calculate_all_advanced_indicators.side_effect = ValueError("bad frame")
+        failing_analyzer.detect_anomalies_ml.return_value = []
+        failing_analyzer.calculate_market_regime.return_value = {'regime': 'sideways', 'confidence': 0.5}
+        
+        with ThreadPoolExecutor(max_workers=1) as pool, \
+                patch('api_server_enhanced._process_analysis_api', None), \
+                patch('api_server_enhanced.AdvancedTechnicalAnalyzer', return_value=failing_analyzer):
+            stock_api.cpu_pool = pool
+            await stock_api._get_advanced_components('AAPL', context)
+        
+        severity, category, message, exception, logged_context = stock_api.error_manager.log_error.call_args.args
+        assert (severity, category) == (ErrorSeverity.MEDIUM, ErrorCategory.ANALYSIS)
+        assert 'AAPL' in message
+        assert isinstance(exception, ValueError)
+        assert logged_context is context
+    
+    def test_downcast_indicator_columns_keeps_market_prices(self):
+        import numpy as np
+        data = pd.DataFrame({
+            'close': [187.31, 188.02],
+            'volume': [1000.0, 2000.0],
+            'rsi_14': [55.5, 60.25],
+            'symbol': ['AAPL', 'AAPL']
+        })
+        
+        result = downcast_indicator_columns(data)
+        
+        assert result['rsi_14'].dtype == np.float32
+        assert result['close'].dtype == np.float64
+        assert result['close'].tolist() == [187.31, 188.02]
+        assert result['volume'].dtype == np.float64
+    
+    def test_calculate_risk_and_confidence_reads_frame_columns(self, stock_api):
+        data = pd.DataFrame({'close': [100.0, 101.5, 99.8, 102.3], 'volume': [2000000, 3000000, 2500000, 1500000]})
+        
+        with patch('api_server_enhanced.risk_and_confidence', return_value=(0.3, 0.6)) as mock_kernel:
+            result = stock_api._calculate_risk_and_confidence(data, [{'type': 'spike'}], {'confidence': 0.8})
+        
+        close, volume, n_rows, n_anomalies, regime_confidence = mock_kernel.call_args.args
+        assert result == (0.3, 0.6)
+        assert close.tolist() == [100.0, 101.5, 99.8, 102.3]
+        assert volume.dtype == 'float64'
+        assert (n_rows, n_anomalies, regime_confidence) == (4, 1, 0.8)
+    
     @pytest.mark.asyncio
     async def test_get_batch_analysis_success(self, stock_api):
         stock_api.get_advanced_analysis = AsyncMock(side_effect=[
@@ -400,16 +672,532 @@ class TestEnhancedStockAnalysisAPI:
         assert len(result) == 2
         assert result[0]['symbol'] == 'AAPL'
         assert result[1]['symbol'] == 'MSFT'
+    
+    @pytest.mark.asyncio
+    async def test_get_batch_analysis_bounds_concurrency(self, stock_api):
+        in_flight = 0
+        peak = 0
+        
+        async def fake_analysis(symbol):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {'symbol': symbol}
+        
+        stock_api.get_advanced_analysis = AsyncMock(side_effect=fake_analysis)
+        symbols = [f'SYM{i}' for i in range(10)]
+        
+        with patch('api_server_enhanced.BATCH_ANALYSIS_CONCURRENCY', 3):
+            result = await stock_api.get_batch_analysis(symbols)
+        
+        assert [item['symbol'] for item in result] == symbols
+        assert peak == 3
+    
+    @pytest.mark.asyncio
+    async def test_get_all_symbols_analysis_skips_failures(self, stock_api):
+        stock_api.get_advanced_analysis = AsyncMock(side_effect=lambda symbol: (
+            {'symbol': symbol} if symbol != 'GOOGL' else None
+        ))
+        
+        with patch('api_server_enhanced.settings') as mock_settings:
+            mock_settings.ANALYSIS_SYMBOLS = ['AAPL', 'GOOGL', 'MSFT']
+            result = await stock_api.get_all_symbols_analysis()
+        
+        assert [item['symbol'] for item in result] == ['AAPL', 'MSFT']
+        assert stock_api.get_advanced_analysis.await_count == 3
+    
+    def test_load_historical_data_returns_cached_copy(self, stock_api):
+        clear_historical_cache()
+        first = stock_api._load_historical_data('AAPL')
+        first['close'] = 0.0
+        second = stock_api._load_historical_data('AAPL')
+        
+        assert (second['close'] != 0.0).any()
+        assert len(first) == len(second)
+    
+    @pytest.mark.asyncio
+    async def test_get_basic_analysis_reuses_recent_result(self, stock_api):
+        clear_historical_cache()
+        basic_analyzer = Mock()
+        enhanced_collector = Mock()
+        stock_api._compute_basic_analysis = AsyncMock(return_value={'symbol': 'AAPL'})
+        
+        first = await stock_api.get_basic_analysis('AAPL', basic_analyzer, enhanced_collector)
+        second = await stock_api.get_basic_analysis('AAPL', basic_analyzer, enhanced_collector)
+        
+        assert first == second == {'symbol': 'AAPL'}
+        assert stock_api._compute_basic_analysis.await_count == 1
+    
+    def test_load_analyzed_data_reuses_indicators(self, stock_api):
+        clear_historical_cache()
+        basic_analyzer = Mock()
+        basic_analyzer.calculate_all_indicators = Mock(side_effect=lambda df: df.assign(sma_20=df['close']))
+        
+        first = stock_api._load_analyzed_data('AAPL', basic_analyzer)
+        second = stock_api._load_analyzed_data('AAPL', basic_analyzer)
+        
+        assert basic_analyzer.calculate_all_indicators.call_count == 1
+        assert first.equals(second)
+        assert first is not second
+    
+    def test_warm_analyzed_cache_precomputes_indicators(self, stock_api):
+        clear_historical_cache()
+        basic_analyzer = Mock()
+        basic_analyzer.calculate_all_indicators = Mock(side_effect=lambda df: df.assign(sma_20=df['close']))
+        
+        assert warm_analyzed_cache(['AAPL', 'MSFT'], basic_analyzer) == 2
+        assert warm_analyzed_cache(['AAPL', 'MSFT'], basic_analyzer) == 0
+        
+        stock_api._load_analyzed_data('AAPL', basic_analyzer)
+        assert basic_analyzer.calculate_all_indicators.call_count == 2
+    
+    def test_load_analyzed_data_evicts_least_recently_used(self, stock_api):
+        clear_historical_cache()
+        basic_analyzer = Mock()
+        basic_analyzer.calculate_all_indicators = Mock(side_effect=lambda df: df.assign(sma_20=df['close']))
+        
+        with patch('api_server_enhanced.ANALYZED_CACHE_MAX_SIZE', 2):
+            stock_api._load_analyzed_data('AAPL', basic_analyzer)
+            stock_api._load_analyzed_data('MSFT', basic_analyzer)
+            stock_api._load_analyzed_data('AAPL', basic_analyzer)
+            stock_api._load_analyzed_data('GOOGL', basic_analyzer)
+            stock_api._load_analyzed_data('AAPL', basic_analyzer)
+        
+        assert basic_analyzer.calculate_all_indicators.call_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_get_historical_data_chart_records(self, stock_api):
+        clear_historical_cache()
+        basic_analyzer = Mock()
+        basic_analyzer.calculate_all_indicators = Mock(
+            side_effect=lambda df: df.assign(sma_20=df['close'].rolling(20).mean())
+        )
+        
+        result = await stock_api.get_historical_data('AAPL', 30, basic_analyzer)
+        first, last = result['data'][0], result['data'][-1]
+        
+        assert list(first.keys()) == ['date', 'close', 'volume', 'rsi', 'macd', 'bb_upper', 'bb_lower', 'sma_20']
+        assert first['sma_20'] is None
+        assert first['rsi'] is None
+        assert isinstance(last['sma_20'], float)
+        assert isinstance(last['volume'], int)
+        assert datetime.fromisoformat(first['date']) < datetime.fromisoformat(last['date'])
+
+    @pytest.mark.asyncio
+    async def test_get_historical_json_matches_records(self, stock_api):
+        clear_historical_cache()
+        basic_analyzer = Mock()
+        basic_analyzer.calculate_all_indicators = Mock(
+            side_effect=lambda df: df.assign(sma_20=df['close'].rolling(20).mean())
+        )
+        
+        expected = await stock_api.get_historical_data('AAPL', 30, basic_analyzer)
+        result = json.loads(await stock_api.get_historical_json('AAPL', 30, basic_analyzer))
+        
+        assert result['symbol'] == 'AAPL'
+        assert result['period'] == 30
+        assert result['data'] == expected['data']
+    
+    @pytest.mark.asyncio
+    async def test_historical_endpoints_return_no_rows_for_empty_analysis(self, stock_api):
+        clear_historical_cache()
+        basic_analyzer = Mock()
+        basic_analyzer.calculate_all_indicators = Mock(return_value=pd.DataFrame())
+        
+        records = await stock_api.get_historical_data('AAPL', 30, basic_analyzer)
+        payload = json.loads(await stock_api.get_historical_json('AAPL', 30, basic_analyzer))
+        
+        assert records['data'] == []
+        assert payload == {'symbol': 'AAPL', 'data': [], 'period': 30}
+
+class TestRealtimePump:
+    
+    @pytest.mark.asyncio
+    async def test_pump_broadcasts_one_analysis_to_all_listeners(self):
+        api = Mock()
+        api.get_all_symbols_analysis = AsyncMock(return_value=[{'symbol': 'AAPL'}])
+        first, second = AsyncMock(), AsyncMock()
+        await realtime_manager.connect(first)
+        await realtime_manager.connect(second)
+        
+        with patch('api_server_enhanced.REALTIME_PUSH_INTERVAL', 10):
+            task = asyncio.create_task(realtime_pump_loop(api, asyncio.Event()))
+            await asyncio.sleep(0.05)
+            task.cancel()
+        realtime_manager.disconnect(first)
+        realtime_manager.disconnect(second)
+        
+        assert api.get_all_symbols_analysis.await_count == 1
+        first.send_text.assert_awaited_once_with(dumps_json([{'symbol': 'AAPL'}]))
+        second.send_text.assert_awaited_once_with(dumps_json([{'symbol': 'AAPL'}]))
+    
+    @pytest.mark.asyncio
+    async def test_pump_idles_without_listeners(self):
+        api = Mock()
+        api.get_all_symbols_analysis = AsyncMock(return_value=[])
+        
+        task = asyncio.create_task(realtime_pump_loop(api, asyncio.Event()))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        
+        api.get_all_symbols_analysis.assert_not_awaited()
+
+class TestParseSymbolList:
+    
+    def test_dedupes_and_normalizes(self):
+        assert parse_symbol_list(' aapl,MSFT,,aapl ', "too many") == ['AAPL', 'MSFT']
+    
+    def test_ignores_empty_entries_when_counting(self):
+        assert parse_symbol_list(',' * 20 + 'brk.b, 005930.ks', "too many") == ['BRK.B', '005930.KS']
+    
+    def test_rejects_more_than_limit(self):
+        from fastapi import HTTPException
+        
+        with pytest.raises(HTTPException) as exc_info:
+            parse_symbol_list(','.join(['AAPL'] * 10000), "too many")
+        assert exc_info.value.status_code == 400
+    
+    def test_repeated_queries_return_independent_lists(self):
+        first = parse_symbol_list('aapl,msft', "too many")
+        first.append('TSLA')
+        assert parse_symbol_list('aapl,msft', "too many") == ['AAPL', 'MSFT']
+    
+    def test_splits_on_commas_only(self):
+        assert parse_symbol_list('aapl msft, tsla', "too many") == ['AAPL MSFT', 'TSLA']
+    
+    def test_long_and_rejected_queries_are_not_cached(self):
+        from api_server_enhanced import _parse_symbols
+        
+        _parse_symbols.cache_clear()
+        assert parse_symbol_list(' ' * 1000 + 'aapl', "too many") == ['AAPL']
+        with pytest.raises(HTTPException):
+            parse_symbol_list(','.join('ABCDEFGHIJK'), "too many")
+        
+        assert _parse_symbols.cache_info().currsize == 0
+
+class TestAnalysisEtag:
+    
+    @pytest.fixture
+    def analysis(self):
+        return {
+            'symbol': 'AAPL',
+            'currentPrice': 150.0,
+            'volume': 1000000,
+            'changePercent': 1.2,
+            'trend': 'bullish',
+            'trendStrength': 0.7,
+            'signals': {'signal': 'buy', 'confidence': 0.8, 'rsi': 55.0, 'macd': 0.4, 'macdSignal': 0.3},
+            'anomalies': [{'type': 'volume_spike', 'severity': 'high', 'message': 'spike', 'timestamp': datetime.now()}],
+            'timestamp': datetime(2024, 1, 2, 9, 30)
+        }
+    
+    def test_etag_ignores_anomaly_detection_time(self, analysis):
+        again = {**analysis, 'anomalies': [{**analysis['anomalies'][0], 'timestamp': datetime(2030, 1, 1)}]}
+        assert analysis_etag(analysis) == analysis_etag(again)
+    
+    def test_etag_changes_with_price(self, analysis):
+        assert analysis_etag(analysis) != analysis_etag({**analysis, 'currentPrice': 151.0})
+    
+    def test_etag_matches_header_variants(self, analysis):
+        etag = analysis_etag(analysis)
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"stale", W/{etag}', etag)
+        assert etag_matches('*', etag)
+        assert not etag_matches('"stale"', etag)
+        assert not etag_matches(None, etag)
+    
+    def test_conditional_json_response_returns_304_for_known_body(self):
+        body = b'{"title":"Apple earnings"}'
+        request = Mock()
+        request.headers = {}
+        
+        first = conditional_json_response(request, body, "MISS")
+        assert first.status_code == 200
+        assert first.body == body
+        
+        request.headers = {'if-none-match': first.headers['etag']}
+        second = conditional_json_response(request, body, "HIT")
+        assert second.status_code == 304
+        assert second.headers['etag'] == first.headers['etag']
+
+class TestResponseModelConstruct:
+    
+    def test_stock_data_construct_serializes_like_validated_model(self):
+        data = {
+            'symbol': 'AAPL',
+            'currentPrice': 150.25,
+            'volume': 1000000,
+            'changePercent': 1.5,
+            'timestamp': datetime(2024, 1, 2, 9, 30),
+            'confidenceScore': 0.9
+        }
+        
+        constructed = StockDataResponse.model_construct(**data).model_dump(mode='json', by_alias=True)
+        assert constructed == StockDataResponse(**data).model_dump(mode='json', by_alias=True)
+    
+    def test_stock_data_payload_matches_validated_wire_format(self):
+        data = {
+            'symbol': 'AAPL',
+            'currentPrice': 150.25,
+            'volume': 1000000,
+            'changePercent': 1.5,
+            'timestamp': datetime(2024, 1, 2, 9, 30),
+            'confidenceScore': 0.9
+        }
+        
+        rendered = json.loads(DefaultJSONResponse(response_payload(data, STOCK_DATA_RESPONSE_ALIASES)).body)
+        assert rendered == StockDataResponse(**data).model_dump(mode='json', by_alias=True)
+    
+    def test_advanced_analysis_construct_serializes_like_validated_model(self):
+        data = {
+            'symbol': 'AAPL',
+            'currentPrice': 150.25,
+            'volume': 1000000,
+            'changePercent': 1.5,
+            'trend': 'buy',
+            'trendStrength': 0.7,
+            'marketRegime': 'trending',
+            'signals': {'signal': 'buy'},
+            'patterns': [],
+            'supportResistance': {'support': [], 'resistance': []},
+            'fibonacciLevels': {},
+            'anomalies': [],
+            'riskScore': 0.2,
+            'confidence': 0.8,
+            'timestamp': datetime(2024, 1, 2, 9, 30)
+        }
+        
+        constructed = AdvancedAnalysisResponse.model_construct(**data).model_dump(mode='json', by_alias=True)
+        assert constructed == AdvancedAnalysisResponse(**data).model_dump(mode='json', by_alias=True)
+    
+    def test_news_payload_matches_validated_model(self):
+        item = {
+            'title': 'Apple earnings',
+            'url': 'https://example.com/a',
+            'symbol': 'AAPL',
+            'provider': 'yahoo',
+            'sentiment': 0.4,
+            'raw': {'ignored': True}
+        }
+        
+        assert news_payload(item) == NewsResponse(**item).model_dump()
+
+class TestNewsRouteErrors:
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('error', [asyncio.TimeoutError(), TimeoutError('read timed out')])
+    async def test_maps_timeouts_to_route_timeout_message(self, error):
+        @news_route_errors("뉴스 상세 조회", timeout_detail=NEWS_DETAIL_TIMEOUT_DETAIL)
+        async def route():
+            raise error
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await route()
+        
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.detail == NEWS_DETAIL_TIMEOUT_DETAIL
+    
+    @pytest.mark.asyncio
+    async def test_keeps_route_specific_network_and_server_messages(self):
+        @news_route_errors("뉴스 검색")
+        async def offline():
+            raise ConnectionError("refused")
+        
+        @news_route_errors("뉴스 검색")
+        async def broken():
+            raise ValueError("bad payload")
+        
+        with pytest.raises(HTTPException) as offline_info:
+            await offline()
+        with pytest.raises(HTTPException) as broken_info:
+            await broken()
+        
+        assert (offline_info.value.status_code, offline_info.value.detail) == (503, "뉴스 검색 네트워크 오류: refused")
+        assert (broken_info.value.status_code, broken_info.value.detail) == (500, "뉴스 검색 오류: bad payload")
+    
+    def test_upstream_errors_are_not_remapped_app_wide(self):
+        assert asyncio.TimeoutError not in app.exception_handlers
+        assert ConnectionError not in app.exception_handlers
+
+class TestDumpsJson:
+    
+    def test_dumps_json_handles_numpy_and_datetime(self):
+        import numpy as np
+        
+        payload = {'price': np.float64(150.25), 'timestamp': datetime(2024, 1, 1, 9, 30)}
+        parsed = json.loads(dumps_json(payload))
+        
+        assert parsed['price'] == 150.25
+        assert parsed['timestamp'].startswith('2024-01-01')
+    
+    def test_default_response_renders_pandas_and_numpy_values(self):
+        import numpy as np
+        from api_server_enhanced import DefaultJSONResponse
+        
+        response = DefaultJSONResponse({
+            'timestamp': pd.Timestamp('2024-01-02 09:30'),
+            'volume': np.int64(1000),
+            'levels': np.array([1.5, 2.5])
+        })
+        parsed = json.loads(response.body)
+        
+        assert parsed == {'timestamp': '2024-01-02T09:30:00', 'volume': 1000, 'levels': [1.5, 2.5]}
+    
+    def test_fallback_encoder_matches_orjson_for_nan_and_non_str_keys(self):
+        import numpy as np
+        import api_common
+        
+        payload = {
+            'indicators': {'rsi': float('nan'), 'macd': np.float64('inf')},
+            'levels': np.array([np.nan, 2.5]),
+            datetime(2024, 1, 2): 1
+        }
+        with patch.object(api_common, 'ORJSON_AVAILABLE', False):
+            parsed = json.loads(api_common.encode_json(payload))
+        
+        assert parsed == {
+            'indicators': {'rsi': None, 'macd': None},
+            'levels': [None, 2.5],
+            '2024-01-02T00:00:00': 1
+        }
+
+class TestCorsMiddlewareConfig:
+    
+    def test_defaults_to_explicit_origins_with_credentials(self):
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop('CORS_ORIGINS', None)
+            config = create_cors_middleware_config()
+        
+        assert '*' not in config['allow_origins']
+        assert config['allow_credentials'] is True
+    
+    def test_wildcard_origin_disables_credentials(self):
+        with patch.dict(os.environ, {'CORS_ORIGINS': '*'}):
+            config = create_cors_middleware_config()
+        
+        assert config['allow_origins'] == ['*']
+        assert config['allow_credentials'] is False
 
 class TestConnectionManager:
     
     def test_connection_manager_initialization(self):
-        assert manager.active_connections == []
-        assert manager.connection_metadata == {}
-        assert manager.rate_limits == {}
+        assert manager.connections == {}
+        assert manager.total_messages == 0
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_failed_connections(self):
+        broadcast_manager = ConnectionManager()
+        healthy = AsyncMock()
+        broken = AsyncMock()
+        broken.send_text.side_effect = Exception("Send error")
+        await broadcast_manager.connect(healthy)
+        await broadcast_manager.connect(broken)
+        
+        await broadcast_manager.broadcast("test message")
+        for _ in range(3):
+            await asyncio.sleep(0)
+        
+        healthy.send_text.assert_awaited_once_with("test message")
+        assert list(broadcast_manager.connections) == [healthy]
+        assert broadcast_manager.connections[healthy].task is not None
+        broadcast_manager.disconnect(healthy)
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_does_not_wait_for_slow_connections(self):
+        broadcast_manager = ConnectionManager()
+        release = asyncio.Event()
+        slow = AsyncMock()
+        slow.send_text.side_effect = lambda message: release.wait()
+        fast = AsyncMock()
+        await broadcast_manager.connect(slow)
+        await broadcast_manager.connect(fast)
+        
+        await asyncio.wait_for(broadcast_manager.broadcast("first"), timeout=1)
+        await asyncio.wait_for(broadcast_manager.broadcast("second"), timeout=1)
+        for _ in range(3):
+            await asyncio.sleep(0)
+        
+        assert [call.args[0] for call in fast.send_text.await_args_list] == ["first", "second"]
+        assert slow.send_text.await_count == 1
+        release.set()
+        broadcast_manager.disconnect(slow)
+        broadcast_manager.disconnect(fast)
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_bytes_sends_shared_payload(self):
+        broadcast_manager = ConnectionManager()
+        first, second = AsyncMock(), AsyncMock()
+        await broadcast_manager.connect(first)
+        await broadcast_manager.connect(second)
+        payload = b'{"symbol":"AAPL"}'
+        
+        await broadcast_manager.broadcast_bytes(payload)
+        for _ in range(3):
+            await asyncio.sleep(0)
+        
+        assert first.send_bytes.await_args.args[0] is payload
+        assert second.send_bytes.await_args.args[0] is payload
+        first.send_text.assert_not_awaited()
+        broadcast_manager.disconnect(first)
+        broadcast_manager.disconnect(second)
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_oldest_when_queue_full(self):
+        broadcast_manager = ConnectionManager()
+        slow = AsyncMock()
+        await broadcast_manager.connect(slow)
+        
+        queue = asyncio.Queue(maxsize=2)
+        broadcast_manager.connections[slow].queue = queue
+        for index in range(3):
+            await broadcast_manager.broadcast(f"message {index}")
+        
+        assert [queue.get_nowait() for _ in range(queue.qsize())] == ["message 1", "message 2"]
+        broadcast_manager.disconnect(slow)
     
     def test_get_connection_stats_no_connections(self):
         stats = manager.get_connection_stats()
         assert stats['active_connections'] == 0
         assert stats['total_messages'] == 0
+    
+    @pytest.mark.asyncio
+    async def test_get_connection_stats_tracks_running_totals(self):
+        stats_manager = ConnectionManager(enable_metadata=True)
+        first, second = AsyncMock(), AsyncMock()
+        await stats_manager.connect(first, "10.0.0.1")
+        await stats_manager.connect(second, "10.0.0.2")
+        
+        await stats_manager.send_personal_message("one", first)
+        await stats_manager.send_personal_message("two", first)
+        await stats_manager.send_personal_message("three", second)
+        stats = stats_manager.get_connection_stats()
+        assert stats['active_connections'] == 2
+        assert stats['total_messages'] == 3
+        assert stats['avg_connection_duration'] >= 0.0
+        
+        stats_manager.disconnect(first)
+        assert stats_manager.get_connection_stats()['total_messages'] == 1
+        
+        stats_manager.disconnect(second)
+        assert stats_manager.get_connection_stats() == {
+            'active_connections': 0,
+            'total_messages': 0,
+            'avg_connection_duration': 0.0
+        }
+        assert stats_manager.connected_at_sum == 0.0
+    
+    @pytest.mark.asyncio
+    async def test_get_connection_stats_json_reuses_buffer_within_ttl(self):
+        stats_manager = ConnectionManager(enable_metadata=True)
+        first = stats_manager.get_connection_stats_json()
+        
+        websocket = AsyncMock()
+        await stats_manager.connect(websocket)
+        assert stats_manager.get_connection_stats_json() is first
+        
+        stats_manager.stats_json_expires = 0.0
+        assert json.loads(stats_manager.get_connection_stats_json())['active_connections'] == 1
+        stats_manager.disconnect(websocket)
 
@@ -0,0 +1,60 @@
+import pytest
+import sys
+import os
+from starlette.middleware.gzip import GZipMiddleware
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.compression_stats import CompressionStats, CompressionStatsMiddleware, UncompressedSizeMiddleware
+
+BODY = b'{"symbol": "AAPL", "price": 150.25}' * 200
+
+async def json_app(scope, receive, send):
+    await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'content-type', b'application/json')]})
+    await send({'type': 'http.response.body', 'body': BODY})
+
+async def run_request(stats, accept_encoding):
+    app = CompressionStatsMiddleware(
+        GZipMiddleware(UncompressedSizeMiddleware(json_app), minimum_size=100, compresslevel=4),
+        stats=stats
+    )
+    scope = {
+        'type': 'http',
+        'method': 'GET',
+        'path': '/api/symbols',
+        'headers': [(b'accept-encoding', accept_encoding)]
+    }
+    sent = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent
+
+class TestCompressionStatsMiddleware:
+
+    @pytest.mark.asyncio
+    async def test_records_gzip_responses(self):
+        stats = CompressionStats()
+
+        sent = await run_request(stats, b'gzip')
+
+        compressed = b''.join(message.get('body', b'') for message in sent if message['type'] == 'http.response.body')
+        assert stats.responses == 1
+        assert stats.uncompressed_bytes == len(BODY)
+        assert stats.compressed_bytes == len(compressed)
+        assert 0 < stats.ratio < 1
+        assert stats.snapshot()['responses'] == 1
+
+    @pytest.mark.asyncio
+    async def test_ignores_uncompressed_responses(self):
+        stats = CompressionStats()
+
+        await run_request(stats, b'identity')
+
+        assert stats.responses == 0
+        assert stats.ratio == 0.0
@@ -0,0 +1,35 @@
+import pytest
+import asyncio
+import sys
+import os
+from unittest.mock import Mock, patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notification.email_queue import EmailQueue
+
+class TestEmailQueue:
+
+    @pytest.mark.asyncio
+    async def test_worker_sends_queued_emails_and_logs_result(self):
+        notification_service = Mock()
+        notification_service.send_email = Mock(side_effect=[True, False])
+        email_queue = EmailQueue(notification_service)
+
+        with patch('notification.email_queue.NotificationLogger') as mock_logger:
+            email_queue.start()
+            assert email_queue.enqueue('a@example.com', 'subject', 'body')
+            assert email_queue.enqueue('b@example.com', 'subject', 'body')
+            await asyncio.wait_for(email_queue._queue.join(), timeout=1)
+            await email_queue.stop()
+
+        assert notification_service.send_email.call_count == 2
+        statuses = [call.kwargs['status'] for call in mock_logger.log_notification_background.call_args_list]
+        assert statuses == ['sent', 'failed']
+
+    @pytest.mark.asyncio
+    async def test_enqueue_rejects_when_full(self):
+        email_queue = EmailQueue(Mock(), maxsize=1)
+
+        assert email_queue.enqueue('a@example.com', 'subject', 'body')
+        assert not email_queue.enqueue('b@example.com', 'subject', 'body')
@@ -109,6 +109,15 @@ class TestErrorManager:
         assert error_manager.error_reports[0].severity == ErrorSeverity.HIGH
         assert error_manager.error_reports[0].category == ErrorCategory.API
     
+    def test_log_error_ids_are_unique_for_repeated_messages(self, error_manager):
+        error_ids = {
+            error_manager.log_error(ErrorSeverity.LOW, ErrorCategory.API, "Same message")
+            for _ in range(50)
+        }
+        
+        assert len(error_ids) == 50
+        assert all(error_id.startswith("ERR_") for error_id in error_ids)
+    
     def test_log_error_with_exception(self, error_manager):
         exception = ValueError("Test exception")
         error_id = error_manager.log_error(
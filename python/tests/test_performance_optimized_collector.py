@@ -393,3 +393,32 @@ class TestPerformanceOptimizedCollector:
             assert 'consistency' in quality
             assert 'timeliness' in quality
             assert 'validity' in quality
+    
+    def test_parse_yahoo_historical_response_is_columnar(self, collector):
+        data = {
+            'chart': {
+                'result': [{
+                    'timestamp': [1704240000, 1704153600, 1704326400],
+                    'indicators': {
+                        'quote': [{
+                            'open': [101.5, 100.0, None],
+                            'high': [102.0, 101.0, 103.5],
+                            'low': [100.5, 99.0, 101.0],
+                            'close': [101.75, 100.5, 103.25],
+                            'volume': [2000000, 1500000, None]
+                        }]
+                    }
+                }]
+            }
+        }
+        
+        df = collector._parse_yahoo_historical_response(data, 'AAPL')
+        
+        assert list(df.columns) == ['date', 'open', 'high', 'low', 'close', 'volume', 'symbol']
+        assert df['close'].dtype == np.float64
+        assert df['volume'].dtype == np.int64
+        assert df['date'].is_monotonic_increasing
+        assert df['close'].tolist() == [100.5, 101.75, 103.25]
+        assert df['open'].tolist() == [100.0, 101.5, 0.0]
+        assert df['volume'].tolist() == [1500000, 2000000, 0]
+        assert (df['symbol'] == 'AAPL').all()
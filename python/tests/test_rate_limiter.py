@@ -0,0 +1,45 @@
+import pytest
+import sys
+import os
+from unittest.mock import AsyncMock, patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.rate_limiter import FixedWindowRateLimiter
+from utils.redis_cache import RedisResponseCache
+
+class TestFixedWindowRateLimiter:
+
+    @pytest.mark.asyncio
+    async def test_local_fallback_limits_per_client(self):
+        limiter = FixedWindowRateLimiter('news', limit=2, window=60)
+        cache = RedisResponseCache()
+
+        assert await limiter.allow(cache, '1.1.1.1')
+        assert await limiter.allow(cache, '1.1.1.1')
+        assert not await limiter.allow(cache, '1.1.1.1')
+        assert await limiter.allow(cache, '2.2.2.2')
+
+    @pytest.mark.asyncio
+    async def test_local_fallback_resets_in_next_window(self):
+        limiter = FixedWindowRateLimiter('news', limit=1, window=60)
+        cache = RedisResponseCache()
+
+        with patch('utils.rate_limiter.time.time', return_value=0):
+            assert await limiter.allow(cache, '1.1.1.1')
+            assert not await limiter.allow(cache, '1.1.1.1')
+        with patch('utils.rate_limiter.time.time', return_value=60):
+            assert await limiter.allow(cache, '1.1.1.1')
+
+        assert list(limiter._local_counts) == [('1.1.1.1', 1)]
+
+    @pytest.mark.asyncio
+    async def test_uses_shared_redis_counter(self):
+        limiter = FixedWindowRateLimiter('news', limit=30, window=60)
+        cache = RedisResponseCache()
+        cache.incr = AsyncMock(return_value=31)
+
+        with patch('utils.rate_limiter.time.time', return_value=120):
+            assert not await limiter.allow(cache, '1.1.1.1')
+
+        cache.incr.assert_awaited_once_with('ratelimit:news:1.1.1.1:2', 60)
@@ -0,0 +1,50 @@
+import pytest
+import sys
+import os
+from unittest.mock import AsyncMock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.redis_cache import RedisResponseCache, make_cache_key
+
+class TestMakeCacheKey:
+
+    def test_is_stable_and_namespaced(self):
+        key = make_cache_key('news_search', 'Apple', 'en', 20)
+
+        assert key == make_cache_key('news_search', 'Apple', 'en', 20)
+        assert key.startswith('news_search:')
+        assert key != make_cache_key('news_search', 'Apple', 'ko', 20)
+
+class TestRedisResponseCache:
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_is_a_noop(self):
+        cache = RedisResponseCache()
+
+        await cache.set('key', b'[]', 60)
+
+        assert not cache.enabled
+        assert await cache.get('key') is None
+
+    @pytest.mark.asyncio
+    async def test_round_trips_through_client(self):
+        client = AsyncMock()
+        client.get.return_value = b'[]'
+        cache = RedisResponseCache(client)
+
+        await cache.set('key', b'[]', 60)
+
+        client.set.assert_awaited_once_with('key', b'[]', ex=60)
+        assert await cache.get('key') == b'[]'
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_treated_as_misses(self):
+        client = AsyncMock()
+        client.get.side_effect = ConnectionError('down')
+        client.set.side_effect = ConnectionError('down')
+        cache = RedisResponseCache(client)
+
+        await cache.set('key', b'[]', 60)
+
+        assert await cache.get('key') is None
@@ -0,0 +1,169 @@
+import pytest
+import asyncio
+import json
+import sys
+import os
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.testclient import TestClient
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.response_cache import ResponseCache, cached_endpoint, response_cache
+
+def decode(response):
+    return json.loads(response.body)
+
+class TestCachedEndpoint:
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        response_cache.clear()
+        yield
+        response_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_returns_cached_payload_within_ttl(self):
+        calls = []
+
+        @cached_endpoint(ttl=60)
+        async def endpoint():
+            calls.append(1)
+            return {'value': len(calls)}
+
+        assert decode(await endpoint()) == {'value': 1}
+        assert decode(await endpoint()) == {'value': 1}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_key_params_separate_entries(self):
+        @cached_endpoint(ttl=60, key_params=('symbol',))
+        async def endpoint(symbol: str):
+            return symbol
+
+        assert decode(await endpoint(symbol='AAPL')) == 'AAPL'
+        assert decode(await endpoint(symbol='MSFT')) == 'MSFT'
+
+    @pytest.mark.asyncio
+    async def test_serves_stale_and_refreshes_in_background(self):
+        calls = []
+
+        @cached_endpoint(ttl=0, swr=60)
+        async def endpoint():
+            calls.append(1)
+            return len(calls)
+
+        assert decode(await endpoint()) == 1
+        assert decode(await endpoint()) == 1
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert decode(await endpoint()) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        calls = []
+
+        @cached_endpoint(ttl=60)
+        async def endpoint():
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError("boom")
+            return 'ok'
+
+        with pytest.raises(ValueError):
+            await endpoint()
+        assert decode(await endpoint()) == 'ok'
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_misses_share_one_call(self):
+        calls = []
+        release = asyncio.Event()
+
+        @cached_endpoint(ttl=60)
+        async def endpoint():
+            calls.append(1)
+            await release.wait()
+            return 'ok'
+
+        pending = asyncio.gather(*(endpoint() for _ in range(5)))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert [decode(response) for response in await pending] == ['ok'] * 5
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_loader_receives_no_request_scoped_values(self):
+        seen = []
+
+        @cached_endpoint(ttl=0, swr=60, key_params=('symbol',))
+        async def endpoint(symbol: str, raw: Request = None):
+            seen.append((symbol, raw))
+            return symbol
+
+        request = Request({'type': 'http', 'method': 'GET', 'path': '/quote', 'headers': []})
+        assert decode(await endpoint(symbol='AAPL', raw=request, cache_request=request)) == 'AAPL'
+        assert decode(await endpoint(symbol='AAPL', raw=request, cache_request=request)) == 'AAPL'
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert seen == [('AAPL', None), ('AAPL', None)]
+        assert response_cache.get(('/quote', ('symbol', 'AAPL'))) is not None
+
+    def test_cached_body_survives_compression_middleware(self):
+        app = FastAPI()
+        app.add_middleware(GZipMiddleware, minimum_size=16)
+        payload = {'prices': list(range(500))}
+
+        @app.get("/prices")
+        @cached_endpoint(ttl=60)
+        async def prices():
+            return payload
+
+        client = TestClient(app)
+        compressed = client.get("/prices", headers={'Accept-Encoding': 'gzip'})
+        plain = client.get("/prices", headers={'Accept-Encoding': 'identity'})
+        recompressed = client.get("/prices", headers={'Accept-Encoding': 'gzip'})
+
+        assert compressed.headers['content-encoding'] == 'gzip'
+        assert 'content-encoding' not in plain.headers
+        assert int(plain.headers['content-length']) == len(plain.content)
+        assert plain.json() == payload
+        assert recompressed.headers['content-encoding'] == 'gzip'
+        assert recompressed.json() == payload
+
+class TestResponseCache:
+
+    def test_get_fresh_counts_hits_and_misses(self):
+        cache = ResponseCache()
+        assert cache.get_fresh(('AAPL',)) is None
+
+        cache.set(('AAPL',), {'price': 1.0}, ttl=60)
+        assert cache.get_fresh(('AAPL',)) == {'price': 1.0}
+
+        cache.set(('MSFT',), {'price': 2.0}, ttl=-1)
+        assert cache.get_fresh(('MSFT',)) is None
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert cache.hit_rate == pytest.approx(1 / 3)
+
+    def test_maxsize_evicts_oldest_entry(self):
+        cache = ResponseCache(maxsize=2)
+        cache.set(('AAPL',), 1, ttl=60)
+        cache.set(('MSFT',), 2, ttl=60)
+        cache.set(('AAPL',), 3, ttl=60)
+        cache.set(('GOOGL',), 4, ttl=60)
+
+        assert cache.get(('MSFT',)) is None
+        assert cache.get_fresh(('AAPL',)) == 3
+        assert cache.get_fresh(('GOOGL',)) == 4
+
+    def test_set_prunes_expired_entries(self):
+        cache = ResponseCache(max_stale=10)
+        cache.set(('AAPL',), 1, ttl=-20)
+        cache.set(('MSFT',), 2, ttl=-5)
+        cache._next_prune = 0.0
+        cache.set(('GOOGL',), 3, ttl=60)
+
+        assert cache.get(('AAPL',)) is None
+        assert cache.get(('MSFT',)) is not None
+        assert cache.get_fresh(('GOOGL',)) == 3
@@ -0,0 +1,44 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis_engine.risk_scoring import risk_and_confidence
+
+class TestRiskAndConfidence:
+
+    def test_risk_matches_pct_change_volatility(self):
+        close = pd.Series([100.0, 101.5, 99.8, 102.3, 103.1, 100.9])
+        expected_volatility = close.pct_change().std()
+
+        risk, _ = risk_and_confidence(close.to_numpy(), np.empty(0), len(close), 1, 0.0)
+
+        assert risk == pytest.approx(0.2 + min(0.3, expected_volatility * 10))
+
+    def test_short_series_uses_base_risk(self):
+        risk, _ = risk_and_confidence(np.array([100.0, 101.0]), np.empty(0), 2, 0, 0.0)
+
+        assert risk == pytest.approx(0.1)
+
+    def test_risk_is_capped(self):
+        close = np.array([1.0, 10.0, 1.0, 10.0, 1.0])
+
+        risk, _ = risk_and_confidence(close, np.empty(0), len(close), 10, 0.0)
+
+        assert risk == pytest.approx(0.8)
+
+    def test_confidence_bumps(self):
+        volume = np.full(150, 2000000.0)
+        volume[0] = np.nan
+
+        _, confidence = risk_and_confidence(np.empty(0), volume, 150, 0, 0.9)
+
+        assert confidence == pytest.approx(1.0)
+
+    def test_confidence_without_volume(self):
+        _, confidence = risk_and_confidence(np.empty(0), np.empty(0), 10, 0, 0.5)
+
+        assert confidence == pytest.approx(0.5)
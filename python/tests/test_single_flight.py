@@ -0,0 +1,43 @@
+import pytest
+import asyncio
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.single_flight import SingleFlight
+
+class TestSingleFlight:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flights = SingleFlight()
+        calls = []
+
+        async def compute(symbol):
+            calls.append(symbol)
+            await asyncio.sleep(0.01)
+            return {'symbol': symbol}
+
+        results = await asyncio.gather(*(flights.do('AAPL', compute, 'AAPL') for _ in range(5)))
+
+        assert len(calls) == 1
+        assert all(result == {'symbol': 'AAPL'} for result in results)
+        assert len(flights) == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_waiters(self):
+        flights = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flights.do('key', fail),
+            flights.do('key', fail),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(flights) == 0
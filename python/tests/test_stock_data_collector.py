@@ -91,6 +91,39 @@ class TestStockDataCollector:
             assert isinstance(data['price'], (int, float))
             assert isinstance(data['volume'], (int, float))
 
+    def test_parse_alpha_vantage_time_series(self, collector):
+        data = {
+            'Weekly Time Series': {
+                '2024-01-12': {'1. open': '101', '2. high': '105', '3. low': '99', '4. close': '104', '5. volume': '2000'},
+                '2024-01-05': {'1. open': '100', '2. high': '102', '3. low': '98', '4. close': '101', '5. volume': '1000'}
+            }
+        }
+
+        df = collector._parse_alpha_vantage_time_series(data, 'Weekly Time Series', 'date', 'AAPL')
+
+        assert list(df['close']) == [101.0, 104.0]
+        assert df['date'].is_monotonic_increasing
+        assert (df['symbol'] == 'AAPL').all()
+
+    def test_parse_alpha_vantage_time_series_missing_key(self, collector):
+        df = collector._parse_alpha_vantage_time_series({'Note': 'rate limited'}, 'Weekly Time Series', 'date', 'AAPL')
+        assert df.empty
+
+    def test_parse_alpha_vantage_search(self, collector):
+        data = {
+            'bestMatches': [{
+                '1. symbol': 'AAPL', '2. name': 'Apple Inc', '3. type': 'Equity', '4. region': 'United States',
+                '5. marketOpen': '09:30', '6. marketClose': '16:00', '7. timezone': 'UTC-04',
+                '8. currency': 'USD', '9. matchScore': '1.0000'
+            }]
+        }
+
+        matches = collector._parse_alpha_vantage_search(data)
+
+        assert matches[0]['symbol'] == 'AAPL'
+        assert matches[0]['match_score'] == 1.0
+        assert collector._parse_alpha_vantage_search({'Note': 'rate limited'}) == []
+
 class TestDataQualityChecker:
     
     @pytest.fixture
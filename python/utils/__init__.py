@@ -5,9 +5,12 @@ from .data_formatter import DataFormatter
 from .retry_handler import RetryHandler
 from .notification_logger import NotificationLogger
 from .db_checker import DatabaseChecker
+from .response_cache import ResponseCache, response_cache, cached_endpoint
+from .single_flight import SingleFlight
 
 __all__ = [
     'HttpClient', 'ServiceStatus', 'ServiceChecker', 'PrintFormatter',
-    'DataFormatter', 'RetryHandler', 'NotificationLogger', 'DatabaseChecker'
+    'DataFormatter', 'RetryHandler', 'NotificationLogger', 'DatabaseChecker',
+    'ResponseCache', 'response_cache', 'cached_endpoint', 'SingleFlight'
 ]
 
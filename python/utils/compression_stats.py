@@ -0,0 +1,114 @@
+import time
+from typing import Any, Dict
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+COMPRESSION_STATS_SCOPE_KEY = 'compression_stats'
+
+class CompressionStats:
+    __slots__ = ('responses', 'uncompressed_bytes', 'compressed_bytes', 'compression_time')
+
+    def __init__(self):
+        self.responses = 0
+        self.uncompressed_bytes = 0
+        self.compressed_bytes = 0
+        self.compression_time = 0.0
+
+    def record(self, uncompressed_bytes: int, compressed_bytes: int, compression_time: float) -> None:
+        self.responses += 1
+        self.uncompressed_bytes += uncompressed_bytes
+        self.compressed_bytes += compressed_bytes
+        self.compression_time += compression_time
+
+    @property
+    def ratio(self) -> float:
+        return self.compressed_bytes / self.uncompressed_bytes if self.uncompressed_bytes else 0.0
+
+    @property
+    def bytes_saved_per_ms(self) -> float:
+        saved = self.uncompressed_bytes - self.compressed_bytes
+        return saved / (self.compression_time * 1000) if self.compression_time > 0 else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'responses': self.responses,
+            'uncompressed_bytes': self.uncompressed_bytes,
+            'compressed_bytes': self.compressed_bytes,
+            'compression_time': round(self.compression_time, 6),
+            'ratio': round(self.ratio, 4),
+            'bytes_saved_per_ms': round(self.bytes_saved_per_ms, 2)
+        }
+
+compression_stats = CompressionStats()
+
+class UncompressedSizeMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        sample = scope.get(COMPRESSION_STATS_SCOPE_KEY) if scope['type'] == 'http' else None
+        if sample is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message) -> None:
+            if message['type'] != 'http.response.body':
+                await send(message)
+                return
+            sample['uncompressed_bytes'] += len(message.get('body', b''))
+            started = time.perf_counter()
+            await send(message)
+            sample['inner_send_time'] += time.perf_counter() - started
+
+        await self.app(scope, receive, send_wrapper)
+
+class CompressionStatsMiddleware:
+    def __init__(self, app, stats: CompressionStats = compression_stats):
+        self.app = app
+        self.stats = stats
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        sample = {
+            'uncompressed_bytes': 0,
+            'compressed_bytes': 0,
+            'inner_send_time': 0.0,
+            'outer_send_time': 0.0,
+            'compressed': False
+        }
+        scope[COMPRESSION_STATS_SCOPE_KEY] = sample
+
+        async def send_wrapper(message) -> None:
+            if message['type'] == 'http.response.start':
+                sample['compressed'] = any(
+                    name.lower() == b'content-encoding' for name, _ in message.get('headers', [])
+                )
+                await send(message)
+                return
+            if message['type'] == 'http.response.body':
+                sample['compressed_bytes'] += len(message.get('body', b''))
+                started = time.perf_counter()
+                await send(message)
+                sample['outer_send_time'] += time.perf_counter() - started
+                return
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        if sample['compressed'] and sample['uncompressed_bytes']:
+            compression_time = max(0.0, sample['inner_send_time'] - sample['outer_send_time'])
+            self.stats.record(sample['uncompressed_bytes'], sample['compressed_bytes'], compression_time)
+            saved = sample['uncompressed_bytes'] - sample['compressed_bytes']
+            logger.debug(
+                "응답 압축 통계",
+                path=scope.get('path'),
+                uncompressed_bytes=sample['uncompressed_bytes'],
+                compressed_bytes=sample['compressed_bytes'],
+                compression_time=compression_time,
+                bytes_saved_per_ms=saved / (compression_time * 1000) if compression_time > 0 else 0.0
+            )
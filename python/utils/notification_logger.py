@@ -1,4 +1,6 @@
-from typing import Optional
+import asyncio
+import threading
+from typing import List, Optional, Set, Tuple
 from datetime import datetime
 from config.settings import get_settings
 from config.logging_config import get_logger
@@ -9,11 +11,101 @@ try:
 except ImportError:
     PYMYSQL_AVAILABLE = False
 
+try:
+    from dbutils.pooled_db import PooledDB
+    DBUTILS_AVAILABLE = True
+except ImportError:
+    DBUTILS_AVAILABLE = False
+
 logger = get_logger(__name__, "stock_analysis.log")
 
+INSERT_NOTIFICATION_LOG_SQL = """
+    INSERT INTO notification_logs
+    (user_email, symbol, notification_type, message, status, sent_at, error_message)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+"""
+
+NOTIFICATION_LOG_BATCH_SIZE = 100
+NOTIFICATION_LOG_FLUSH_INTERVAL = 0.1
+
 class NotificationLogger:
+    _pool = None
+    _pool_lock = threading.Lock()
+    _background_tasks: Set[asyncio.Task] = set()
+    _queue: Optional[asyncio.Queue] = None
+    _writer_task: Optional[asyncio.Task] = None
+
     @staticmethod
+    def _connection_kwargs() -> dict:
+        settings = get_settings()
+        return {
+            'host': settings.MYSQL_HOST,
+            'user': settings.MYSQL_USER,
+            'password': settings.MYSQL_PASSWORD,
+            'database': settings.MYSQL_DATABASE,
+            'port': settings.MYSQL_PORT,
+            'charset': 'utf8mb4'
+        }
+
+    @classmethod
+    def init_pool(cls, max_connections: int = 10) -> None:
+        if not (PYMYSQL_AVAILABLE and DBUTILS_AVAILABLE):
+            return
+
+        with cls._pool_lock:
+            if cls._pool is None:
+                cls._pool = PooledDB(
+                    creator=pymysql,
+                    maxconnections=max_connections,
+                    mincached=0,
+                    blocking=True,
+                    ping=1,
+                    **cls._connection_kwargs()
+                )
+                logger.info("알림 이력 DB 커넥션 풀 생성", max_connections=max_connections)
+
+    @classmethod
+    def close_pool(cls) -> None:
+        with cls._pool_lock:
+            if cls._pool is not None:
+                cls._pool.close()
+                cls._pool = None
+
+    @classmethod
+    def _get_connection(cls):
+        if cls._pool is None:
+            cls.init_pool()
+        if cls._pool is not None:
+            return cls._pool.connection()
+        return pymysql.connect(**cls._connection_kwargs())
+
+    @staticmethod
+    def _build_row(
+        user_email: str,
+        notification_type: str,
+        message: str,
+        status: str,
+        symbol: Optional[str] = None,
+        error_message: Optional[str] = None
+    ) -> Tuple:
+        return (user_email, symbol, notification_type, message, status, datetime.now(), error_message)
+
+    @classmethod
+    def _insert_rows(cls, rows: List[Tuple]) -> None:
+        conn = cls._get_connection()
+        try:
+            with conn.cursor() as cursor:
+                if len(rows) == 1:
+                    cursor.execute(INSERT_NOTIFICATION_LOG_SQL, rows[0])
+                else:
+                    cursor.executemany(INSERT_NOTIFICATION_LOG_SQL, rows)
+            conn.commit()
+        finally:
+            conn.close()
+
+    @classmethod
     def log_notification(
+        cls,
         user_email: str,
         notification_type: str,
         message: str,
@@ -23,40 +115,89 @@ class NotificationLogger:
     ) -> bool:
         if not PYMYSQL_AVAILABLE:
             return False
-        
+
         try:
-            settings = get_settings()
-            conn = pymysql.connect(
-                host=settings.MYSQL_HOST,
-                user=settings.MYSQL_USER,
-                password=settings.MYSQL_PASSWORD,
-                database=settings.MYSQL_DATABASE,
-                port=settings.MYSQL_PORT,
-                charset='utf8mb4'
-            )
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO notification_logs 
-                (user_email, symbol, notification_type, message, status, sent_at, error_message)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """, (
-                user_email,
-                symbol,
-                notification_type,
-                message,
-                status,
-                datetime.now(),
-                error_message
-            ))
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+            cls._insert_rows([cls._build_row(user_email, notification_type, message, status, symbol, error_message)])
             logger.info(f"{notification_type} 발송 이력 저장 완료: {user_email} - {status}")
             return True
         except Exception as e:
             logger.error(f"{notification_type} 발송 이력 저장 실패: {str(e)}")
             return False
 
+    @classmethod
+    def log_notifications(cls, rows: List[Tuple]) -> bool:
+        if not PYMYSQL_AVAILABLE or not rows:
+            return False
+
+        try:
+            cls._insert_rows(rows)
+            logger.info(f"알림 발송 이력 {len(rows)}건 저장 완료")
+            return True
+        except Exception as e:
+            logger.error(f"알림 발송 이력 {len(rows)}건 저장 실패: {str(e)}")
+            return False
+
+    @classmethod
+    def start_background_writer(cls) -> None:
+        if not PYMYSQL_AVAILABLE or cls._writer_task is not None:
+            return
+        cls._queue = asyncio.Queue()
+        cls._writer_task = asyncio.create_task(cls._drain_queue(cls._queue))
+
+    @classmethod
+    async def stop_background_writer(cls) -> None:
+        task, queue = cls._writer_task, cls._queue
+        cls._writer_task = None
+        cls._queue = None
+        if task is None:
+            return
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+        pending = []
+        while not queue.empty():
+            pending.append(queue.get_nowait())
+        if pending:
+            await asyncio.to_thread(cls.log_notifications, pending)
+
+    @classmethod
+    async def _drain_queue(cls, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + NOTIFICATION_LOG_FLUSH_INTERVAL
+            try:
+                while len(batch) < NOTIFICATION_LOG_BATCH_SIZE:
+                    if not queue.empty():
+                        batch.append(queue.get_nowait())
+                        continue
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                for row in batch:
+                    queue.put_nowait(row)
+                raise
+            await asyncio.to_thread(cls.log_notifications, batch)
+
+    @classmethod
+    def log_notification_background(cls, **kwargs) -> Optional[asyncio.Task]:
+        if not PYMYSQL_AVAILABLE:
+            return None
+
+        if cls._queue is not None:
+            cls._queue.put_nowait(cls._build_row(**kwargs))
+            return None
 
+        task = asyncio.create_task(asyncio.to_thread(cls.log_notification, **kwargs))
+        cls._background_tasks.add(task)
+        task.add_done_callback(cls._background_tasks.discard)
+        return task
@@ -0,0 +1,28 @@
+import time
+from typing import Dict, Tuple
+
+from utils.redis_cache import RedisResponseCache
+
+class FixedWindowRateLimiter:
+    def __init__(self, namespace: str, limit: int, window: int):
+        self.namespace = namespace
+        self.limit = limit
+        self.window = window
+        self._local_counts: Dict[Tuple[str, int], int] = {}
+
+    def _local_incr(self, client_id: str, bucket: int) -> int:
+        key = (client_id, bucket)
+        count = self._local_counts.get(key, 0) + 1
+        if count == 1:
+            stale = [entry for entry in self._local_counts if entry[1] < bucket]
+            for entry in stale:
+                del self._local_counts[entry]
+        self._local_counts[key] = count
+        return count
+
+    async def allow(self, cache: RedisResponseCache, client_id: str) -> bool:
+        bucket = int(time.time()) // self.window
+        count = await cache.incr(f"ratelimit:{self.namespace}:{client_id}:{bucket}", self.window)
+        if count is None:
+            count = self._local_incr(client_id, bucket)
+        return count <= self.limit
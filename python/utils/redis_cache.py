@@ -0,0 +1,81 @@
+import hashlib
+from typing import Any, Optional
+
+from config.logging_config import get_logger
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+REDIS_CACHE_SOCKET_TIMEOUT = 2
+
+def make_cache_key(namespace: str, *parts: Any) -> str:
+    raw = ':'.join(str(part) for part in parts).encode('utf-8')
+    return f"{namespace}:{hashlib.blake2b(raw, digest_size=16).hexdigest()}"
+
+class RedisResponseCache:
+    def __init__(self, client=None):
+        self.client = client
+
+    @classmethod
+    async def connect(cls, host: str, port: int, db: int) -> 'RedisResponseCache':
+        if not REDIS_AVAILABLE:
+            logger.info("redis 모듈이 설치되지 않아 응답 캐시를 비활성화합니다", component="RedisResponseCache")
+            return cls()
+
+        client = aioredis.Redis(
+            host=host,
+            port=port,
+            db=db,
+            socket_connect_timeout=REDIS_CACHE_SOCKET_TIMEOUT,
+            socket_timeout=REDIS_CACHE_SOCKET_TIMEOUT
+        )
+        try:
+            await client.ping()
+        except Exception as e:
+            logger.warning("Redis 응답 캐시 연결 실패: 캐시 없이 동작합니다", exception=e, component="RedisResponseCache")
+            await client.close()
+            return cls()
+        return cls(client)
+
+    @property
+    def enabled(self) -> bool:
+        return self.client is not None
+
+    async def get(self, key: str) -> Optional[bytes]:
+        if self.client is None:
+            return None
+        try:
+            return await self.client.get(key)
+        except Exception as e:
+            logger.warning("Redis 응답 캐시 조회 실패", cache_key=key, exception=e, component="RedisResponseCache")
+            return None
+
+    async def set(self, key: str, payload: bytes, ttl: int) -> None:
+        if self.client is None:
+            return
+        try:
+            await self.client.set(key, payload, ex=ttl)
+        except Exception as e:
+            logger.warning("Redis 응답 캐시 저장 실패", cache_key=key, exception=e, component="RedisResponseCache")
+
+    async def incr(self, key: str, ttl: int) -> Optional[int]:
+        if self.client is None:
+            return None
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                count, _ = await pipe.incr(key).expire(key, ttl).execute()
+            return count
+        except Exception as e:
+            logger.warning("Redis 카운터 증가 실패", cache_key=key, exception=e, component="RedisResponseCache")
+            return None
+
+    async def close(self) -> None:
+        client = self.client
+        self.client = None
+        if client is not None:
+            await client.close()
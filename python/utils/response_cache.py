@@ -0,0 +1,147 @@
+import asyncio
+import inspect
+import time
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from fastapi import BackgroundTasks
+from fastapi.encoders import jsonable_encoder
+from starlette.requests import HTTPConnection, Request
+from starlette.responses import Response
+
+from api_common import encode_json
+from config.logging_config import get_logger
+from utils.single_flight import SingleFlight
+
+logger = get_logger(__name__)
+
+RESPONSE_CACHE_MAX_SIZE = 1024
+RESPONSE_CACHE_MAX_STALE = 60.0
+RESPONSE_CACHE_PRUNE_INTERVAL = 60.0
+CACHE_REQUEST_PARAM = 'cache_request'
+JSON_MEDIA_TYPE = 'application/json'
+REQUEST_SCOPED_TYPES = (HTTPConnection, Response, BackgroundTasks)
+
+CachedBody = Tuple[int, str, bytes]
+
+class ResponseCache:
+    def __init__(self, maxsize: Optional[int] = None, max_stale: float = 0.0):
+        self.maxsize = maxsize
+        self.max_stale = max_stale
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        self._next_prune = 0.0
+        self._refreshing: Set[Tuple] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Optional[Tuple[float, Any]]:
+        return self._entries.get(key)
+
+    def get_fresh(self, key: Tuple) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def set(self, key: Tuple, payload: Any, ttl: float) -> None:
+        now = time.monotonic()
+        self._entries.pop(key, None)
+        self._entries[key] = (now + ttl, payload)
+        if now >= self._next_prune or (self.maxsize is not None and len(self._entries) > self.maxsize):
+            self.prune_expired(now)
+        if self.maxsize is not None:
+            while len(self._entries) > self.maxsize:
+                del self._entries[next(iter(self._entries))]
+
+    def prune_expired(self, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        cutoff = now - self.max_stale
+        expired = [key for key, (expiry, _) in self._entries.items() if expiry < cutoff]
+        for key in expired:
+            del self._entries[key]
+        self._next_prune = now + RESPONSE_CACHE_PRUNE_INTERVAL
+
+    def invalidate(self, key: Tuple) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def schedule_refresh(self, key: Tuple, loader: Callable[[], Awaitable[Any]], ttl: float) -> None:
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._refresh(key, loader, ttl))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, key: Tuple, loader: Callable[[], Awaitable[Any]], ttl: float) -> None:
+        try:
+            self.set(key, await loader(), ttl)
+        except Exception as e:
+            logger.warning("응답 캐시 백그라운드 갱신 실패", cache_key=str(key), exception=e)
+        finally:
+            self._refreshing.discard(key)
+
+response_cache = ResponseCache(maxsize=RESPONSE_CACHE_MAX_SIZE, max_stale=RESPONSE_CACHE_MAX_STALE)
+response_flights = SingleFlight()
+
+def encode_cached_body(payload: Any) -> CachedBody:
+    if isinstance(payload, Response):
+        return payload.status_code, payload.media_type or JSON_MEDIA_TYPE, bytes(payload.body)
+    return 200, JSON_MEDIA_TYPE, encode_json(jsonable_encoder(payload))
+
+def cached_response(body: CachedBody) -> Response:
+    status_code, media_type, content = body
+    return Response(content=content, status_code=status_code, media_type=media_type)
+
+async def _load_response(key: Tuple, loader: Callable[[], Awaitable[CachedBody]], ttl: float) -> CachedBody:
+    body = await loader()
+    response_cache.set(key, body, ttl)
+    return body
+
+def cached_endpoint(ttl: float, swr: float = 0.0, key_params: Iterable[str] = ()):
+    key_params = tuple(key_params)
+
+    def decorator(func):
+        async def load(loader_kwargs: Dict[str, Any]) -> CachedBody:
+            return encode_cached_body(await func(**loader_kwargs))
+
+        @wraps(func)
+        async def wrapper(**kwargs):
+            request: Optional[Request] = kwargs.pop(CACHE_REQUEST_PARAM, None)
+            route = request.url.path if request is not None else func.__qualname__
+            key = (route,) + tuple((name, kwargs.get(name)) for name in key_params)
+            loader_kwargs = {
+                name: value for name, value in kwargs.items()
+                if not isinstance(value, REQUEST_SCOPED_TYPES)
+            }
+            loader = lambda: load(loader_kwargs)
+            entry = response_cache.get(key)
+
+            if entry is not None:
+                expiry, body = entry
+                now = time.monotonic()
+                if now < expiry:
+                    return cached_response(body)
+                if now < expiry + swr:
+                    response_cache.schedule_refresh(key, loader, ttl)
+                    return cached_response(body)
+
+            return cached_response(await response_flights.do(key, _load_response, key, loader, ttl))
+
+        signature = inspect.signature(func)
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter(CACHE_REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request)
+        ])
+        return wrapper
+    return decorator